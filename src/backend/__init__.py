@@ -1,10 +1,33 @@
-from .algorithms import *
-from .encryption import *
-from .models import *
-from .backend_manager import BackendManager
-from .db.database_manager import DatabaseManager
-from .seeder import Seeder
-from .common import Settings
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that importing
+# `backend` does not pull in pymysql, pdfminer or every algorithm up front.
+_LAZY_ATTRS = {
+    'BackendManager': '.backend_manager',
+    'DatabaseManager': '.db.database_manager',
+    'Seeder': '.seeder',
+    'Settings': '.common.settings',
+    'KMP': '.algorithms',
+    'BoyerMoore': '.algorithms',
+    'AhoCorasick': '.algorithms',
+    'Levenshtein': '.algorithms',
+    'VigenereCipher': '.encryption',
+    'ApplicantProfile': '.models',
+    'ApplicationDetail': '.models',
+}
 
 __all__ = ['BackendManager', 'Seeder', 'DatabaseManager',
            'Settings']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
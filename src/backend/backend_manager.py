@@ -1,11 +1,17 @@
-
+import asyncio
 import os
 import re
+import threading
+from array import array
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from backend.db import DatabaseManager
+from backend.models import CVSummary
 from backend.preprocessor import CVProcessor, RegexExtractor
-from backend.utils.utils import Utils
 from backend.seeder import Seeder
-from backend.services import SearchService
+from backend.services import (BM25Scorer, CorpusVersionedCache, CVCorpus, DocBitmap, InvertedIndex,
+                              QueryEvaluator, SearchService, SearchStream, parse_query)
+from backend.common import Settings
+from backend.telemetry import SearchProfiler, SlowQueryLog, export_to_file, telemetry
 
 
 class BackendManager:
@@ -15,32 +21,70 @@ class BackendManager:
     and regex extraction.
     """
 
+    # Metadata predicates accepted by search_cvs(filters=...); all given ones must hold
+    PROFILE_FILTER_KEYS = ('skills', 'companies', 'titles', 'degree_levels', 'min_years', 'max_years')
+    SEARCH_FILTER_KEYS = ('roles',) + PROFILE_FILTER_KEYS
+
     def __init__(self, db_host='localhost', db_user='root', db_password='', db_name='ats_db'):
         self.db_manager = DatabaseManager(
             host=db_host, user=db_user, password=db_password, db=db_name)
         self.cv_processor = CVProcessor()
         self.search_service = SearchService()
         self.regex_extractor = RegexExtractor()
-        self.in_memory_cv_texts = {}
+        self.cv_corpus = CVCorpus()
         self.applicant_profiles_cache = {}
+        self.application_details_by_path = {}
+        # detail_id -> CVSummary, computed by the extraction workers during load
+        self.cv_summaries = {}
+        self.query_cache = CorpusVersionedCache(max_entries=Settings.QUERY_CACHE_SIZE)
+        # (keyword, algorithm) -> array of per-CV occurrence counts in corpus order
+        self.keyword_count_cache = CorpusVersionedCache(max_entries=Settings.KEYWORD_CACHE_SIZE)
+        self.slow_query_log = SlowQueryLog(
+            os.environ.get("VITAELANGX_SLOW_QUERY_LOG", Settings.SLOW_QUERY_LOG_PATH),
+            Settings.SLOW_QUERY_THRESHOLD_MS,
+            max_bytes=Settings.SLOW_QUERY_LOG_MAX_BYTES,
+            backup_count=Settings.SLOW_QUERY_LOG_BACKUPS)
+        # (corpus_version, {'roles': {role: DocBitmap}, 'detail_doc_ids': {detail_id: doc_id}})
+        self._metadata_index = None
+        # Bumped whenever the profile tables are rewritten; part of the cache key of every
+        # search that can read them, since their contents do not change corpus_version
+        self.profile_generation = 0
+        # (corpus_version, InvertedIndex) for boolean queries and narrowing exact scans
+        self._inverted_index = None
+        self._inverted_index_lock = threading.Lock()
+        self._search_executor = None
+        self._init_thread = None
+
+    @property
+    def in_memory_cv_texts(self) -> dict[str, str]:
+        """Snapshot of the CV texts loaded so far, keyed by cv_path."""
+        return self.cv_corpus.as_dict()
+
+    @in_memory_cv_texts.setter
+    def in_memory_cv_texts(self, texts: dict[str, str]):
+        self.cv_corpus.replace_all(texts)
 
     def initialize_backend(self, data_directory: str = '../data/'):
         """
         Initializes the application backend.
         Ensures DB connection, table creation, and seeds data via Seeder if necessary.
+        Progress is reported through cv_corpus.phase (see get_loading_status).
         """
         print("BackendManager: Initializing backend...")
 
+        self.cv_corpus.set_phase(CVCorpus.PHASE_CONNECTING)
         self.db_manager.connect()
         if not self.db_manager.connection:
             print(
                 "BackendManager: CRITICAL - DB connection failed. Further initialization stopped.")
+            self.cv_corpus.set_phase(CVCorpus.PHASE_FAILED)
             return
 
         self.db_manager.create_tables()
 
         if not self.db_manager.get_all_application_details():
             print("BackendManager: No application details found. Initiating database preparation and seeding process via Seeder...")
+            self.cv_corpus.set_phase(CVCorpus.PHASE_SEEDING)
             seeder_instance = Seeder(self.db_manager)
             success = seeder_instance.prepare_database_and_seed(
                 data_directory=data_directory)
@@ -57,240 +101,1150 @@ class BackendManager:
         self.load_cv_data_to_memory()
         print("BackendManager: Backend initialization complete.")
 
+    def start_background_initialization(self, data_directory: str = '../data/') -> threading.Thread:
+        """
+        Runs initialize_backend on a daemon thread so the UI can appear immediately.
+        Searches issued meanwhile run against the CVs loaded so far.
+        """
+        if self._init_thread is not None and self._init_thread.is_alive():
+            return self._init_thread
+
+        def run():
+            try:
+                self.initialize_backend(data_directory=data_directory)
+            except Exception as e:
+                print(f"BackendManager: Background initialization failed: {e}")
+                self.cv_corpus.set_phase(CVCorpus.PHASE_FAILED)
+
+        self.cv_corpus.set_phase(CVCorpus.PHASE_CONNECTING)
+        self._init_thread = threading.Thread(
+            target=run, name="backend-init", daemon=True)
+        self._init_thread.start()
+        return self._init_thread
+
+    def get_loading_status(self) -> dict:
+        """Returns the current startup phase and how many CVs are searchable."""
+        return {
+            "phase": self.cv_corpus.phase,
+            "loaded": len(self.cv_corpus),
+            "total": self.cv_corpus.expected_total,
+        }
+
     def load_cv_data_to_memory(self):
         """
         Loads all relevant CV texts into memory for efficient searching.
         This should happen once on application startup or when new CVs are added.
+        Texts become searchable one by one as the extraction workers finish them.
         """
         application_details = self.db_manager.get_all_application_details()
+        self.application_details_by_path = {
+            detail.cv_path: detail for detail in application_details if detail.cv_path}
+        self.applicant_profiles_cache = {}
+        self.cv_summaries = {}
         cv_paths = [
             detail.cv_path for detail in application_details if detail.cv_path]
         print(f"Loading {len(cv_paths)} CVs into memory...")
-        self.in_memory_cv_texts = self.cv_processor.process_cv_for_pattern_matching(
-            cv_paths)
+        self.cv_corpus.reset(expected_total=len(cv_paths))
+        self.cv_corpus.set_phase(CVCorpus.PHASE_LOADING)
+        with telemetry.span("corpus.load", cvs=len(cv_paths)):
+            self.cv_processor.process_cv_for_pattern_matching(
+                cv_paths, result_callback=self.cv_corpus.add,
+                summary_callback=self._store_cv_summary)
+        self._get_inverted_index(*self.cv_corpus.versioned_items())
+        # Profile filters read these tables, so they are written before the corpus is ready
+        self._persist_cv_summaries()
+        self.cv_corpus.set_phase(CVCorpus.PHASE_READY)
+
+    def _store_cv_summary(self, cv_path: str, extracted_info: dict):
+        detail = self.application_details_by_path.get(cv_path)
+        if detail is not None:
+            self.cv_summaries[detail.detail_id] = CVSummary.from_extracted_info(
+                detail.detail_id, extracted_info)
 
-    def search_cvs(self, keywords: list[str], algorithm: str, top_n_matches: int = 10, fuzzy_threshold: float = 80) -> dict:
+    def _persist_cv_summaries(self, summaries: list[CVSummary] = None, replace_all: bool = True):
         """
-        Performs CV search based on keywords using the specified algorithm via SearchService.
-        Returns structured results including exact and fuzzy matches.
+        Writes the summaries computed during load so they survive a restart, together
+        with their normalized CVSkill/CVJob/CVEducation rows, in one transaction.
+        replace_all drops the summaries and profile rows of CVs that are no longer part
+        of the corpus.
         """
-        results = []
-        total_exact_match_time_ms = 0
-        total_fuzzy_match_time_ms = 0
+        if summaries is None:
+            summaries = list(self.cv_summaries.values())
+        if not summaries:
+            return
+        with telemetry.span("corpus.persist_profiles", cvs=len(summaries)):
+            saved = self.db_manager.save_cv_profiles(summaries, replace_all=replace_all)
+        if saved:
+            self.profile_generation += 1
+            print(f"Stored summaries and structured profiles of {len(summaries)} CVs.")
 
-        keywords_lower = [k.lower() for k in keywords]
-        exact_matches = {}
+    def rebuild_cv_profiles(self, only_missing: bool = False, max_workers: int = None) -> int:
+        """
+        Re-runs the regex extractors over every loaded CV on a process pool and rewrites
+        CVSummary, CVSkill, CVJob and CVEducation. Texts come from the in-memory corpus,
+        so no PDF is parsed again. With only_missing, just the CVs without a summary
+        (e.g. whose extraction failed during load) are processed.
+        Returns the number of CVs summarized.
+        """
+        cv_texts = {}
+        for cv_path, text in self.cv_corpus.items():
+            detail = self.application_details_by_path.get(cv_path)
+            if detail is not None and not (only_missing and detail.detail_id in self.cv_summaries):
+                cv_texts[cv_path] = text
+        with telemetry.span("corpus.extract_profiles", cvs=len(cv_texts)):
+            extracted = self.cv_processor.extract_summaries(
+                cv_texts, max_workers=max_workers, summary_callback=self._store_cv_summary)
+        summaries = [self.cv_summaries[self.application_details_by_path[cv_path].detail_id]
+                     for cv_path in extracted]
+        self._persist_cv_summaries(summaries, replace_all=not only_missing)
+        return len(summaries)
+
+    def _find_detail_ids_by_profile(self, skills=None, companies=None, titles=None, degree_levels=None,
+                                    min_years: float = None, max_years: float = None) -> set[int]:
+        return self.db_manager.find_detail_ids_by_profile(
+            skills=skills, companies=companies, titles=titles, degree_levels=degree_levels,
+            min_experience_months=None if min_years is None else round(min_years * 12),
+            max_experience_months=None if max_years is None else round(max_years * 12))
+
+    def find_cvs_by_profile(self, skills: list[str] = None, companies: list[str] = None,
+                            titles: list[str] = None, degree_levels: list[str] = None,
+                            min_years: float = None, max_years: float = None) -> list[str]:
+        """
+        Returns the cv_paths of loaded CVs whose extracted profile has every given skill,
+        a job at one of companies / with one of titles, a degree in degree_levels
+        (see CVEducation.DEGREE_LEVELS) and between min_years and max_years of total
+        experience. Resolved with indexed queries on the profile tables.
+        """
+        detail_ids = self._find_detail_ids_by_profile(
+            skills, companies, titles, degree_levels, min_years, max_years)
+        if not detail_ids:
+            return []
+        return [cv_path for cv_path, detail in self.application_details_by_path.items()
+                if detail.detail_id in detail_ids]
+
+    def _wait_for_first_cvs(self, cancel_event: threading.Event | None):
+        """
+        Blocks a search issued before any CV is loaded until loading finishes,
+        so the very first search does not return an empty result.
+        """
+        while self.cv_corpus.is_loading and len(self.cv_corpus) == 0:
+            self._check_cancelled(cancel_event)
+            self.cv_corpus.ready_event.wait(0.1)
+
+    @staticmethod
+    def _check_cancelled(cancel_event: threading.Event | None):
+        """Raises CancelledError when the caller has requested cancellation."""
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError()
+
+    @staticmethod
+    def _normalize_keywords(keywords: list[str]) -> list[str]:
+        """Strips keywords and drops empties and case-insensitive duplicates, keeping input order."""
+        normalized = []
+        seen = set()
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if keyword and keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                normalized.append(keyword)
+        return normalized
+
+    @staticmethod
+    def _canonical_algorithm(algorithm: str) -> str:
+        algorithm = algorithm.lower()
+        return algorithm if algorithm in ('kmp', 'boyer-moore', 'aho-corasick') else 'kmp'
+
+    @classmethod
+    def _normalize_filters(cls, filters: dict | None) -> dict:
+        """
+        Validates search filters and puts them in canonical form: list-valued filters
+        (a single string is accepted too) become sorted lowercase tuples, year bounds floats.
+        Empty filters are dropped. Raises ValueError on an unknown filter.
+        """
+        if not filters:
+            return {}
+        unknown = set(filters) - set(cls.SEARCH_FILTER_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown search filters: {sorted(unknown)}")
+        normalized = {}
+        for key, value in filters.items():
+            if value is None or value == '':
+                continue
+            if key in ('min_years', 'max_years'):
+                normalized[key] = float(value)
+                continue
+            values = [value] if isinstance(value, str) else value
+            values = tuple(sorted({v.strip().lower() for v in values if v and v.strip()}))
+            if values:
+                normalized[key] = values
+        return normalized
+
+    def _get_metadata_index(self, corpus_version: int, cv_items: list[tuple[str, str]]) -> dict:
+        """
+        Maps application roles to DocBitmaps and detail_ids to doc ids (positions in the
+        corpus snapshot), built once per corpus version so resolving a filter costs the
+        size of its result.
+        """
+        metadata_index = self._metadata_index
+        if metadata_index is not None and metadata_index[0] == corpus_version:
+            return metadata_index[1]
+        role_doc_ids = {}
+        detail_doc_ids = {}
+        with telemetry.span("search.metadata_index", cvs=len(cv_items)):
+            for doc_id, (cv_path, _) in enumerate(cv_items):
+                detail = self.application_details_by_path.get(cv_path)
+                if detail is None:
+                    continue
+                detail_doc_ids[detail.detail_id] = doc_id
+                role = (detail.application_role or '').strip().lower()
+                role_doc_ids.setdefault(role, array('I')).append(doc_id)
+        index = {
+            'roles': {role: DocBitmap.from_sorted(doc_ids) for role, doc_ids in role_doc_ids.items()},
+            'detail_doc_ids': detail_doc_ids,
+        }
+        self._metadata_index = (corpus_version, index)
+        return index
+
+    def _resolve_candidates(self, filters: dict, corpus_version: int,
+                            cv_items: list[tuple[str, str]]) -> DocBitmap | None:
+        """
+        Resolves normalized filters to the DocBitmap of CVs to scan, or None when there
+        are no filters. Roles are looked up in the in-memory role index (any of the given
+        roles matches); profile predicates go through the indexed profile tables.
+        """
+        if not filters:
+            return None
+        index = self._get_metadata_index(corpus_version, cv_items)
+        candidates = None
+        if 'roles' in filters:
+            candidates = DocBitmap.union_all(index['roles'].get(role, DocBitmap()) for role in filters['roles'])
+        profile_criteria = {key: filters[key] for key in self.PROFILE_FILTER_KEYS if key in filters}
+        if profile_criteria and (candidates is None or candidates):
+            detail_ids = self._find_detail_ids_by_profile(**profile_criteria) or set()
+            detail_doc_ids = index['detail_doc_ids']
+            profile_docs = DocBitmap.from_iterable(
+                detail_doc_ids[detail_id] for detail_id in detail_ids if detail_id in detail_doc_ids)
+            candidates = profile_docs if candidates is None else candidates & profile_docs
+        return candidates
+
+    def _index_covers(self, inverted_index: tuple | None, corpus_version: int) -> bool:
+        """
+        Whether an (index_version, InvertedIndex) pair holds the snapshot of corpus_version
+        as its first documents: it was brought up to date at or after that version and
+        the corpus has only been appended to since before it.
+        """
+        return (inverted_index is not None and inverted_index[0] >= corpus_version
+                and self.cv_corpus.base_version <= corpus_version)
+
+    def _get_inverted_index(self, corpus_version: int, cv_items: list[tuple[str, str]]) -> InvertedIndex:
+        """
+        Posting lists covering the corpus snapshot, kept current incrementally: CVs added
+        since the index was last brought up to date are appended to it, so a query issued
+        while CVs are still loading only tokenizes the new ones, and the call at the end of
+        load_cv_data_to_memory just catches up. The index is rebuilt only after the corpus
+        was reset or a loaded CV replaced (see CVCorpus.base_version). It may already hold
+        CVs added after the snapshot; callers ignore doc ids from len(cv_items) on.
+        """
+        inverted_index = self._inverted_index
+        if self._index_covers(inverted_index, corpus_version):
+            return inverted_index[1]
+        with self._inverted_index_lock:
+            inverted_index = self._inverted_index
+            if self._index_covers(inverted_index, corpus_version):
+                return inverted_index[1]
+            base_version = self.cv_corpus.base_version
+            if base_version > corpus_version:
+                # The snapshot predates a reset; index it without replacing the shared index
+                return InvertedIndex(cv_items)
+            if inverted_index is not None and inverted_index[0] >= base_version:
+                index = inverted_index[1]
+                with telemetry.span("search.inverted_index.extend", cvs=len(cv_items) - index.doc_count):
+                    index.extend(cv_items[index.doc_count:])
+            else:
+                with telemetry.span("search.inverted_index", cvs=len(cv_items)):
+                    index = InvertedIndex(cv_items)
+            self._inverted_index = (corpus_version, index)
+        return index
+
+    def _query_cache_key(self, keywords: list[str], algorithm: str, fuzzy_threshold: float,
+                         filters: dict | None = None) -> tuple:
+        """
+        Cache key for a search: order- and case-insensitive keyword set, algorithm,
+        threshold and normalized filters. Filtered searches also carry the profile
+        generation, so a profile rebuild invalidates them.
+        """
+        key = (tuple(sorted(k.lower() for k in keywords)),
+               self._canonical_algorithm(algorithm), fuzzy_threshold)
+        if filters:
+            key += (tuple(sorted(filters.items())), self.profile_generation)
+        return key
 
+    def _resolve_exact_search(self, algorithm: str):
+        """
+        Maps a user-facing algorithm name to its SearchService function.
+        Returns (search_function, display_name, is_multi_pattern).
+        """
         if algorithm.lower() == 'aho-corasick':
-            print(
-                f"Starting exact matching with Aho-Corasick for keywords: {keywords_lower}")
-            for cv_path, text in self.in_memory_cv_texts.items():
-
-                ac_results_for_cv, time_taken = Utils.time_function(
-                    self.search_service.search_aho_corasick,
-                    text.lower(),
-                    keywords_lower
-                )
-                total_exact_match_time_ms += time_taken
-                current_cv_matched_keywords = {}
-                current_total_occurrences = 0
+            return self.search_service.search_aho_corasick, "Aho-Corasick", True
+        if algorithm.lower() == 'kmp':
+            return self.search_service.search_kmp, "KMP", False
+        if algorithm.lower() == 'boyer-moore':
+            return self.search_service.search_boyer_moore, "Boyer-Moore", False
+        print(
+            f"Warning: Unknown exact match algorithm '{algorithm}'. Defaulting to KMP.")
+        return self.search_service.search_kmp, "KMP (defaulted)", False
+
+    def _scan_exact(self, cv_items: list[tuple[str, str]], start_index: int, keywords_lower: list[str], search_func,
+                    is_multi_pattern: bool, count_vectors: dict, cancel_event: threading.Event | None,
+                    keyword_docs: dict | None = None, scan_docs: set | None = None, doc_ids=None) -> int:
+        """
+        Counts exact occurrences of keywords_lower in cv_items, writing each count to
+        count_vectors[keyword][start_index + position].
+        keyword_docs optionally maps keywords to the doc ids that can contain them (see
+        _exact_scan_candidates) and scan_docs to their union for the multi-pattern pass;
+        a CV outside them keeps its zero count without being read. doc_ids maps positions
+        to doc ids when cv_items is a filtered subset. Returns the number of CVs read.
+        """
+        scanned = 0
+        for position, (_, text) in enumerate(cv_items, start_index):
+            self._check_cancelled(cancel_event)
+            doc_id = position if doc_ids is None else doc_ids[position]
+
+            if is_multi_pattern:
+                if scan_docs is not None and doc_id not in scan_docs:
+                    continue
+                scanned += 1
+                ac_results_for_cv = search_func(text.lower(), keywords_lower)
                 if ac_results_for_cv:
                     for keyword_found, occurrences in ac_results_for_cv.items():
-                        if occurrences:
-                            current_cv_matched_keywords[keyword_found] = len(
-                                occurrences)
-                            current_total_occurrences += len(occurrences)
-
-                if current_total_occurrences > 0:
-                    exact_matches[cv_path] = {
-                        'matched_keywords': current_cv_matched_keywords,
-                        'total_occurrences': current_total_occurrences
-                    }
-        else:
-            exact_search_func = None
-            algo_name_for_print = ""
-            if algorithm.lower() == 'kmp':
-                algo_name_for_print = "KMP"
-                exact_search_func = self.search_service.search_kmp
-            elif algorithm.lower() == 'boyer-moore':
-                algo_name_for_print = "Boyer-Moore"
-                exact_search_func = self.search_service.search_boyer_moore
+                        count_vectors[keyword_found][position] = len(occurrences)
             else:
-                print(
-                    f"Warning: Unknown exact match algorithm '{algorithm}'. Defaulting to KMP.")
-                algo_name_for_print = "KMP (defaulted)"
-                exact_search_func = self.search_service.search_kmp
+                text_lower = None
+                for keyword in keywords_lower:
+                    candidates = keyword_docs.get(keyword) if keyword_docs else None
+                    if candidates is not None and doc_id not in candidates:
+                        continue
+                    if text_lower is None:
+                        scanned += 1
+                        text_lower = text.lower()
+                    occurrences = search_func(text_lower, keyword)
+                    count_vectors[keyword][position] = len(occurrences)
+        return scanned
 
-            print(
-                f"Starting exact matching with {algo_name_for_print} for keywords: {keywords_lower}")
+    def _exact_scan_candidates(self, corpus_version: int, keywords_lower: list[str]) -> dict[str, set] | None:
+        """
+        For each keyword, the doc ids whose text can contain it according to the positional
+        index (InvertedIndex.substring_candidates), so the exact matchers only verify those
+        CVs. Keywords the index cannot narrow down are left out. Returns None if the index
+        does not cover this corpus version.
+        """
+        inverted_index = self._inverted_index
+        if not self._index_covers(inverted_index, corpus_version):
+            return None
+        keyword_docs = {}
+        for keyword in keywords_lower:
+            candidates = inverted_index[1].substring_candidates(keyword)
+            if candidates is not None:
+                keyword_docs[keyword] = set(candidates.to_array())
+        return keyword_docs
 
-            for cv_path, text in self.in_memory_cv_texts.items():
-                current_cv_matched_keywords = {}
-                current_total_occurrences = 0
-                current_cv_loop_time = 0
+    def _collect_exact_matches(self, cv_items: list[tuple[str, str]], start_index: int, keywords_lower: list[str],
+                               count_vectors: dict, exact_matches: dict, progress):
+        """Combines the per-keyword count vectors into exact_matches entries for cv_items."""
+        vectors = [(keyword, count_vectors[keyword]) for keyword in keywords_lower]
+        for position, (cv_path, _) in enumerate(cv_items, start_index):
+            current_cv_matched_keywords = {}
+            current_total_occurrences = 0
+            for keyword, counts in vectors:
+                count = counts[position]
+                if count:
+                    current_cv_matched_keywords[keyword] = count
+                    current_total_occurrences += count
 
-                for keyword in keywords_lower:
-                    occurrences, time_taken = Utils.time_function(
-                        exact_search_func, text.lower(), keyword)
-                    current_cv_loop_time += time_taken
-                    if occurrences:
-                        current_cv_matched_keywords[keyword] = len(occurrences)
-                        current_total_occurrences += len(occurrences)
-
-                if current_total_occurrences > 0:
-                    exact_matches[cv_path] = {
-                        'matched_keywords': current_cv_matched_keywords,
-                        'total_occurrences': current_total_occurrences
-                    }
-                total_exact_match_time_ms += current_cv_loop_time
-
-        sorted_exact_matches = sorted(exact_matches.items(),
-                                      key=lambda item: item[1]['total_occurrences'], reverse=True)
-
-        unmatched_keywords = []
-        for keyword in keywords:
+            if current_total_occurrences > 0:
+                exact_matches[cv_path] = {
+                    'matched_keywords': current_cv_matched_keywords,
+                    'total_occurrences': current_total_occurrences
+                }
+            progress('exact')
+
+    def _scan_fuzzy(self, cv_items: list[tuple[str, str]], unmatched_keywords: list[str], fuzzy_threshold: float,
+                    fuzzy_matches: dict, progress, cancel_event: threading.Event | None):
+        """
+        Runs Levenshtein matching of unmatched_keywords against every word of cv_items,
+        adding hits to fuzzy_matches in place.
+        """
+        for cv_path, text in cv_items:
+            self._check_cancelled(cancel_event)
+            cv_fuzzy_keywords = {}
+            similarity_counter = 0
+            highest_cv_similarity = 0.0
+
+            cv_words = re.findall(r'\b\w+\b', text.lower())
 
-            keyword_l = keyword.lower()
-            found_in_exact = False
-            for _, details in sorted_exact_matches:
-                if keyword_l in details['matched_keywords']:
-                    found_in_exact = True
-                    break
-            if not found_in_exact:
-                unmatched_keywords.append(keyword)
+            for um_keyword in unmatched_keywords:
+                counter = 0
+                best_similarity_for_keyword = 0.0
+                for cv_word in cv_words:
 
-        fuzzy_matches = {}
+                    similarity_score = self.search_service.get_similarity_percentage(
+                        um_keyword.lower(), cv_word)
+
+                    if similarity_score >= fuzzy_threshold:
+                        similarity_counter += 1
+                        counter += 1
+
+                    if similarity_score >= fuzzy_threshold and similarity_score > best_similarity_for_keyword:
+                        best_similarity_for_keyword = similarity_score
+
+                if best_similarity_for_keyword > 0:
+                    cv_fuzzy_keywords[um_keyword] = (best_similarity_for_keyword, counter)
+                    if best_similarity_for_keyword > highest_cv_similarity:
+                        highest_cv_similarity = best_similarity_for_keyword
+
+            if highest_cv_similarity > 0:
+                fuzzy_matches[cv_path] = {
+                    'fuzzy_matched_keywords': cv_fuzzy_keywords,
+                    'highest_similarity': highest_cv_similarity,
+                    'total_occurrences': similarity_counter
+                }
+            progress('fuzzy')
+
+    def _find_unmatched_keywords(self, keywords: list[str], exact_matches: dict) -> list[str]:
+        """Returns the keywords that had no exact hit in any CV."""
+        found_keywords = set()
+        for details in exact_matches.values():
+            found_keywords.update(details['matched_keywords'])
+        return [keyword for keyword in keywords if keyword.lower() not in found_keywords]
+
+    def _run_search_stages(self, keywords: list[str], algorithm: str, fuzzy_threshold: float, shard_size: int | None,
+                           progress_callback, cancel_event: threading.Event | None,
+                           precomputed_counts: tuple[int, dict] | None = None, filters: dict | None = None):
+        """
+        Generator driving the exact and fuzzy stages shard by shard.
+        Yields the shared search state after every shard; state['done'] is True on the last one.
+        precomputed_counts, a (corpus_version, {keyword: count vector}) pair from a shared
+        batch scan, is used in preference to the keyword cache when the version matches.
+        With normalized filters only the candidate CVs they resolve to are scanned.
+        """
+        self._wait_for_first_cvs(cancel_event)
+        corpus_version, cv_items = self.cv_corpus.versioned_items()
+
+        cache_key = self._query_cache_key(keywords, algorithm, fuzzy_threshold, filters)
+        cached_state = self.query_cache.get(cache_key, corpus_version)
+        if cached_state is not None:
+            print(f"Query cache hit for keywords: {list(cache_key[0])}")
+            telemetry.increment("search.query_cache_hits")
+            yield dict(cached_state, cached=True)
+            return
+
+        # Brought up to date once per search: document lengths for ranking, and pruning
+        # of the exact scan; only CVs added since the last search are tokenized
+        index = self._get_inverted_index(corpus_version, cv_items)
+        with telemetry.span("search.filter") as filter_span:
+            candidates = self._resolve_candidates(filters, corpus_version, cv_items)
+            candidate_positions = None if candidates is None else candidates.to_array()
+        # BM25 statistics cover the CVs searched, like the document frequencies counted
+        # from their matches
+        average_length = self._average_length(
+            index, range(len(cv_items)) if candidate_positions is None else candidate_positions)
+        if candidate_positions is not None:
+            print(f"Filters {filters} matched {len(candidate_positions)} of {len(cv_items)} CVs")
+            cv_items = [cv_items[position] for position in candidate_positions]
+        total_cvs = len(cv_items)
+        if not shard_size or shard_size <= 0:
+            shard_size = max(1, total_cvs)
+
+        keywords_lower = [k.lower() for k in keywords]
+        state = {
+            'stage': 'exact',
+            'processed': 0,
+            'total': total_cvs,
+            'done': False,
+            'exact_matches': {},
+            'fuzzy_matches': {},
+            'unmatched_keywords': [],
+            'exact_match_time_ms': 0,
+            'fuzzy_match_time_ms': 0,
+            'ranked': None,
+            'cached': False,
+            # Wall-clock time per stage, including the bookkeeping around the matchers
+            'stage_times_ms': {'exact': 0.0, 'unmatched': 0.0, 'fuzzy': 0.0, 'rank': 0.0},
+            'filtered': candidate_positions is not None,
+            # Only until ranked; cached states do not keep the index alive
+            'index': index,
+            'average_length': average_length,
+        }
+        stage_times = state['stage_times_ms']
+        if candidate_positions is not None:
+            stage_times['filter'] = filter_span.elapsed_ms
+
+        def finish():
+            # Completed searches are ranked once and kept for repeats and other top-N values
+            with telemetry.span("search.rank") as span:
+                state['ranked'] = self._rank_matches(
+                    state['exact_matches'], state['fuzzy_matches'], total_cvs, state.pop('index'),
+                    average_length)
+            stage_times['rank'] += span.elapsed_ms
+            self.query_cache.put(cache_key, corpus_version, state)
+
+        stage_counts = {'exact': 0, 'fuzzy': 0}
+
+        def progress(stage):
+            stage_counts[stage] += 1
+            if progress_callback:
+                progress_callback(stage, stage_counts[stage], total_cvs)
+
+        search_func, algo_name_for_print, is_multi_pattern = self._resolve_exact_search(
+            algorithm)
+        canonical_algorithm = self._canonical_algorithm(algorithm)
+
+        # Reuse count vectors of keywords already scanned by earlier queries on this corpus
+        shared_counts = {}
+        if precomputed_counts is not None and precomputed_counts[0] == corpus_version:
+            shared_counts = precomputed_counts[1]
+        count_vectors = {}
+        keywords_to_scan = []
+        for keyword in keywords_lower:
+            cached_counts = shared_counts.get(keyword)
+            if cached_counts is None:
+                cached_counts = self.keyword_count_cache.get(
+                    (keyword, canonical_algorithm), corpus_version)
+            if cached_counts is not None:
+                if candidate_positions is not None:
+                    # Corpus-wide counts projected onto the candidates
+                    cached_counts = array('I', [cached_counts[position] for position in candidate_positions])
+                count_vectors[keyword] = cached_counts
+            else:
+                count_vectors[keyword] = array('I', [0]) * total_cvs
+                keywords_to_scan.append(keyword)
+        telemetry.increment("search.keyword_cache_hits", len(keywords_lower) - len(keywords_to_scan))
         print(
-            f"Starting fuzzy matching for unmatched keywords: {unmatched_keywords}")
-
-        if unmatched_keywords and fuzzy_threshold is not None:
-            for cv_path, text in self.in_memory_cv_texts.items():
-                cv_fuzzy_keywords = {}
-                similarity_counter = 0
-                highest_cv_similarity = 0.0
-                current_cv_loop_fuzzy_time = 0
-
-                cv_words = re.findall(r'\b\w+\b', text.lower())
-
-                for um_keyword in unmatched_keywords:
-                    counter = 0
-                    best_similarity_for_keyword = 0.0
-                    for cv_word in cv_words:
-
-                        similarity_score, time_taken = Utils.time_function(
-                            self.search_service.get_similarity_percentage,
-                            um_keyword.lower(), cv_word
-                        )
-                        
-                        if similarity_score >= fuzzy_threshold:
-                            similarity_counter += 1
-                            counter += 1
-                        
-                        current_cv_loop_fuzzy_time += time_taken
-                        if similarity_score >= fuzzy_threshold and similarity_score > best_similarity_for_keyword:
-                            best_similarity_for_keyword = similarity_score
-
-                    if best_similarity_for_keyword > 0:
-                        cv_fuzzy_keywords[um_keyword] = (best_similarity_for_keyword, counter)
-                        if best_similarity_for_keyword > highest_cv_similarity:
-                            highest_cv_similarity = best_similarity_for_keyword
-
-                if highest_cv_similarity > 0:
-                    fuzzy_matches[cv_path] = {
-                        'fuzzy_matched_keywords': cv_fuzzy_keywords,
-                        'highest_similarity': highest_cv_similarity,
-                        'total_occurrences': similarity_counter
-                    }
-                total_fuzzy_match_time_ms += current_cv_loop_fuzzy_time
-
-        final_results = []
-        processed_cv_paths = set()
-
-        for cv_path, details in sorted_exact_matches:
+            f"Starting exact matching with {algo_name_for_print} for keywords: {keywords_to_scan}"
+            f" (cached: {[k for k in keywords_lower if k not in keywords_to_scan]})")
+
+        keyword_docs = scan_docs = None
+        if keywords_to_scan:
+            with telemetry.span("search.exact.prune") as span:
+                keyword_docs = self._exact_scan_candidates(corpus_version, keywords_to_scan)
+                if keyword_docs is not None and len(keyword_docs) == len(keywords_to_scan):
+                    scan_docs = set().union(*keyword_docs.values())
+            state['exact_match_time_ms'] += span.elapsed_ms
+            stage_times['exact'] += span.elapsed_ms
+
+        run_fuzzy = False
+        for start in range(0, total_cvs, shard_size):
+            shard = cv_items[start:start + shard_size]
+            with telemetry.span("search.exact", cvs=len(shard)) as stage_span:
+                if keywords_to_scan:
+                    with telemetry.span("search.exact.scan") as scan_span:
+                        scanned = self._scan_exact(
+                            shard, start, keywords_to_scan, search_func, is_multi_pattern,
+                            count_vectors, cancel_event, keyword_docs, scan_docs, candidate_positions)
+                    state['exact_match_time_ms'] += scan_span.elapsed_ms
+                    telemetry.increment("search.cvs_skipped", len(shard) - scanned)
+                self._collect_exact_matches(
+                    shard, start, keywords_lower, count_vectors, state['exact_matches'], progress)
+            state['processed'] = start + len(shard)
+            stage_times['exact'] += stage_span.elapsed_ms
+            telemetry.increment("search.cvs_scanned", len(shard))
+
+            if state['processed'] == total_cvs:
+                # Counts over a filtered subset cannot serve other searches
+                for keyword in keywords_to_scan if candidate_positions is None else []:
+                    self.keyword_count_cache.put(
+                        (keyword, canonical_algorithm), corpus_version, count_vectors[keyword])
+                with telemetry.span("search.unmatched") as span:
+                    state['unmatched_keywords'] = self._find_unmatched_keywords(
+                        keywords, state['exact_matches'])
+                stage_times['unmatched'] += span.elapsed_ms
+                run_fuzzy = bool(
+                    state['unmatched_keywords']) and fuzzy_threshold is not None
+                state['done'] = not run_fuzzy
+                if state['done']:
+                    finish()
+            yield state
+
+        if total_cvs == 0:
+            state['unmatched_keywords'] = list(keywords)
+            state['done'] = True
+            finish()
+            yield state
+            return
+
+        if not run_fuzzy:
+            return
+
+        print(
+            f"Starting fuzzy matching for unmatched keywords: {state['unmatched_keywords']}")
+        state['stage'] = 'fuzzy'
+        for start in range(0, total_cvs, shard_size):
+            shard = cv_items[start:start + shard_size]
+            with telemetry.span("search.fuzzy", cvs=len(shard)) as span:
+                self._scan_fuzzy(
+                    shard, state['unmatched_keywords'], fuzzy_threshold,
+                    state['fuzzy_matches'], progress, cancel_event)
+            state['fuzzy_match_time_ms'] += span.elapsed_ms
+            stage_times['fuzzy'] += span.elapsed_ms
+            state['processed'] = start + len(shard)
+            state['done'] = state['processed'] == total_cvs
+            if state['done']:
+                finish()
+            yield state
+
+    def _get_profile_for_cv(self, cv_path: str):
+        """
+        Resolves the ApplicantProfile owning cv_path, memoized in applicant_profiles_cache
+        so repeated searches and streamed snapshots do not hit the database again.
+        """
+        if cv_path in self.applicant_profiles_cache:
+            return self.applicant_profiles_cache[cv_path]
+
+        app_detail = self.application_details_by_path.get(cv_path)
+        if app_detail is None:
             application_detail_list = self.db_manager.get_all_application_details()
             app_detail = next(
                 (ad for ad in application_detail_list if ad.cv_path == cv_path), None)
 
-            if app_detail:
-                profile = self.db_manager.get_applicant_profile_by_id(
-                    app_detail.applicant_id)
-                if profile:
-                    results.append({
-                        'applicant_id': profile.applicant_id,
-                        'name': f"{profile.first_name} {profile.last_name}".strip(),
-                        'cv_path': cv_path,
-                        'matched_keywords': details['matched_keywords'],
-                        'total_occurrences': details['total_occurrences'],
-                        'fuzzy_keywords': {},
-                        'highest_fuzzy_similarity': 0.0,
-                    })
-                    processed_cv_paths.add(cv_path)
-
-        sorted_fuzzy_matches = sorted(
-            fuzzy_matches.items(),
-            key=lambda item: (item[1]['total_occurrences'], item[1]['highest_similarity']),
-            reverse=True
-        )
+        profile = None
+        if app_detail:
+            profile = self.db_manager.get_applicant_profile_by_id(
+                app_detail.applicant_id)
+        self.applicant_profiles_cache[cv_path] = profile
+        return profile
+
+    def _bm25_scorer(self, doc_count: int, average_length: float) -> BM25Scorer:
+        return BM25Scorer(doc_count, average_length, k1=Settings.BM25_K1, b=Settings.BM25_B)
 
-        for cv_path, details in sorted_fuzzy_matches:
-            if cv_path not in processed_cv_paths:
-                application_detail_list = self.db_manager.get_all_application_details()
-                app_detail = next(
-                    (ad for ad in application_detail_list if ad.cv_path == cv_path), None)
-                if app_detail:
-                    profile = self.db_manager.get_applicant_profile_by_id(
-                        app_detail.applicant_id)
-                    if profile:
-                        results.append({
-                            'applicant_id': profile.applicant_id,
-                            'name': f"{profile.first_name} {profile.last_name}".strip(),
-                            'cv_path': cv_path,
-                            'matched_keywords': {},
-                            'fuzzy_keywords': details['fuzzy_matched_keywords'],
-                            'highest_fuzzy_similarity': details['highest_similarity'],
-                            'total_occurrences': details['total_occurrences']
-                        })
-                        processed_cv_paths.add(cv_path)
-
-        final_results = results[:top_n_matches]
+    @staticmethod
+    def _average_length(index: InvertedIndex, doc_ids) -> float:
+        """Mean word count of doc_ids in index; the index's own average when they are all of it."""
+        if len(doc_ids) == index.doc_count:
+            return index.average_length
+        doc_lengths = index.doc_lengths
+        return sum(doc_lengths[doc_id] for doc_id in doc_ids) / len(doc_ids) if len(doc_ids) else 0.0
 
+    def _rank_matches(self, exact_matches: dict, fuzzy_matches: dict, doc_count: int,
+                      index: InvertedIndex, average_length: float) -> list[tuple[str, dict]]:
+        """
+        Orders every matching CV by BM25 over its exact keyword hits, blended with its
+        fuzzy hits: each fuzzy keyword scores like an exact one scaled by its similarity
+        and Settings.BM25_FUZZY_WEIGHT. Document frequencies are counted from the matches
+        themselves (doc_count CVs were searched, averaging average_length words) and
+        lengths come from the inverted index, so ranking reads no CV text. Returns (cv_path, details) pairs, best first.
+        """
+        exact_frequencies = {}
+        for details in exact_matches.values():
+            for keyword in details['matched_keywords']:
+                exact_frequencies[keyword] = exact_frequencies.get(keyword, 0) + 1
+        fuzzy_frequencies = {}
+        for details in fuzzy_matches.values():
+            for keyword in details['fuzzy_matched_keywords']:
+                fuzzy_frequencies[keyword] = fuzzy_frequencies.get(keyword, 0) + 1
+        scorer = self._bm25_scorer(doc_count, average_length)
+        exact_idfs = {keyword: scorer.idf(df) for keyword, df in exact_frequencies.items()}
+        fuzzy_idfs = {keyword: scorer.idf(df) for keyword, df in fuzzy_frequencies.items()}
+
+        ranked = []
+        # Corpus order going in keeps ties in a stable order
+        cv_paths = list(exact_matches)
+        cv_paths.extend(cv_path for cv_path in fuzzy_matches if cv_path not in exact_matches)
+        for cv_path in cv_paths:
+            doc_id = self.cv_corpus.doc_id(cv_path)
+            # A reload racing the search may have dropped the CV; score it at average length
+            doc_length = (index.doc_lengths[doc_id] if doc_id is not None and doc_id < index.doc_count
+                          else index.average_length)
+            exact = exact_matches.get(cv_path)
+            fuzzy = fuzzy_matches.get(cv_path)
+            score = 0.0
+            details = {
+                'matched_keywords': {},
+                'total_occurrences': 0,
+                'fuzzy_keywords': {},
+                'highest_fuzzy_similarity': 0.0,
+            }
+            if exact is not None:
+                for keyword, count in exact['matched_keywords'].items():
+                    score += scorer.score(count, exact_idfs[keyword], doc_length)
+                details['matched_keywords'] = exact['matched_keywords']
+                details['total_occurrences'] += exact['total_occurrences']
+            if fuzzy is not None:
+                for keyword, (similarity, count) in fuzzy['fuzzy_matched_keywords'].items():
+                    score += (Settings.BM25_FUZZY_WEIGHT * similarity / 100
+                              * scorer.score(count, fuzzy_idfs[keyword], doc_length))
+                details['fuzzy_keywords'] = fuzzy['fuzzy_matched_keywords']
+                details['highest_fuzzy_similarity'] = fuzzy['highest_similarity']
+                details['total_occurrences'] += fuzzy['total_occurrences']
+            details['score'] = score
+            ranked.append((cv_path, details))
+        ranked.sort(key=lambda item: (item[1]['score'], item[1]['total_occurrences']), reverse=True)
+        return ranked
+
+    def _assemble_results(self, ranked: list[tuple[str, dict]], top_n_matches: int | None,
+                          keywords: list[str] | None = None) -> list[dict]:
+        """
+        Turns the first top_n_matches ranked CVs that belong to a known applicant into
+        result dicts. Changing top_n_matches on a cached ranking is just a longer or shorter walk.
+        The ranking may come from the cache, filled by a query that spelled its keywords
+        differently; given the caller's keywords, fuzzy keyword keys are returned in their
+        spelling (exact keys are always lowercase).
+        """
+        spelling = {keyword.lower(): keyword for keyword in keywords} if keywords else None
+        results = []
+        for cv_path, details in ranked:
+            if top_n_matches is not None and len(results) >= top_n_matches:
+                break
+            profile = self._get_profile_for_cv(cv_path)
+            if not profile:
+                continue
+            fuzzy_keywords = details['fuzzy_keywords']
+            if spelling and fuzzy_keywords:
+                fuzzy_keywords = {spelling.get(keyword.lower(), keyword): value
+                                  for keyword, value in fuzzy_keywords.items()}
+            results.append({
+                'applicant_id': profile.applicant_id,
+                'name': f"{profile.first_name} {profile.last_name}".strip(),
+                'cv_path': cv_path,
+                'matched_keywords': details['matched_keywords'],
+                'total_occurrences': details['total_occurrences'],
+                'fuzzy_keywords': fuzzy_keywords,
+                'highest_fuzzy_similarity': details['highest_fuzzy_similarity'],
+                'score': round(details['score'], 4),
+            })
+        return results
+
+    def _build_search_response(self, state: dict, top_n_matches: int, keywords: list[str]) -> dict:
+        """
+        Builds the public result dict for a search of keywords. 'stage_times_ms' breaks the wall-clock cost down
+        into exact, unmatched, fuzzy, rank and assemble (profile lookup); on a cache hit
+        only assemble is non-zero since nothing was scanned.
+        """
+        stage_times = {'exact': 0.0, 'unmatched': 0.0, 'fuzzy': 0.0, 'rank': 0.0}
+        if not state['cached']:
+            stage_times.update(state['stage_times_ms'])
+        elif state['filtered']:
+            stage_times['filter'] = 0.0
+        ranked = state['ranked']
+        if ranked is None:
+            with telemetry.span("search.rank") as span:
+                ranked = self._rank_matches(state['exact_matches'], state['fuzzy_matches'], state['total'],
+                                            state['index'], state['average_length'])
+            stage_times['rank'] += span.elapsed_ms
+        with telemetry.span("search.assemble") as span:
+            results = self._assemble_results(ranked, top_n_matches, keywords)
+        stage_times['assemble'] = span.elapsed_ms
+        response = {
+            "results": results,
+            "exact_match_time_ms": state['exact_match_time_ms'],
+            "fuzzy_match_time_ms": state['fuzzy_match_time_ms'] if state['unmatched_keywords'] else 0,
+            "cached": state['cached'],
+            "stage_times_ms": stage_times,
+        }
+        if state['filtered']:
+            response["candidates"] = state['total']
+        return response
+
+    def _record_slow_query(self, keywords: list[str], algorithm: str, fuzzy_threshold: float, top_n_matches: int,
+                           state: dict, response: dict, total_ms: float, filters: dict | None = None):
+        """Appends the search to the slow-query log if it went over Settings.SLOW_QUERY_THRESHOLD_MS."""
+        if not self.slow_query_log.enabled:
+            return
+        logged = self.slow_query_log.record_if_slow(total_ms, {
+            "keywords": keywords,
+            "algorithm": self._canonical_algorithm(algorithm),
+            "fuzzy_threshold": fuzzy_threshold,
+            "top_n": top_n_matches,
+            "filters": filters or None,
+            "corpus_size": len(self.cv_corpus),
+            "cached": response["cached"],
+            "stage_times_ms": response["stage_times_ms"],
+            "exact_match_count": len(state['exact_matches']),
+            "fuzzy_match_count": len(state['fuzzy_matches']),
+            "unmatched_keywords": state['unmatched_keywords'],
+            "result_count": len(response["results"]),
+        })
+        if logged:
+            telemetry.increment("search.slow_queries")
+
+    def search_cvs(self, keywords: list[str], algorithm: str, top_n_matches: int = 10, fuzzy_threshold: float = 80,
+                   progress_callback=None, cancel_event: threading.Event | None = None,
+                   profile_dir: str | None = None, filters: dict | None = None) -> dict:
+        """
+        Performs CV search based on keywords using the specified algorithm via SearchService.
+        Returns structured results including exact and fuzzy matches, ranked by BM25
+        blended with fuzzy similarity (see _rank_matches) and carrying their 'score'.
+
+        progress_callback, if given, is called as progress_callback(stage, processed, total)
+        after every CV with stage being 'exact' or 'fuzzy'. Setting cancel_event aborts the
+        search between CVs by raising concurrent.futures.CancelledError.
+
+        Completed searches are cached per (keyword set, algorithm, fuzzy threshold, corpus
+        version), so repeating a query or changing only top_n_matches skips the scan and
+        returns with 'cached' set to True.
+
+        Searches slower than Settings.SLOW_QUERY_THRESHOLD_MS are appended to the
+        slow-query log (see SlowQueryLog).
+
+        filters restricts the search to CVs matching metadata predicates, resolved before
+        any text is scanned: 'roles' (application roles, any of them), and the profile
+        criteria of find_cvs_by_profile ('skills', 'companies', 'titles', 'degree_levels',
+        'min_years', 'max_years'). The response then reports the number of 'candidates'
+        scanned. An unknown filter raises ValueError.
+
+        If profile_dir is given, the call runs under SearchProfiler: cProfile stats, a
+        tracemalloc snapshot and the stage spans are written to a new timestamped
+        directory below it, returned as 'profile_dir' in the response.
+        """
+        if profile_dir:
+            query = {"keywords": list(keywords), "algorithm": algorithm,
+                     "top_n_matches": top_n_matches, "fuzzy_threshold": fuzzy_threshold,
+                     "filters": filters, "corpus_size": len(self.cv_corpus)}
+            with SearchProfiler(profile_dir, query) as profiler:
+                response = self.search_cvs(keywords, algorithm, top_n_matches, fuzzy_threshold,
+                                           progress_callback, cancel_event, filters=filters)
+            response["profile_dir"] = profiler.output_dir
+            return response
+
+        keywords = self._normalize_keywords(keywords)
+        filters = self._normalize_filters(filters)
+        telemetry.increment("search.requests")
+        with telemetry.span("search", algorithm=self._canonical_algorithm(algorithm),
+                            keywords=len(keywords)) as search_span:
+            state = None
+            for state in self._run_search_stages(keywords, algorithm, fuzzy_threshold, None,
+                                                 progress_callback, cancel_event, filters=filters):
+                pass
+            response = self._build_search_response(state, top_n_matches, keywords)
+        self._record_slow_query(keywords, algorithm, fuzzy_threshold, top_n_matches,
+                                state, response, search_span.elapsed_ms, filters)
+        return response
+
+    def _rank_query_matches(self, evaluator: QueryEvaluator, root, matches: DocBitmap,
+                            cv_items: list[tuple[str, str]]) -> list[tuple[str, dict]]:
+        """
+        Orders the CVs a boolean query matched by BM25 over the query's positive terms,
+        phrases and NEAR pairs, using the document frequencies and lengths of the index.
+        """
+        index = evaluator.index
+        scorer = self._bm25_scorer(evaluator.doc_count, self._average_length(index, range(evaluator.doc_count)))
+        idfs = evaluator.leaf_idfs(root, scorer)
+        ranked = []
+        for doc_id, matched_keywords in evaluator.match_counts(root, matches).items():
+            doc_length = index.doc_lengths[doc_id]
+            ranked.append((cv_items[doc_id][0], {
+                'matched_keywords': matched_keywords,
+                'total_occurrences': sum(matched_keywords.values()),
+                'fuzzy_keywords': {},
+                'highest_fuzzy_similarity': 0.0,
+                'score': sum(scorer.score(count, idfs[label], doc_length)
+                             for label, count in matched_keywords.items()),
+            }))
+        ranked.sort(key=lambda item: (item[1]['score'], item[1]['total_occurrences']), reverse=True)
+        return ranked
+
+    def search_cvs_query(self, query: str, top_n_matches: int = 10,
+                         cancel_event: threading.Event | None = None) -> dict:
+        """
+        Runs a boolean query such as '"spring boot" AND (java OR kotlin) NOT role:sales'
+        (see QueryParser for the syntax: AND/OR/NOT, "phrases", NEAR/k, prefix* terms and
+        the fields role, skill, company, title, degree and years).
+
+        Unlike search_cvs, terms match whole words and are looked up in the inverted
+        index built at load time, so only the posting lists involved are read and no
+        fuzzy stage runs. Matches are ranked by BM25 over the query's positive terms,
+        phrases and NEAR pairs. The response has the shape of search_cvs, plus the canonical
+        'query' and the number of 'matches'; repeats are served from the query cache.
+        Raises QuerySyntaxError (a ValueError) on a malformed query.
+        """
+        self._wait_for_first_cvs(cancel_event)
+        telemetry.increment("search.query_requests")
+        stage_times = {'parse': 0.0, 'evaluate': 0.0, 'rank': 0.0}
+        with telemetry.span("search.query") as span:
+            root = parse_query(query)
+        stage_times['parse'] = span.elapsed_ms
+
+        corpus_version, cv_items = self.cv_corpus.versioned_items()
+        # Field operands read the profile tables
+        cache_key = ('query', str(root), self.profile_generation)
+        state = self.query_cache.get(cache_key, corpus_version)
+        cached = state is not None
+        if cached:
+            telemetry.increment("search.query_cache_hits")
+        else:
+            index = self._get_inverted_index(corpus_version, cv_items)
+            self._check_cancelled(cancel_event)
+            evaluator = QueryEvaluator(index, lambda filters: self._resolve_candidates(
+                self._normalize_filters(filters), corpus_version, cv_items), doc_count=len(cv_items))
+            with telemetry.span("search.query.evaluate") as span:
+                matches = evaluator.evaluate(root)
+                if index.doc_count > len(cv_items):
+                    # CVs added to the index after this snapshot was taken
+                    matches = matches & evaluator.universe
+            stage_times['evaluate'] = span.elapsed_ms
+            self._check_cancelled(cancel_event)
+            with telemetry.span("search.rank") as span:
+                ranked = self._rank_query_matches(evaluator, root, matches, cv_items)
+            stage_times['rank'] = span.elapsed_ms
+            state = {'ranked': ranked, 'matches': len(matches)}
+            self.query_cache.put(cache_key, corpus_version, state)
+
+        with telemetry.span("search.assemble") as span:
+            results = self._assemble_results(state['ranked'], top_n_matches)
+        stage_times['assemble'] = span.elapsed_ms
         return {
-            "results": final_results,
-            "exact_match_time_ms": total_exact_match_time_ms,
-            "fuzzy_match_time_ms": total_fuzzy_match_time_ms if unmatched_keywords else 0
+            "results": results,
+            "query": str(root),
+            "matches": state['matches'],
+            "exact_match_time_ms": stage_times['evaluate'],
+            "fuzzy_match_time_ms": 0,
+            "cached": cached,
+            "stage_times_ms": stage_times,
         }
 
-    def get_cv_summary(self, applicant_id: int) -> dict:
+    def _group_batch_queries(self, queries: list[dict]) -> list[list[int]]:
+        """
+        Packs query indices into groups whose keyword union stays within
+        Settings.BATCH_MAX_KEYWORDS, bounding the count vectors held per corpus pass.
+        """
+        groups, current, current_keywords = [], [], set()
+        for index, query in enumerate(queries):
+            query_keywords = {keyword.lower() for keyword in query['keywords']}
+            if current and len(current_keywords | query_keywords) > Settings.BATCH_MAX_KEYWORDS:
+                groups.append(current)
+                current, current_keywords = [], set()
+            current.append(index)
+            current_keywords |= query_keywords
+        if current:
+            groups.append(current)
+        return groups
 
-        profile = self.db_manager.get_applicant_profile_by_id(applicant_id)
-        if not profile:
-            return {"error": "Applicant not found."}
+    def _normalize_batch_query(self, number: int, query: dict, top_n_matches: int | None,
+                               fuzzy_threshold: float | None) -> dict:
+        """
+        Validates one search_cvs_batch query and fills in its defaults: normalized keywords
+        and filters, and numeric 'top_n' and 'fuzzy_threshold'. Raises ValueError naming
+        the query by its position.
+        """
+        keywords = query.get('keywords') if isinstance(query, dict) else None
+        if not isinstance(keywords, list) or not all(isinstance(keyword, str) for keyword in keywords):
+            raise ValueError(f"Query {number}: 'keywords' must be a list of strings")
+        keywords = self._normalize_keywords(keywords)
+        if not keywords:
+            raise ValueError(f"Query {number}: 'keywords' is empty")
+        top_n = query.get('top_n', top_n_matches)
+        threshold = query.get('fuzzy_threshold', fuzzy_threshold)
+        try:
+            top_n = None if top_n is None else int(top_n)
+            threshold = None if threshold is None else float(threshold)
+        except (TypeError, ValueError):
+            raise ValueError(f"Query {number}: 'top_n' and 'fuzzy_threshold' must be numbers") from None
+        filters = query.get('filters')
+        if filters is not None and not isinstance(filters, dict):
+            raise ValueError(f"Query {number}: 'filters' must be a dict")
+        return dict(query, keywords=keywords, top_n=top_n, fuzzy_threshold=threshold,
+                    filters=self._normalize_filters(filters))
 
-        application_details_row = self.db_manager._execute_query(
-            "SELECT * FROM ApplicationDetail WHERE applicant_id = %s ORDER BY detail_id DESC LIMIT 1",
-            (applicant_id,), fetch_one=True
-        )
-        if not application_details_row:
-            return {"error": "CV details not found for this applicant."}
+    def search_cvs_batch(self, queries: list[dict], top_n_matches: int = 10, fuzzy_threshold: float = 80,
+                         cancel_event: threading.Event | None = None) -> list[dict]:
+        """
+        Runs many searches with one shared exact pass over the corpus. The keywords of
+        all queries are merged into a single Aho-Corasick automaton, the corpus is
+        scanned once, and each query is then ranked from the shared per-keyword counts
+        (fuzzy matching still runs per query for its unmatched keywords).
 
-        cv_path = application_details_row['cv_path']
-        if not cv_path or not os.path.exists(cv_path):
-            return {"error": f"CV file not found at {cv_path}"}
+        Each query is a dict with 'keywords' and optionally 'top_n', 'fuzzy_threshold'
+        (the defaults are the arguments) and 'filters' (see search_cvs). Returns one search_cvs-style response per query,
+        in order, with the group's shared scan time as 'batch_scan_time_ms'.
+        Raises ValueError, before anything is scanned, if a query has no list of keyword
+        strings, a non-numeric 'top_n' or 'fuzzy_threshold', or an unknown filter.
+        """
+        queries = [self._normalize_batch_query(number, query, top_n_matches, fuzzy_threshold)
+                   for number, query in enumerate(queries)]
+        responses = [None] * len(queries)
+        telemetry.increment("search.batch_requests")
+        telemetry.increment("search.requests", len(queries))
 
-        cv_text = self.cv_processor.extract_text_from_pdf(cv_path)
-        if not cv_text:
-            return {"error": "Could not extract text from CV."}
+        search_func, _, _ = self._resolve_exact_search('aho-corasick')
+        for group in self._group_batch_queries(queries):
+            self._wait_for_first_cvs(cancel_event)
+            corpus_version, cv_items = self.cv_corpus.versioned_items()
+            union = list(dict.fromkeys(
+                keyword.lower() for index in group for keyword in queries[index]['keywords']))
+
+            shared_counts = {}
+            keywords_to_scan = []
+            for keyword in union:
+                cached_counts = self.keyword_count_cache.get((keyword, 'aho-corasick'), corpus_version)
+                if cached_counts is not None:
+                    shared_counts[keyword] = cached_counts
+                else:
+                    shared_counts[keyword] = array('I', [0]) * len(cv_items)
+                    keywords_to_scan.append(keyword)
+
+            print(f"Batch of {len(group)} queries: one Aho-Corasick pass for {len(keywords_to_scan)} "
+                  f"keywords ({len(union) - len(keywords_to_scan)} cached)")
+            with telemetry.span("search.batch_scan", queries=len(group), keywords=len(keywords_to_scan)) as scan_span:
+                if keywords_to_scan:
+                    self._scan_exact(cv_items, 0, keywords_to_scan, search_func, True,
+                                     shared_counts, cancel_event)
+            for keyword in keywords_to_scan:
+                self.keyword_count_cache.put((keyword, 'aho-corasick'), corpus_version, shared_counts[keyword])
+
+            for index in group:
+                query = queries[index]
+                state = None
+                for state in self._run_search_stages(query['keywords'], 'aho-corasick', query['fuzzy_threshold'], None,
+                                                     None, cancel_event,
+                                                     precomputed_counts=(corpus_version, shared_counts),
+                                                     filters=query['filters']):
+                    pass
+                response = self._build_search_response(state, query['top_n'], query['keywords'])
+                response['batch_scan_time_ms'] = scan_span.elapsed_ms
+                responses[index] = response
+        return responses
+
+    def iter_search_cvs(self, keywords: list[str], algorithm: str, top_n_matches: int = 10, fuzzy_threshold: float = 80,
+                        shard_size: int = Settings.STREAM_SHARD_SIZE, progress_callback=None,
+                        cancel_event: threading.Event | None = None, filters: dict | None = None):
+        """
+        Incremental variant of search_cvs. Scans the corpus in shards of shard_size CVs and
+        yields a top-N snapshot after each one. Snapshots have the same shape as the
+        search_cvs result plus 'stage', 'processed', 'total' and 'done'; the final snapshot
+        (done=True) equals what search_cvs would return.
+        """
+        keywords = self._normalize_keywords(keywords)
+        filters = self._normalize_filters(filters)
+        telemetry.increment("search.requests")
+        for state in self._run_search_stages(keywords, algorithm, fuzzy_threshold, shard_size,
+                                             progress_callback, cancel_event, filters=filters):
+            snapshot = self._build_search_response(state, top_n_matches, keywords)
+            snapshot.update({
+                "stage": state['stage'],
+                "processed": state['processed'],
+                "total": state['total'],
+                "done": state['done'],
+            })
+            if state['done']:
+                # Time spent by the consumer between snapshots is not search latency
+                self._record_slow_query(keywords, algorithm, fuzzy_threshold, top_n_matches,
+                                        state, snapshot, sum(snapshot['stage_times_ms'].values()), filters)
+            yield snapshot
+
+    def _get_search_executor(self) -> ThreadPoolExecutor:
+        if self._search_executor is None:
+            self._search_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="search")
+        return self._search_executor
+
+    def submit_search(self, keywords: list[str], algorithm: str, top_n_matches: int = 10, fuzzy_threshold: float = 80,
+                      progress_callback=None, cancel_event: threading.Event | None = None,
+                      filters: dict | None = None) -> Future:
+        """
+        Runs search_cvs on a background worker thread and returns a concurrent.futures.Future.
+        Intended for Tk callers: poll future.done() with widget.after() and set cancel_event
+        to abort. progress_callback is invoked on the worker thread, not the UI thread.
+        """
+        return self._get_search_executor().submit(
+            self.search_cvs, keywords, algorithm, top_n_matches, fuzzy_threshold,
+            progress_callback, cancel_event, filters=filters)
+
+    def submit_search_stream(self, keywords: list[str], algorithm: str, top_n_matches: int = 10,
+                             fuzzy_threshold: float = 80, shard_size: int = Settings.STREAM_SHARD_SIZE,
+                             filters: dict | None = None) -> SearchStream:
+        """
+        Runs iter_search_cvs on the background worker and returns a SearchStream whose
+        'latest' snapshot the UI can poll and render progressively.
+        """
+        stream = SearchStream()
+
+        def consume():
+            for snapshot in self.iter_search_cvs(keywords, algorithm, top_n_matches, fuzzy_threshold,
+                                                 shard_size, cancel_event=stream.cancel_event, filters=filters):
+                stream.publish(snapshot)
+            return stream.latest
+
+        stream.future = self._get_search_executor().submit(consume)
+        return stream
+
+    async def search_cvs_async(self, keywords: list[str], algorithm: str, top_n_matches: int = 10,
+                               fuzzy_threshold: float = 80, progress_callback=None,
+                               filters: dict | None = None) -> dict:
+        """
+        Awaitable variant of search_cvs that runs the scan off the event loop thread.
+        progress_callback is scheduled on the event loop. Cancelling the awaiting task
+        stops the worker between CVs.
+        """
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+
+        threadsafe_callback = None
+        if progress_callback:
+            def threadsafe_callback(stage, processed, total):
+                loop.call_soon_threadsafe(
+                    progress_callback, stage, processed, total)
+
+        future = self.submit_search(keywords, algorithm, top_n_matches, fuzzy_threshold,
+                                    threadsafe_callback, cancel_event, filters)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+
+    def get_cv_summary(self, applicant_id: int) -> dict:
+        applicant_profile = self._get_applicant_profile(applicant_id)
+        if "error" in applicant_profile:
+            return applicant_profile
+
+        extracted_info = self.get_cv_extracted_info(applicant_id)
+        if "error" in extracted_info:
+            return extracted_info
 
         summary = {
-            "applicant_profile": self._get_applicant_profile(applicant_id),
-            "extracted_info": {
-                "skills": self.regex_extractor.extract_skills(cv_text),
-                "job_history": self.regex_extractor.extract_job_history(cv_text),
-                "education": self.regex_extractor.extract_education(cv_text)
-            }
+            "applicant_profile": applicant_profile,
+            "extracted_info": extracted_info
         }
         return summary
 
+    def get_cv_extracted_info(self, applicant_id: int, cv_path: str = None) -> dict:
+        """
+        Returns the skills, job history and education extracted from an applicant's CV
+        (the one at cv_path if given, otherwise their latest application).
+        Summaries are precomputed at load time; the CV is only parsed again when
+        neither memory nor the CVSummary table has one.
+        """
+        detail = self.application_details_by_path.get(cv_path) if cv_path else None
+        if detail is None:
+            detail = self._latest_application_detail(applicant_id)
+        if detail is None:
+            return {"error": "CV details not found for this applicant."}
+
+        summary = self.cv_summaries.get(detail.detail_id)
+        if summary is None:
+            summary = self.db_manager.get_cv_summary_by_detail_id(detail.detail_id)
+        if summary is None:
+            cv_text = self.cv_corpus.get(detail.cv_path)
+            if not cv_text:
+                if not detail.cv_path or not os.path.exists(detail.cv_path):
+                    return {"error": f"CV file not found at {detail.cv_path}"}
+                cv_text = self.cv_processor.extract_text_from_pdf(detail.cv_path)
+            if not cv_text:
+                return {"error": "Could not extract text from CV."}
+            summary = CVSummary.from_extracted_info(
+                detail.detail_id, self.regex_extractor.extract_cv_summary(cv_text))
+            self.db_manager.save_cv_profiles([summary])
+        self.cv_summaries[detail.detail_id] = summary
+        return summary.as_extracted_info()
+
+    def _latest_application_detail(self, applicant_id: int):
+        latest = None
+        for detail in self.application_details_by_path.values():
+            if detail.applicant_id == applicant_id and (latest is None or detail.detail_id > latest.detail_id):
+                latest = detail
+        if latest is None:
+            latest = self.db_manager.get_latest_application_detail(applicant_id)
+        return latest
+
     def get_raw_cv_path(self, applicant_id: int) -> str:
         application_details_row = self.db_manager._execute_query(
             "SELECT cv_path FROM ApplicationDetail WHERE applicant_id = %s ORDER BY detail_id DESC LIMIT 1",
@@ -335,5 +1289,12 @@ class BackendManager:
         }
     
     def shutdown_backend(self):
-        """Closes any open connections."""
+        """Stops the search worker and closes any open connections."""
+        if self._search_executor is not None:
+            self._search_executor.shutdown(wait=False, cancel_futures=True)
+            self._search_executor = None
         self.db_manager.close()
+        self.slow_query_log.close()
+        export_path = os.environ.get("VITAELANGX_TELEMETRY_EXPORT", Settings.TELEMETRY_EXPORT_PATH)
+        if telemetry.enabled and export_path:
+            print(f"Telemetry written to {export_to_file(telemetry, export_path)}")
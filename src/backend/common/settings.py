@@ -1,3 +1,22 @@
 class Settings:
     FUZZY_THRESHOLD = 80
-    TOP_N_MATCHES = 5
\ No newline at end of file
+    # BM25 ranking: k1 saturates repeated hits, b damps long CVs; fuzzy hits count
+    # their similarity times this weight as a fraction of an exact hit
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    BM25_FUZZY_WEIGHT = 0.5
+    TOP_N_MATCHES = 5
+    STREAM_SHARD_SIZE = 50
+    QUERY_CACHE_SIZE = 64
+    KEYWORD_CACHE_SIZE = 256
+    # Upper bound on distinct keywords scanned together by search_cvs_batch in one corpus pass
+    BATCH_MAX_KEYWORDS = 256
+    # Spans/counters are off by default; VITAELANGX_TELEMETRY=1 overrides this
+    TELEMETRY_ENABLED = False
+    # Written on shutdown when telemetry is enabled (or VITAELANGX_TELEMETRY_EXPORT); .prom for Prometheus text, else JSON
+    TELEMETRY_EXPORT_PATH = None
+    # Searches slower than this (ms) are appended to SLOW_QUERY_LOG_PATH; set the path to None to disable
+    SLOW_QUERY_THRESHOLD_MS = 2000
+    SLOW_QUERY_LOG_PATH = "../logs/slow_queries.jsonl"
+    SLOW_QUERY_LOG_MAX_BYTES = 5 * 1024 * 1024
+    SLOW_QUERY_LOG_BACKUPS = 5
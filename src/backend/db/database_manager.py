@@ -1,8 +1,10 @@
 import pymysql.cursors
-from backend.models import ApplicantProfile, ApplicationDetail
+from backend.models import ApplicantProfile, ApplicationDetail, CVEducation, CVJob, CVSkill, CVSummary
 from backend.encryption import VigenereCipher
 import datetime
 import os
+import threading
+from backend.telemetry import telemetry
 
 
 class DatabaseManager:
@@ -10,6 +12,72 @@ class DatabaseManager:
     Manages connections and operations for the MySQL database.
     """
 
+    # No foreign key: the seeding scripts drop and recreate ApplicationDetail, and
+    # every corpus load rewrites the summaries of all current details anyway.
+    CV_SUMMARY_TABLE_QUERY = """
+            CREATE TABLE IF NOT EXISTS CVSummary (
+                detail_id INT NOT NULL PRIMARY KEY,
+                skills MEDIUMTEXT,
+                job_history MEDIUMTEXT,
+                education MEDIUMTEXT,
+                experience_months INT DEFAULT NULL,
+                INDEX idx_cvsummary_experience (experience_months)
+            )
+            """
+    # Normalized profile rows, rebuilt together with CVSummary on every corpus load.
+    # Indexed so candidate filters ("has Masters", "worked at X") are resolved in SQL.
+    CV_PROFILE_TABLE_QUERIES = [
+        """
+            CREATE TABLE IF NOT EXISTS CVSkill (
+                detail_id INT NOT NULL,
+                skill VARCHAR(255) NOT NULL,
+                PRIMARY KEY (detail_id, skill),
+                INDEX idx_cvskill_skill (skill)
+            )
+            """,
+        """
+            CREATE TABLE IF NOT EXISTS CVJob (
+                detail_id INT NOT NULL,
+                position SMALLINT NOT NULL,
+                title VARCHAR(255),
+                company VARCHAR(255),
+                location VARCHAR(255),
+                dates VARCHAR(100),
+                start_month INT DEFAULT NULL,
+                end_month INT DEFAULT NULL,
+                PRIMARY KEY (detail_id, position),
+                INDEX idx_cvjob_title (title),
+                INDEX idx_cvjob_company (company),
+                INDEX idx_cvjob_period (start_month, end_month)
+            )
+            """,
+        """
+            CREATE TABLE IF NOT EXISTS CVEducation (
+                detail_id INT NOT NULL,
+                position SMALLINT NOT NULL,
+                university VARCHAR(255),
+                degree VARCHAR(255),
+                degree_level VARCHAR(20),
+                dates VARCHAR(100),
+                gpa VARCHAR(20),
+                PRIMARY KEY (detail_id, position),
+                INDEX idx_cveducation_level (degree_level),
+                INDEX idx_cveducation_university (university)
+            )
+            """,
+    ]
+    # Columns added after a table was first released: {table: {column: ALTER TABLE clause}}
+    CV_TABLE_MIGRATIONS = {
+        "CVSummary": {
+            "experience_months": "ADD COLUMN experience_months INT DEFAULT NULL, "
+                                 "ADD INDEX idx_cvsummary_experience (experience_months)",
+        },
+        "CVJob": {
+            "start_month": "ADD COLUMN start_month INT DEFAULT NULL, ADD COLUMN end_month INT DEFAULT NULL, "
+                           "ADD INDEX idx_cvjob_period (start_month, end_month)",
+        },
+    }
+
     def __init__(self, host='localhost', user='root', password='', db='ats_db'):
         self.connection = None
         self.host = host
@@ -18,6 +86,9 @@ class DatabaseManager:
         self.db = db
         self.encryptor = VigenereCipher(key="i-see-the-key")
         self.sensitive_data = ['first_name', 'last_name', 'address', 'phone_number']
+        # Searches may run on a worker thread; pymysql connections are not thread-safe.
+        self._lock = threading.RLock()
+        self._cv_tables_ready = False
 
     def connect(self):
         """
@@ -89,32 +160,65 @@ class DatabaseManager:
 
     def _execute_query(self, query: str, params: tuple = None, fetch_one=False, fetch_all=False, commit=False):
         """Internal method to execute SQL queries."""
-        if not self.connection:
-            self.connect()
+        with self._lock:
             if not self.connection:
-                return None
+                self.connect()
+                if not self.connection:
+                    return None
 
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
+            try:
+                with telemetry.span("db.query"), self.connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    if commit:
+                        self.connection.commit()
+                    if fetch_one:
+                        return cursor.fetchone()
+                    if fetch_all:
+                        return cursor.fetchall()
+                    return cursor.lastrowid
+            except pymysql.Error as e:
+                print(f"Database query error: {e}")
                 if commit:
+                    try:
+                        self.connection.rollback()
+                    except pymysql.Error as rb_err:
+                        print(f"Error during rollback: {rb_err}")
+                return None
+            except Exception as ex:
+                print(f"An unexpected error occurred during query execution: {ex}")
+                return None
+
+    def _execute_transaction(self, statements: list[tuple[str, list[tuple]]]) -> bool:
+        """
+        Internal method to run several (query, parameter rows) statements in one commit.
+        An empty row list executes the query once without parameters.
+        """
+        with self._lock:
+            if not self.connection:
+                self.connect()
+                if not self.connection:
+                    return False
+
+            try:
+                rows_total = sum(len(rows) for _, rows in statements)
+                with telemetry.span("db.query", rows=rows_total), self.connection.cursor() as cursor:
+                    for query, rows in statements:
+                        if rows:
+                            cursor.executemany(query, rows)
+                        else:
+                            cursor.execute(query)
                     self.connection.commit()
-                if fetch_one:
-                    return cursor.fetchone()
-                if fetch_all:
-                    return cursor.fetchall()
-                return cursor.lastrowid
-        except pymysql.Error as e:
-            print(f"Database query error: {e}")
-            if commit:
+                    return True
+            except pymysql.Error as e:
+                print(f"Database batch query error: {e}")
                 try:
                     self.connection.rollback()
                 except pymysql.Error as rb_err:
                     print(f"Error during rollback: {rb_err}")
-            return None
-        except Exception as ex:
-            print(f"An unexpected error occurred during query execution: {ex}")
-            return None
+                return False
+            except Exception as ex:
+                print(f"An unexpected error occurred during batch query execution: {ex}")
+                return False
 
     def create_tables(self):
         """Creates the necessary tables if they don't exist."""
@@ -137,12 +241,37 @@ class DatabaseManager:
                 cv_path TEXT,
                 FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
             )
-            """
+            """,
+            self.CV_SUMMARY_TABLE_QUERY,
+            *self.CV_PROFILE_TABLE_QUERIES
         ]
         for query in queries:
             self._execute_query(query, commit=True)
+        self._migrate_cv_tables()
+        self._cv_tables_ready = True
         print("Tables checked/created.")
 
+    def _migrate_cv_tables(self):
+        """Adds the columns listed in CV_TABLE_MIGRATIONS to tables created by older versions."""
+        for table, columns in self.CV_TABLE_MIGRATIONS.items():
+            rows = self._execute_query(f"SHOW COLUMNS FROM {table}", fetch_all=True)
+            if not rows:
+                continue
+            existing = {row['Field'] for row in rows}
+            for column, clause in columns.items():
+                if column not in existing:
+                    print(f"Adding column {column} to {table}...")
+                    self._execute_query(f"ALTER TABLE {table} {clause}", commit=True)
+
+    def _ensure_cv_tables(self):
+        """Creates and migrates the extraction tables once, for databases predating them."""
+        if self._cv_tables_ready:
+            return
+        for query in [self.CV_SUMMARY_TABLE_QUERY, *self.CV_PROFILE_TABLE_QUERIES]:
+            self._execute_query(query, commit=True)
+        self._migrate_cv_tables()
+        self._cv_tables_ready = True
+
     def insert_applicant_profile(self, profile: ApplicantProfile) -> int:
         """Inserts a new applicant profile into the database."""
         query = """
@@ -177,14 +306,25 @@ class DatabaseManager:
             return [ApplicationDetail(**row) for row in rows]
         return []
 
+    def get_latest_application_detail(self, applicant_id: int) -> ApplicationDetail:
+        """Retrieves the most recent application detail of an applicant."""
+        query = "SELECT * FROM ApplicationDetail WHERE applicant_id = %s ORDER BY detail_id DESC LIMIT 1"
+        row = self._execute_query(query, (applicant_id,), fetch_one=True)
+        if row:
+            if row['cv_path']:
+                row['cv_path'] = os.path.join('..', row['cv_path'])
+            return ApplicationDetail(**row)
+        return None
+
     def get_applicant_profile_by_id(self, applicant_id: int) -> ApplicantProfile:
         """Retrieves an applicant profile by their ID."""
         query = "SELECT * FROM ApplicantProfile WHERE applicant_id = %s"
         params = (applicant_id,)
         row = self._execute_query(query, params, fetch_one=True)
-        for field in self.sensitive_data:
-            if row and field in row:
-                row[field] = self.encryptor.decrypt(row[field])
+        with telemetry.span("db.decrypt"):
+            for field in self.sensitive_data:
+                if row and field in row:
+                    row[field] = self.encryptor.decrypt(row[field])
         if row:
             return ApplicantProfile(**row)
         return None
@@ -196,3 +336,109 @@ class DatabaseManager:
         if row:
             return row['total']
         return 0
+
+    @staticmethod
+    def _cv_summary_statements(summaries: list[CVSummary], replace_all: bool) -> list[tuple[str, list[tuple]]]:
+        """
+        CVSummary statements for save_cv_profiles, the only writer of the table; with
+        replace_all every existing summary is dropped first.
+        """
+        query = """
+        REPLACE INTO CVSummary (detail_id, skills, job_history, education, experience_months)
+        VALUES (%s, %s, %s, %s, %s)
+        """
+        statements = [("DELETE FROM CVSummary", [])] if replace_all else []
+        statements.append((query, [summary.to_row() for summary in summaries]))
+        return statements
+
+    def get_cv_summary_by_detail_id(self, detail_id: int) -> CVSummary:
+        """Retrieves the precomputed summary of one CV, or None if it was never extracted."""
+        query = "SELECT * FROM CVSummary WHERE detail_id = %s"
+        row = self._execute_query(query, (detail_id,), fetch_one=True)
+        if row:
+            return CVSummary.from_row(row)
+        return None
+
+    def save_cv_profiles(self, summaries: list[CVSummary], replace_all: bool = False) -> bool:
+        """
+        Writes the CVSummary, CVSkill, CVJob and CVEducation rows of many summaries in one
+        transaction, so the experience_months the years filter reads never disagrees with
+        the profile tables. With replace_all every existing row is dropped first (a full
+        corpus rebuild); otherwise only the rows of the given details are replaced.
+        """
+        if not summaries:
+            return True
+        self._ensure_cv_tables()
+
+        statements = self._cv_summary_statements(summaries, replace_all)
+        tables = ("CVSkill", "CVJob", "CVEducation")
+        if replace_all:
+            statements.extend((f"DELETE FROM {table}", []) for table in tables)
+        else:
+            detail_ids = [(summary.detail_id,) for summary in summaries]
+            statements.extend((f"DELETE FROM {table} WHERE detail_id = %s", detail_ids) for table in tables)
+
+        skill_rows = [skill.to_row() for summary in summaries for skill in CVSkill.from_summary(summary)]
+        job_rows = [job.to_row() for summary in summaries for job in CVJob.from_summary(summary)]
+        education_rows = [education.to_row() for summary in summaries
+                          for education in CVEducation.from_summary(summary)]
+        if skill_rows:
+            # Collation may still fold two extracted spellings (accents, clipped text) into one key
+            statements.append(("INSERT IGNORE INTO CVSkill (detail_id, skill) VALUES (%s, %s)", skill_rows))
+        if job_rows:
+            statements.append(("""
+        INSERT INTO CVJob (detail_id, position, title, company, location, dates, start_month, end_month)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, job_rows))
+        if education_rows:
+            statements.append(("""
+        INSERT INTO CVEducation (detail_id, position, university, degree, degree_level, dates, gpa)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, education_rows))
+        return self._execute_transaction(statements)
+
+    def find_detail_ids_by_profile(self, skills: list[str] = None, companies: list[str] = None,
+                                   titles: list[str] = None, degree_levels: list[str] = None,
+                                   min_experience_months: int = None,
+                                   max_experience_months: int = None) -> set[int]:
+        """
+        Returns the detail_ids whose extracted profile satisfies every given criterion:
+        each skill is listed, some job's company / title and some degree level equals
+        one of the given values (case-insensitive), and the total experience lies within
+        the given bounds (CVs without parsed job dates never do). Returns None on a query error.
+        """
+        conditions = []
+        params = []
+        if min_experience_months is not None or max_experience_months is not None:
+            # Range scan on idx_cvsummary_experience
+            bounds = ["x.experience_months IS NOT NULL"]
+            if min_experience_months is not None:
+                bounds.append("x.experience_months >= %s")
+                params.append(min_experience_months)
+            if max_experience_months is not None:
+                bounds.append("x.experience_months <= %s")
+                params.append(max_experience_months)
+            conditions.append("EXISTS (SELECT 1 FROM CVSummary x WHERE x.detail_id = d.detail_id AND "
+                              + " AND ".join(bounds) + ")")
+        for skill in skills or []:
+            conditions.append("EXISTS (SELECT 1 FROM CVSkill s WHERE s.detail_id = d.detail_id AND s.skill = %s)")
+            params.append(skill)
+        for column, values in (("company", companies), ("title", titles)):
+            if values:
+                placeholders = ", ".join(["%s"] * len(values))
+                conditions.append(f"EXISTS (SELECT 1 FROM CVJob j WHERE j.detail_id = d.detail_id "
+                                  f"AND j.{column} IN ({placeholders}))")
+                params.extend(values)
+        if degree_levels:
+            placeholders = ", ".join(["%s"] * len(degree_levels))
+            conditions.append(f"EXISTS (SELECT 1 FROM CVEducation e WHERE e.detail_id = d.detail_id "
+                              f"AND e.degree_level IN ({placeholders}))")
+            params.extend(level.lower() for level in degree_levels)
+
+        query = "SELECT d.detail_id FROM ApplicationDetail d"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        rows = self._execute_query(query, tuple(params), fetch_all=True)
+        if rows is None:
+            return None
+        return {row['detail_id'] for row in rows}
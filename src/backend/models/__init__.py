@@ -1,5 +1,9 @@
 from .models import ApplicantProfile
 from .models import ApplicationDetail
+from .models import CVEducation
+from .models import CVJob
+from .models import CVSkill
+from .models import CVSummary
 
 
-__all__ = ["ApplicantProfile", "ApplicationDetail"]
\ No newline at end of file
+__all__ = ["ApplicantProfile", "ApplicationDetail", "CVEducation", "CVJob", "CVSkill", "CVSummary"]
\ No newline at end of file
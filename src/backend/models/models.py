@@ -1,4 +1,6 @@
 import datetime
+import json
+import re
 
 class ApplicantProfile:
     """
@@ -31,4 +33,216 @@ class ApplicationDetail:
         self.cv_path = cv_path
 
     def __repr__(self):
-        return f"ApplicationDetail(ID: {self.detail_id}, ApplicantID: {self.applicant_id}, Role: {self.application_role})"
\ No newline at end of file
+        return f"ApplicationDetail(ID: {self.detail_id}, ApplicantID: {self.applicant_id}, Role: {self.application_role})"
+
+class CVSummary:
+    """
+    Represents the structured information extracted from one CV at ingest time.
+    Corresponds to the CVSummary table in the database, where each field is stored as JSON.
+    experience_months is the total time covered by the parsed job date ranges (overlaps
+    counted once, "Present" meaning the month of ingest), or None if no range was parsed.
+    """
+    def __init__(self, detail_id: int = None, skills: list = None,
+                 job_history: tuple = None, education: dict = None, experience_months: int = None):
+        self.detail_id = detail_id  # PK, FK to ApplicationDetail
+        self.skills = skills if skills is not None else []
+        self.job_history = job_history
+        self.education = education if education is not None else {"entries": [], "full_text": ""}
+        self.experience_months = experience_months
+
+    @classmethod
+    def from_extracted_info(cls, detail_id: int, extracted_info: dict, current_month: int = None) -> "CVSummary":
+        summary = cls(detail_id, extracted_info["skills"], extracted_info["job_history"],
+                      extracted_info["education"])
+        summary.experience_months = CVJob.total_experience_months(
+            CVJob.from_summary(summary, current_month))
+        return summary
+
+    @property
+    def experience_years(self) -> float:
+        return None if self.experience_months is None else self.experience_months / 12
+
+    @classmethod
+    def from_row(cls, row: dict) -> "CVSummary":
+        job_history = json.loads(row["job_history"])
+        # JSON has no tuples; extract_job_history returns (content, format)
+        if isinstance(job_history, list) and len(job_history) == 2:
+            job_history = tuple(job_history)
+        return cls(row["detail_id"], json.loads(row["skills"]), job_history,
+                   json.loads(row["education"]), row.get("experience_months"))
+
+    def to_row(self) -> tuple:
+        return (self.detail_id, json.dumps(self.skills), json.dumps(self.job_history),
+                json.dumps(self.education), self.experience_months)
+
+    def as_extracted_info(self) -> dict:
+        return {
+            "skills": self.skills,
+            "job_history": self.job_history,
+            "education": self.education
+        }
+
+    def __repr__(self):
+        return f"CVSummary(DetailID: {self.detail_id}, Skills: {len(self.skills)})"
+
+
+def _clip(value, length: int):
+    """Trims extracted text to the width of its VARCHAR column."""
+    return value[:length] if isinstance(value, str) else value
+
+class CVSkill:
+    """
+    Represents one skill listed in a CV.
+    Corresponds to the CVSkill table, indexed by skill for "has skill X" filters.
+    """
+    def __init__(self, detail_id: int = None, skill: str = None):
+        self.detail_id = detail_id  # FK to ApplicationDetail
+        self.skill = _clip(skill, 255)
+
+    @classmethod
+    def from_summary(cls, summary: CVSummary) -> list["CVSkill"]:
+        # The column collation is case-insensitive, so "SQL" and "sql" are one skill
+        unique_skills = {skill.lower(): skill for skill in reversed(summary.skills)}
+        return [cls(summary.detail_id, skill) for skill in sorted(unique_skills.values())]
+
+    def to_row(self) -> tuple:
+        return (self.detail_id, self.skill)
+
+    def __repr__(self):
+        return f"CVSkill(DetailID: {self.detail_id}, Skill: {self.skill})"
+
+class CVJob:
+    """
+    Represents one position of a CV's job history, in the order it appears in the CV.
+    Corresponds to the CVJob table, indexed by title, company and period.
+    start_month and end_month are month indices (year * 12 + month - 1) parsed from
+    dates such as "Jan 2018 to Present", both inclusive, or None if dates did not parse.
+    """
+    MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+    DATE_RANGE_PATTERN = re.compile(
+        r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})\s*(?:to|-|\u2013)\s*"
+        r"(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})|(present|current|now))\b",
+        re.IGNORECASE)
+
+    def __init__(self, detail_id: int = None, position: int = 0, title: str = None,
+                 company: str = None, location: str = None, dates: str = None,
+                 start_month: int = None, end_month: int = None):
+        self.detail_id = detail_id  # FK to ApplicationDetail
+        self.position = position
+        self.title = _clip(title, 255)
+        self.company = _clip(company, 255)
+        self.location = _clip(location, 255)
+        self.dates = _clip(dates, 100)
+        self.start_month = start_month
+        self.end_month = end_month
+
+    @staticmethod
+    def current_month_index(today: datetime.date = None) -> int:
+        today = today or datetime.date.today()
+        return today.year * 12 + today.month - 1
+
+    @classmethod
+    def month_range(cls, dates: str, current_month: int = None) -> tuple[int, int]:
+        """
+        Parses "Mon YYYY to Mon YYYY" or "Mon YYYY to Present" into (start_month, end_month).
+        Returns None if dates has no such range or it ends before it starts.
+        """
+        match = cls.DATE_RANGE_PATTERN.search(dates or "")
+        if not match:
+            return None
+        start = int(match.group(2)) * 12 + cls.MONTHS.index(match.group(1).lower())
+        if match.group(5):
+            end = current_month if current_month is not None else cls.current_month_index()
+        else:
+            end = int(match.group(4)) * 12 + cls.MONTHS.index(match.group(3).lower())
+        if end < start:
+            return None
+        return start, end
+
+    @staticmethod
+    def total_experience_months(jobs: list["CVJob"]) -> int:
+        """Number of distinct months covered by the jobs' ranges, or None if none was parsed."""
+        periods = sorted((job.start_month, job.end_month) for job in jobs if job.start_month is not None)
+        if not periods:
+            return None
+        total = 0
+        merged_start, merged_end = periods[0]
+        for start, end in periods[1:]:
+            if start > merged_end + 1:
+                total += merged_end - merged_start + 1
+                merged_start, merged_end = start, end
+            else:
+                merged_end = max(merged_end, end)
+        return total + merged_end - merged_start + 1
+
+    @classmethod
+    def from_summary(cls, summary: CVSummary, current_month: int = None) -> list["CVJob"]:
+        # extract_job_history returns (raw section text, 'text') when no position was parsed
+        if not summary.job_history:
+            return []
+        jobs, job_format = summary.job_history
+        if job_format is not None or not jobs:
+            return []
+        if current_month is None:
+            current_month = cls.current_month_index()
+        cv_jobs = []
+        for position, job in enumerate(jobs):
+            start_month, end_month = cls.month_range(job["dates"], current_month) or (None, None)
+            cv_jobs.append(cls(summary.detail_id, position, job["title"], job["company"], job["location"],
+                               job["dates"], start_month, end_month))
+        return cv_jobs
+
+    def to_row(self) -> tuple:
+        return (self.detail_id, self.position, self.title, self.company, self.location, self.dates,
+                self.start_month, self.end_month)
+
+    def __repr__(self):
+        return f"CVJob(DetailID: {self.detail_id}, Title: {self.title}, Company: {self.company})"
+
+class CVEducation:
+    """
+    Represents one education entry of a CV.
+    Corresponds to the CVEducation table, indexed by degree level and university.
+    degree_level is the degree normalized to one of DEGREE_LEVELS, or None if unrecognized.
+    """
+    DEGREE_LEVELS = ("doctorate", "master", "bachelor", "associate", "diploma")
+    # Checked in DEGREE_LEVELS order, so "Masters toward PhD" counts as a doctorate
+    DEGREE_LEVEL_PATTERNS = (
+        ("doctorate", re.compile(r"\b(?:ph\.?\s?d|doctor(?:ate)?)", re.IGNORECASE)),
+        ("master", re.compile(r"\b(?:masters?|mba|m\.?sc?\.?|m\.a\.)\b", re.IGNORECASE)),
+        ("bachelor", re.compile(r"\b(?:bachelors?|b\.?sc?\.?|b\.a\.)\b", re.IGNORECASE)),
+        ("associate", re.compile(r"\bassociates?\b", re.IGNORECASE)),
+        ("diploma", re.compile(r"\b(?:diploma|ged|high school)\b", re.IGNORECASE)),
+    )
+
+    def __init__(self, detail_id: int = None, position: int = 0, university: str = None,
+                 degree: str = None, degree_level: str = None, dates: str = None, gpa: str = None):
+        self.detail_id = detail_id  # FK to ApplicationDetail
+        self.position = position
+        self.university = _clip(university, 255)
+        self.degree = _clip(degree, 255)
+        self.degree_level = degree_level
+        self.dates = _clip(dates, 100)
+        self.gpa = _clip(gpa, 20)
+
+    @classmethod
+    def degree_level_of(cls, degree: str) -> str:
+        if not degree:
+            return None
+        for level, pattern in cls.DEGREE_LEVEL_PATTERNS:
+            if pattern.search(degree):
+                return level
+        return None
+
+    @classmethod
+    def from_summary(cls, summary: CVSummary) -> list["CVEducation"]:
+        return [cls(summary.detail_id, position, entry["university"], entry["degree"],
+                    cls.degree_level_of(entry["degree"]), entry["dates"], entry["gpa"])
+                for position, entry in enumerate(summary.education.get("entries", []))]
+
+    def to_row(self) -> tuple:
+        return (self.detail_id, self.position, self.university, self.degree, self.degree_level,
+                self.dates, self.gpa)
+
+    def __repr__(self):
+        return f"CVEducation(DetailID: {self.detail_id}, Degree: {self.degree}, Level: {self.degree_level})"
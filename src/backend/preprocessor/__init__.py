@@ -1,4 +1,22 @@
-from .cv_processor import CVProcessor
-from .regex_extractor import RegexExtractor
+import importlib
 
-__all__ = ["CVProcessor", "RegexExtractor"]
\ No newline at end of file
+_LAZY_ATTRS = {
+    "CVProcessor": ".cv_processor",
+    "ParsedCV": ".regex_extractor",
+    "RegexExtractor": ".regex_extractor",
+}
+
+__all__ = ["CVProcessor", "ParsedCV", "RegexExtractor"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
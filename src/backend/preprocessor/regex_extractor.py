@@ -1,28 +1,158 @@
 import re
 
 
+class ParsedCV:
+    """
+    A CV text split into its logical sections exactly once.
+    Produced by RegexExtractor.parse and consumed by every extract_* method,
+    so extracting several fields from one CV scans the text a single time.
+    """
+
+    SECTION_HEADERS = [
+        'Summary', 'Highlights', 'Experience', 'Education', 'Skills',
+        'Certifications', 'Interests', 'Additional Information', 'Accomplishments',
+        'Profile', 'Overview', 'About Me', 'Introduction', 'Technical Skills',
+        'Key Skills', 'Core Competencies', 'Professional Experience',
+        'Work Experience', 'Academic Background', 'Professional Development', 'Education and Training',
+    ]
+
+    # A header is alone on its line: preceded only by whitespace since the last newline,
+    # and followed by whitespace and an optional colon up to a newline. The pattern only
+    # finds the header word; ParsedCV locates the end of the header line in one pass so
+    # no quantifier ever has to backtrack over a long whitespace run. The text is parsed
+    # with a newline prepended so a header on the very first line needs no special case.
+    SECTION_PATTERN = re.compile(
+        r'(?i)\n[^\S\n]*+(' + '|'.join(SECTION_HEADERS) + r')(?=[^\S\n]*+[:\n])'
+    )
+    WHITESPACE_PATTERN = re.compile(r'\s*')
+
+    # Lowercased header as matched -> standardized section name
+    HEADER_LOOKUP = {header.lower(): header for header in SECTION_HEADERS}
+
+    def __init__(self, text: str):
+        self.text = text
+        # Standardized section name -> content, and the (start, end) offsets of that content in text
+        self.sections = {}
+        self.offsets = {}
+
+        padded = "\n" + text
+        headers = []
+        for match in self.SECTION_PATTERN.finditer(padded):
+            content_start = self._header_line_end(padded, match.end())
+            if content_start != -1:
+                headers.append((match.group(1), match.start(), content_start))
+
+        if not headers:
+            self.sections['Main'] = text
+            self.offsets['Main'] = (0, len(text))
+            return
+
+        for i, (header_name_found, _, content_start) in enumerate(headers):
+            header_name_found = header_name_found.strip()
+            standardized_header = self.HEADER_LOOKUP.get(
+                header_name_found.lower(), header_name_found)
+
+            # Offsets in the padded text are one past those in text
+            start_index = content_start - 1
+            end_index = headers[i + 1][1] - 1 if i + 1 < len(headers) else len(text)
+
+            self.sections[standardized_header] = text[start_index:end_index].strip()
+            self.offsets[standardized_header] = (start_index, end_index)
+
+    @classmethod
+    def _header_line_end(cls, text: str, index: int) -> int:
+        """
+        Given the end of a header word, returns the position of the newline that ends
+        its header line (whitespace, an optional colon, whitespace), preferring the last
+        newline after the colon, or -1 if the header is not alone on its line.
+        """
+        whitespace_end = cls.WHITESPACE_PATTERN.match(text, index).end()
+        if whitespace_end < len(text) and text[whitespace_end] == ':':
+            colon_whitespace_end = cls.WHITESPACE_PATTERN.match(text, whitespace_end + 1).end()
+            line_end = text.rfind('\n', whitespace_end + 1, colon_whitespace_end)
+            if line_end != -1:
+                return line_end
+        return text.rfind('\n', index, whitespace_end)
+
+    def section(self, *names: str):
+        """
+        Returns the content of the first of names that is present and non-empty,
+        falling back like a chain of `sections.get(a) or sections.get(b)`.
+        """
+        content = None
+        for name in names:
+            content = self.sections.get(name)
+            if content:
+                return content
+        return content
+
+
 class RegexExtractor:
     """
     Extracts specific information from CV text using Regular Expressions.
     The extraction process first splits the CV into logical sections
     (e.g., Summary, Experience, Skills) and then applies specific regex
     patterns within those sections for more accurate parsing.
+    Every extract_* method accepts either raw text or a ParsedCV.
     """
 
-    def __init__(self):
+    # Job history and education lines are matched with the small patterns below plus a
+    # single left-to-right pass over runs of WORD_CHARS. Their results are identical to
+    # the original one-shot patterns (e.g. for job history
+    #   ([A-Z][a-zA-Z\s,&\.-]+(?:\s*Intern)?)\s*\n([A-Z][a-zA-Z\s,&\.-]+)\s*,\s*
+    #   ([A-Z][a-zA-Z\s,&\.-]+)\s+([A-Z][a-zA-Z\s,&\.-]+)\s*/\s*(<dates>)
+    # ), but those nested overlapping classes backtracked polynomially on long malformed
+    # lines, while every pattern here runs in time linear in the line length.
+    MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+    DEGREES = r'(?:Associate|Associates|Bachelors|Masters|PhD|Degree|Diploma)'
+    WORD_CHARS = r'[a-zA-Z\s,&\.-]'
+
+    # Runs of title/place characters (case-sensitive for job history, insensitive for education)
+    JOB_WORD_RUN_PATTERN = re.compile(WORD_CHARS + r'+')
+    JOB_DATES_PATTERN = re.compile(
+        r'/\s*(' + MONTHS + r'\s+\d{4}\s*to\s*(?:' + MONTHS + r'\s+\d{4}|Present))')
+    EDUCATION_WORD_RUN_PATTERN = re.compile(WORD_CHARS + r'+', re.IGNORECASE)
+    EDUCATION_LETTER_PATTERN = re.compile(r'[A-Z]', re.IGNORECASE)
+    # "<university> 2012 Bachelors: Field ... GPA: 3.5", matched from the year onwards
+    EDUCATION_YEAR_DEGREE_PATTERN = re.compile(
+        r'(\d{4})\s+(' + DEGREES + r':\s*[A-Z]' + WORD_CHARS + r'+)', re.IGNORECASE)
+    # "2012 Bachelors: Field University", matched up to the first letter of the field
+    EDUCATION_YEAR_DEGREE_PREFIX_PATTERN = re.compile(
+        r'(\d{4})\s+(' + DEGREES + r':\s*[A-Z])', re.IGNORECASE)
+    EDUCATION_GPA_PATTERN = re.compile(r'.*GPA:\s*([\d\.]+)', re.IGNORECASE)
+    # "Attended <university>, major <field> ... toward <degree>"
+    EDUCATION_ATTENDED_PATTERN = re.compile(r'Attended\s+', re.IGNORECASE)
+    EDUCATION_MAJOR_PATTERN = re.compile(r'\s*major\s+([A-Z])' + WORD_CHARS, re.IGNORECASE)
+    EDUCATION_TOWARD_PATTERN = re.compile(
+        r'.*toward\s+([A-Z]' + WORD_CHARS + r'+)', re.IGNORECASE)
+
+    WHITESPACE_PATTERN = re.compile(r'\s*')
+    # A whitespace run containing a newline, matched only from the start of the run
+    WHITESPACE_NEWLINE_PATTERN = re.compile(r'(?<![^\S\n])[^\S\n]*+\n\s*')
+    SKILL_SEPARATOR_PATTERN = re.compile(r'[,;\n\t\r-]\s*')
+    JOB_BLOCK_SEPARATOR_PATTERN = re.compile(r'\n{2,}')
+    EDUCATION_SKIP_PATTERN = re.compile(
+        r'\b(wk|hrs|school|training|professional)\b', re.IGNORECASE)
+    KNOWN_UNIVERSITY_PATTERN = re.compile(r'(Northern Maine Community College|Husson College)')
 
-        self.section_headers = [
-            'Summary', 'Highlights', 'Experience', 'Education', 'Skills',
-            'Certifications', 'Interests', 'Additional Information', 'Accomplishments',
-            'Profile', 'Overview', 'About Me', 'Introduction', 'Technical Skills',
-            'Key Skills', 'Core Competencies', 'Professional Experience',
-            'Work Experience', 'Academic Background', 'Professional Development', 'Education and Training',
-        ]
+    def __init__(self):
+        self.section_headers = ParsedCV.SECTION_HEADERS
+        self.section_pattern = ParsedCV.SECTION_PATTERN
+        self._last_parsed = None
 
-        self.section_pattern = re.compile(
-            r'(?i)(?:^|\n)\s*(' + '|'.join(self.section_headers) + r')\s*:?\s*\n',
-            re.MULTILINE
-        )
+    def parse(self, text: str | ParsedCV) -> ParsedCV:
+        """
+        Splits text into sections, reusing the previous result when the same
+        text is passed again (the summary page asks for several fields in a row).
+        """
+        if isinstance(text, ParsedCV):
+            return text
+        last_parsed = self._last_parsed
+        if last_parsed is not None and last_parsed.text is text:
+            return last_parsed
+        parsed = ParsedCV(text)
+        self._last_parsed = parsed
+        return parsed
 
     def _split_into_sections(self, text: str) -> dict:
         """
@@ -30,68 +160,164 @@ class RegexExtractor:
         Keys are standardized section names (e.g., 'Summary', 'Experience'),
         values are their extracted content.
         """
-        sections = {}
-
-        matches = list(self.section_pattern.finditer(text))
-
-        if not matches:
-
-            sections['Main'] = text
-            return sections
-
-        for i, match in enumerate(matches):
-            header_name_found = match.group(1).strip()
-
-            standardized_header = next(
-                (h for h in self.section_headers if h.lower()
-                 == header_name_found.lower()),
-                header_name_found
-            )
-
-            start_index = match.end()
+        return dict(self.parse(text).sections)
 
-            end_index = matches[i+1].start() if i + \
-                1 < len(matches) else len(text)
-
-            content = text[start_index:end_index].strip()
-            sections[standardized_header] = content
-        return sections
-
-    def extract_summary(self, text: str) -> str:
+    def _match_job_general_info(self, block: str) -> tuple | None:
+        """
+        Finds the "Title\nCity , State Company / Mon YYYY to Mon YYYY" header of a job.
+        Returns (title, city, state, company, dates) unstripped, or None.
+        Every part before the slash lies in one run of word characters, so each run that
+        ends in a slash followed by dates is resolved right-to-left in a single pass.
+        """
+        for run in self.JOB_WORD_RUN_PATTERN.finditer(block):
+            run_start, slash = run.span()
+            dates = self.JOB_DATES_PATTERN.match(block, slash)
+            if not dates:
+                continue
+
+            # Company: from the last capital that follows whitespace (at least 2 chars) to the slash
+            company_start = -1
+            for i in range(slash - 2, run_start, -1):
+                if 'A' <= block[i] <= 'Z' and block[i - 1].isspace():
+                    company_start = i
+                    break
+            if company_start == -1:
+                continue
+
+            # City ends at the last comma followed by whitespace and a state that leaves
+            # room for at least two characters before the company's whitespace
+            city_end = state_start = -1
+            comma = block.rfind(',', run_start, company_start)
+            while comma != -1:
+                after_comma = self.WHITESPACE_PATTERN.match(block, comma + 1).end()
+                if after_comma <= company_start - 3 and 'A' <= block[after_comma] <= 'Z':
+                    city_end, state_start = comma, after_comma
+                    break
+                comma = block.rfind(',', run_start, comma)
+            if city_end == -1:
+                continue
+
+            # Title ends at the last newline directly followed by a capital, leaving the city 2+ chars
+            city_start = -1
+            newline = block.rfind('\n', run_start, max(run_start, city_end - 2))
+            while newline != -1:
+                if 'A' <= block[newline + 1] <= 'Z':
+                    city_start = newline + 1
+                    break
+                newline = block.rfind('\n', run_start, newline)
+            if city_start == -1:
+                continue
+
+            # The match starts at the first capital leaving the title 2+ chars
+            for title_start in range(run_start, city_start - 2):
+                if 'A' <= block[title_start] <= 'Z':
+                    return (block[title_start:city_start - 1], block[city_start:city_end],
+                            block[state_start:company_start - 1], block[company_start:slash],
+                            dates.group(1))
+        return None
+
+    def _match_education_university_first(self, line: str) -> tuple | None:
+        """
+        Matches "<University> <YYYY> <Degree>: <Field> ... GPA: <gpa>".
+        Returns (university, year, degree, gpa) unstripped, or None.
+        """
+        for run in self.EDUCATION_WORD_RUN_PATTERN.finditer(line):
+            run_start, run_end = run.span()
+            # The university is followed by whitespace and the year ends the run
+            if not line[run_end - 1].isspace():
+                continue
+            year_degree = self.EDUCATION_YEAR_DEGREE_PATTERN.match(line, run_end)
+            if not year_degree:
+                continue
+            whitespace_start = run_end
+            while whitespace_start > run_start and line[whitespace_start - 1].isspace():
+                whitespace_start -= 1
+            for start in range(run_start, run_end - 2):
+                if self.EDUCATION_LETTER_PATTERN.match(line, start):
+                    university_end = max(whitespace_start, start + 2)
+                    gpa = self.EDUCATION_GPA_PATTERN.match(line, year_degree.end())
+                    return (line[start:university_end], year_degree.group(1),
+                            year_degree.group(2), gpa.group(1) if gpa else None)
+        return None
+
+    def _match_education_date_first(self, line: str) -> tuple | None:
+        """
+        Matches "<YYYY> <Degree>: <Field> <University>".
+        The field is the shortest run of words followed by whitespace and a further
+        word of 2+ characters; only the first two characters of that word are kept.
+        Returns (year, degree, university, gpa) unstripped, or None.
+        """
+        position = 0
+        while True:
+            prefix = self.EDUCATION_YEAR_DEGREE_PREFIX_PATTERN.search(line, position)
+            if not prefix:
+                return None
+            run_end = self.EDUCATION_WORD_RUN_PATTERN.match(line, prefix.end() - 1).end()
+            i = prefix.end() + 1
+            while i < run_end:
+                if not line[i].isspace():
+                    i += 1
+                    continue
+                word_start = self.WHITESPACE_PATTERN.match(line, i).end()
+                if word_start + 1 < run_end and self.EDUCATION_LETTER_PATTERN.match(line, word_start):
+                    gpa = self.EDUCATION_GPA_PATTERN.match(line, word_start + 2)
+                    return (prefix.group(1), line[prefix.start(2):i],
+                            line[word_start:word_start + 2], gpa.group(1) if gpa else None)
+                i = word_start
+            position = prefix.start() + 1
+
+    def _match_education_attended(self, line: str) -> tuple | None:
+        """
+        Matches "Attended <University>, major <Field> ... toward <Degree>".
+        Returns (university, field, degree) unstripped (degree may be None), or None.
+        """
+        for run in self.EDUCATION_WORD_RUN_PATTERN.finditer(line):
+            run_start, run_end = run.span()
+            # The university runs up to the last comma in the run that is followed by "major <Field>"
+            comma = major = None
+            for attended in self.EDUCATION_ATTENDED_PATTERN.finditer(line, run_start, run_end):
+                university_start = attended.end()
+                if not self.EDUCATION_LETTER_PATTERN.match(line, university_start):
+                    continue
+                if comma is None:
+                    comma = line.rfind(',', university_start, run_end)
+                    while comma != -1:
+                        major = self.EDUCATION_MAJOR_PATTERN.match(line, comma + 1)
+                        if major:
+                            break
+                        comma = line.rfind(',', university_start, comma)
+                if comma >= university_start + 2:
+                    toward = self.EDUCATION_TOWARD_PATTERN.match(line, run_end)
+                    return (line[university_start:comma], line[major.start(1):run_end],
+                            toward.group(1) if toward else None)
+        return None
+
+    def extract_summary(self, text: str | ParsedCV) -> str:
         """
         Extracts a general summary/overview from the CV text.
         It first splits the text into sections and then looks for the summary section.
         """
-        sections = self._split_into_sections(text)
-
-        summary_section_content = sections.get('Summary') or \
-            sections.get('Profile') or \
-            sections.get('Overview') or \
-            sections.get('About Me') or \
-            sections.get('Introduction')
+        summary_section_content = self.parse(text).section(
+            'Summary', 'Profile', 'Overview', 'About Me', 'Introduction')
 
         if summary_section_content:
 
-            summary = re.sub(r'\s*\n\s*', ' ', summary_section_content).strip()
+            summary = self.WHITESPACE_NEWLINE_PATTERN.sub(' ', summary_section_content).strip()
 
             return summary[:500] + "..." if len(summary) > 500 else summary
         return "Summary not found."
 
-    def extract_skills(self, text: str) -> list[str]:
+    def extract_skills(self, text: str | ParsedCV) -> list[str]:
         """
         Extracts a list of skills from the CV text.
         It first splits the text into sections and then looks for the skills section.
         """
-        sections = self._split_into_sections(text)
-
-        skills_section_content = sections.get('Skills') or \
-            sections.get('Technical Skills') or \
-            sections.get('Key Skills') or \
-            sections.get('Core Competencies')
+        skills_section_content = self.parse(text).section(
+            'Skills', 'Technical Skills', 'Key Skills', 'Core Competencies')
 
         if skills_section_content:
 
-            skills = re.split(r'[,;\n\t\r-]\s*', skills_section_content)
+            skills = self.SKILL_SEPARATOR_PATTERN.split(skills_section_content)
 
             skills = [s.strip() for s in skills if s.strip()]
 
@@ -99,49 +325,34 @@ class RegexExtractor:
             return list(set(skills))
         return []
 
-    def extract_job_history(self, text: str) -> list[dict]:
+    def extract_job_history(self, text: str | ParsedCV) -> list[dict]:
         """
         Extracts job history (e.g., dates, titles, locations, companies).
         It processes the experience section by splitting into blocks and
         extracting "general" job information from even-indexed blocks.
         """
-        sections = self._split_into_sections(text)
-
-        experience_section_content = sections.get('Experience') or \
-            sections.get('Professional Experience') or \
-            sections.get('Work Experience')
+        experience_section_content = self.parse(text).section(
+            'Experience', 'Professional Experience', 'Work Experience')
 
         job_history = []
         if experience_section_content:
 
-            job_blocks = re.split(
-                r'\n{2,}', experience_section_content.strip())
+            job_blocks = self.JOB_BLOCK_SEPARATOR_PATTERN.split(
+                experience_section_content.strip())
 
             for i in range(0, len(job_blocks), 2):
                 general_info_block = job_blocks[i].strip()
 
-                general_pattern = re.compile(
-                    r'([A-Z][a-zA-Z\s,&\.-]+(?:\s*Intern)?)\s*\n'
-                    r'([A-Z][a-zA-Z\s,&\.-]+)\s*,\s*'
-                    r'([A-Z][a-zA-Z\s,&\.-]+)\s+'
-                    r'([A-Z][a-zA-Z\s,&\.-]+)\s*/\s*'
-                    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*to\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}|Present))'
-                )
-
-                match = general_pattern.search(general_info_block)
+                match = self._match_job_general_info(general_info_block)
                 if match:
-                    title = match.group(1).strip()
-                    city = match.group(2).strip()
-                    state = match.group(3).strip()
-                    company = match.group(4).strip()
-                    dates = match.group(5).strip()
+                    title, city, state, company, dates = (part.strip() for part in match)
 
                     description = ""
                     if i + 1 < len(job_blocks):
                         description = job_blocks[i+1].strip()
 
-                        description = re.sub(
-                            r'\s*\n\s*', ' ', description).strip()
+                        description = self.WHITESPACE_NEWLINE_PATTERN.sub(
+                            ' ', description).strip()
 
                     job_history.append({
                         "title": title,
@@ -155,23 +366,21 @@ class RegexExtractor:
         
         return job_history, None
 
-    def extract_education(self, text: str) -> dict:
+    def extract_education(self, text: str | ParsedCV) -> dict:
         """
         Extracts education history (e.g., dates, university, degree) and the full raw text of the education section.
         It first splits the text into sections and then processes the education section.
         Returns a dictionary containing 'entries' (list of dicts) and 'full_text' (str).
         """
-        sections = self._split_into_sections(text)
-    
-        education_section_content = sections.get(
-            'Education') or sections.get('Academic Background') or sections.get('Education and Training')
+        education_section_content = self.parse(text).section(
+            'Education', 'Academic Background', 'Education and Training')
 
         education_entries = []
         if education_section_content:
 
             edu_lines = [
                 line.strip() for line in education_section_content.split('\n')
-                if line.strip() and not re.search(r'\b(wk|hrs|school|training|professional)\b', line, re.IGNORECASE)
+                if line.strip() and not self.EDUCATION_SKIP_PATTERN.search(line)
             ]
 
             for line in edu_lines:
@@ -180,47 +389,35 @@ class RegexExtractor:
                 dates = None
                 gpa = None
 
-                match1 = re.search(
-                    r'([A-Z][a-zA-Z\s,&\.-]+?)\s+(\d{4})\s+((?:Associate|Associates|Bachelors|Masters|PhD|Degree|Diploma):\s*[A-Z][a-zA-Z\s,&\.-]+)(?:.*GPA:\s*([\d\.]+))?',
-                    line, re.IGNORECASE
-                )
+                match1 = self._match_education_university_first(line)
                 if match1:
-                    university = match1.group(1).strip()
-                    dates = match1.group(2).strip()
-                    degree = match1.group(3).strip()
-                    gpa = match1.group(4).strip() if match1.group(4) else None
+                    university = match1[0].strip()
+                    dates = match1[1].strip()
+                    degree = match1[2].strip()
+                    gpa = match1[3].strip() if match1[3] else None
                 else:
 
-                    match2 = re.search(
-                        r'(\d{4})\s+((?:Associate|Associates|Bachelors|Masters|PhD|Degree|Diploma):\s*[A-Z][a-zA-Z\s,&\.-]+?)\s+([A-Z][a-zA-Z\s,&\.-]+?)(?:.*GPA:\s*([\d\.]+))?',
-                        line, re.IGNORECASE
-                    )
+                    match2 = self._match_education_date_first(line)
                     if match2:
-                        dates = match2.group(1).strip()
-                        degree = match2.group(2).strip()
-                        university = match2.group(3).strip()
-                        gpa = match2.group(4).strip(
-                        ) if match2.group(4) else None
+                        dates = match2[0].strip()
+                        degree = match2[1].strip()
+                        university = match2[2].strip()
+                        gpa = match2[3].strip() if match2[3] else None
 
                         if university and ('City, State' in university or 'USA' in university):
 
-                            uni_match_in_line = re.search(
-                                r'(Northern Maine Community College|Husson College)', line)
+                            uni_match_in_line = self.KNOWN_UNIVERSITY_PATTERN.search(line)
                             if uni_match_in_line:
                                 university = uni_match_in_line.group(1)
                             else:
                                 university = None
                     else:
 
-                        match3 = re.search(
-                            r'(?i)Attended\s+([A-Z][a-zA-Z\s,&\.-]+),\s*major\s+([A-Z][a-zA-Z\s,&\.-]+)(?:.*toward\s+([A-Z][a-zA-Z\s,&\.-]+))?',
-                            line, re.IGNORECASE
-                        )
+                        match3 = self._match_education_attended(line)
                         if match3:
-                            university = match3.group(1).strip()
-                            major = match3.group(2).strip()
-                            degree_type_suffix = match3.group(
-                                3).strip() if match3.group(3) else ""
+                            university = match3[0].strip()
+                            major = match3[1].strip()
+                            degree_type_suffix = match3[2].strip() if match3[2] else ""
                             degree = f"{major} {degree_type_suffix}".strip()
                             dates = "Not specified"
 
@@ -236,3 +433,16 @@ class RegexExtractor:
             "entries": education_entries,
             "full_text": education_section_content if education_section_content else ""
         }
+
+    def extract_cv_summary(self, text: str | ParsedCV) -> dict:
+        """
+        Runs every extractor used by the summary page on one CV text,
+        splitting it into sections only once.
+        Returns the 'extracted_info' part of a CV summary.
+        """
+        parsed = self.parse(text)
+        return {
+            "skills": self.extract_skills(parsed),
+            "job_history": self.extract_job_history(parsed),
+            "education": self.extract_education(parsed)
+        }
@@ -1,5 +1,23 @@
+from .bm25 import BM25Scorer
+from .cv_corpus import CVCorpus
+from .doc_bitmap import DocBitmap
+from .inverted_index import InvertedIndex
+from .query_evaluator import QueryEvaluator
+from .query_parser import QueryNode, QuerySyntaxError, parse_query
 from .search_service import SearchService
+from .search_stream import SearchStream
+from .versioned_cache import CorpusVersionedCache
 
 __all__ = [
+    "BM25Scorer",
+    "CorpusVersionedCache",
+    "CVCorpus",
+    "DocBitmap",
+    "InvertedIndex",
+    "QueryEvaluator",
+    "QueryNode",
+    "QuerySyntaxError",
     "SearchService",
+    "SearchStream",
+    "parse_query",
 ]
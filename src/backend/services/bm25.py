@@ -0,0 +1,35 @@
+import math
+
+
+class BM25Scorer:
+    """
+    Okapi BM25 from precomputed corpus statistics: the number of documents, the
+    average document length (both known once the corpus is loaded) and each term's
+    document frequency, which the caller takes from the matches or posting lists it
+    already has. Scoring a document therefore needs only its own term frequencies
+    and length, never another pass over the corpus.
+
+        score = sum over terms of idf(df) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+
+    with the non-negative idf log(1 + (N - df + 0.5) / (df + 0.5)).
+    """
+
+    def __init__(self, doc_count: int, average_length: float, k1: float = 1.2, b: float = 0.75):
+        self.doc_count = doc_count
+        self.average_length = average_length
+        self.k1 = k1
+        self.b = b
+
+    def idf(self, document_frequency: int) -> float:
+        return math.log(1 + (self.doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def weight(self, term_frequency: float, doc_length: int) -> float:
+        """The tf part of one term's score: saturates in tf and is damped for long documents."""
+        if not term_frequency:
+            return 0.0
+        relative_length = doc_length / self.average_length if self.average_length else 1.0
+        norm = self.k1 * (1 - self.b + self.b * relative_length)
+        return term_frequency * (self.k1 + 1) / (term_frequency + norm)
+
+    def score(self, term_frequency: float, idf: float, doc_length: int) -> float:
+        return idf * self.weight(term_frequency, doc_length)
@@ -0,0 +1,97 @@
+import threading
+
+
+class CVCorpus:
+    """
+    Thread-safe in-memory store of extracted CV texts.
+    Filled incrementally by the background loader while searches read
+    consistent snapshots of whatever portion has been loaded so far.
+    Every CV gets a dense integer doc id, its position in load order, which is
+    also its index in items() and versioned_items(); document sets such as
+    DocBitmap hold these ids instead of cv_path strings.
+    """
+
+    PHASE_IDLE = "idle"
+    PHASE_CONNECTING = "connecting"
+    PHASE_SEEDING = "seeding"
+    PHASE_LOADING = "loading"
+    PHASE_READY = "ready"
+    PHASE_FAILED = "failed"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._texts = {}
+        self._doc_ids = {}
+        self.expected_total = 0
+        # Bumped on every change so caches keyed on it invalidate themselves
+        self.version = 0
+        # Version of the last change that was not an append (reset, replace_all, a loaded
+        # CV added again); from it on, each snapshot extends the previous one
+        self.base_version = 0
+        self.phase = self.PHASE_IDLE
+        self.ready_event = threading.Event()
+
+    def set_phase(self, phase: str):
+        self.phase = phase
+        if phase in (self.PHASE_READY, self.PHASE_FAILED):
+            self.ready_event.set()
+        else:
+            self.ready_event.clear()
+
+    def reset(self, expected_total: int = 0):
+        """Drops all loaded texts and prepares for a new load of expected_total CVs."""
+        with self._lock:
+            self._texts = {}
+            self._doc_ids = {}
+            self.expected_total = expected_total
+            self.version += 1
+            self.base_version = self.version
+
+    def add(self, cv_path: str, text: str):
+        """Adds one extracted CV. Safe to call from the loader thread."""
+        with self._lock:
+            appended = cv_path not in self._texts
+            if appended:
+                self._doc_ids[cv_path] = len(self._doc_ids)
+            self._texts[cv_path] = text
+            self.version += 1
+            if not appended:
+                self.base_version = self.version
+
+    def replace_all(self, texts: dict[str, str]):
+        with self._lock:
+            self._texts = dict(texts)
+            self._doc_ids = {cv_path: doc_id for doc_id, cv_path in enumerate(self._texts)}
+            self.expected_total = len(self._texts)
+            self.version += 1
+            self.base_version = self.version
+
+    def items(self) -> list[tuple[str, str]]:
+        """Returns a snapshot list of (cv_path, text) in load order."""
+        with self._lock:
+            return list(self._texts.items())
+
+    def versioned_items(self) -> tuple[int, list[tuple[str, str]]]:
+        """Returns (version, items) taken atomically."""
+        with self._lock:
+            return self.version, list(self._texts.items())
+
+    def get(self, cv_path: str) -> str | None:
+        """Returns the loaded text of one CV, or None if it is not loaded (yet)."""
+        with self._lock:
+            return self._texts.get(cv_path)
+
+    def doc_id(self, cv_path: str) -> int | None:
+        """Returns the dense doc id of a loaded CV, or None if it is not loaded (yet)."""
+        return self._doc_ids.get(cv_path)
+
+    def as_dict(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._texts)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @property
+    def is_loading(self) -> bool:
+        return not self.ready_event.is_set() and self.phase != self.PHASE_IDLE
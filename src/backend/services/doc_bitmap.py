@@ -0,0 +1,203 @@
+from array import array
+from itertools import compress
+
+
+class DocBitmap:
+    """
+    Immutable compressed set of dense document ids (see CVCorpus.doc_id), in the
+    style of a Roaring bitmap. Ids are split by their high 16 bits into chunks of
+    65536; each chunk is stored as
+
+      - a sorted array('H') of the low 16 bits while it holds at most ARRAY_MAX ids, or
+      - a Python int used as a 65536-bit bitset once it is denser than that,
+
+    so sparse sets stay small and dense ones are combined word-wise in C.
+    AND, OR, ANDNOT and cardinality touch only the chunks involved. Results of
+    combining two bitsets stay bitsets: turning one back into an array costs a
+    pass over the whole chunk, more than the operations it would speed up.
+    """
+
+    CHUNK_BITS = 16
+    CHUNK_SIZE = 1 << CHUNK_BITS
+    LOW_MASK = CHUNK_SIZE - 1
+    # Roaring switches at 4096 ids, where an array (2 bytes per id) outgrows a bitset (8 KB).
+    # Array operations here cost a Python step per id while bitset operations run in C,
+    # so chunks become bitsets earlier, trading at most 4x memory for speed.
+    ARRAY_MAX = 1024
+    # Turns the '0'/'1' digits of bin() into 0/1 bytes usable as itertools.compress selectors
+    BIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+    __slots__ = ("_chunks", "_cardinality")
+
+    def __init__(self, chunks: dict | None = None):
+        # high 16 bits -> array('H') or int; never holds empty containers
+        self._chunks = chunks or {}
+        self._cardinality = None
+
+    @classmethod
+    def from_sorted(cls, doc_ids) -> "DocBitmap":
+        """Builds a bitmap from ascending, duplicate-free doc ids (e.g. an array('I') of positions)."""
+        chunks = {}
+        high = None
+        lows = None
+        for doc_id in doc_ids:
+            if doc_id >> cls.CHUNK_BITS != high:
+                if lows:
+                    chunks[high] = cls._container(lows)
+                high = doc_id >> cls.CHUNK_BITS
+                lows = array('H')
+            lows.append(doc_id & cls.LOW_MASK)
+        if lows:
+            chunks[high] = cls._container(lows)
+        return cls(chunks)
+
+    @classmethod
+    def from_iterable(cls, doc_ids) -> "DocBitmap":
+        return cls.from_sorted(sorted(set(doc_ids)))
+
+    @classmethod
+    def full(cls, size: int) -> "DocBitmap":
+        """Bitmap of every doc id in range(size)."""
+        chunks = {}
+        for high in range(0, (size + cls.LOW_MASK) >> cls.CHUNK_BITS):
+            count = min(cls.CHUNK_SIZE, size - (high << cls.CHUNK_BITS))
+            chunks[high] = (1 << count) - 1 if count > cls.ARRAY_MAX else array('H', range(count))
+        return cls(chunks)
+
+    @classmethod
+    def _container(cls, lows: array):
+        return lows if len(lows) <= cls.ARRAY_MAX else cls._to_bitset(lows)
+
+    @staticmethod
+    def _to_bitset(lows) -> int:
+        bits = bytearray(DocBitmap.CHUNK_SIZE >> 3)
+        for low in lows:
+            bits[low >> 3] |= 1 << (low & 7)
+        return int.from_bytes(bits, "little")
+
+    @classmethod
+    def _bitset_ids(cls, bitset: int, base: int) -> list[int]:
+        """The ids base + bit of every set bit, ascending, without a Python-level loop per bit."""
+        flags = bin(bitset)[:1:-1].encode("ascii").translate(cls.BIT_FLAGS)
+        return list(compress(range(base, base + len(flags)), flags))
+
+    @classmethod
+    def _bitset_bytes(cls, bitset: int) -> bytes:
+        # Testing bits on the bytes avoids shifting the whole 8 KB int per lookup
+        return bitset.to_bytes(cls.CHUNK_SIZE >> 3, "little")
+
+    @classmethod
+    def _and(cls, a, b):
+        if isinstance(a, int):
+            if isinstance(b, int):
+                return a & b
+            a, b = b, a
+        if isinstance(b, int):
+            data = cls._bitset_bytes(b)
+            return array('H', [low for low in a if data[low >> 3] >> (low & 7) & 1])
+        if len(a) > len(b):
+            a, b = b, a
+        other = set(b)
+        return array('H', [low for low in a if low in other])
+
+    @classmethod
+    def _or(cls, a, b):
+        if isinstance(a, int) or isinstance(b, int):
+            a = a if isinstance(a, int) else cls._to_bitset(a)
+            b = b if isinstance(b, int) else cls._to_bitset(b)
+            return a | b
+        return cls._container(array('H', sorted(set(a).union(b))))
+
+    @classmethod
+    def _andnot(cls, a, b):
+        if isinstance(a, int):
+            return a & ~(b if isinstance(b, int) else cls._to_bitset(b))
+        if isinstance(b, int):
+            data = cls._bitset_bytes(b)
+            return array('H', [low for low in a if not data[low >> 3] >> (low & 7) & 1])
+        other = set(b)
+        return array('H', [low for low in a if low not in other])
+
+    def __and__(self, other: "DocBitmap") -> "DocBitmap":
+        chunks = {}
+        small, large = sorted((self._chunks, other._chunks), key=len)
+        for high, container in small.items():
+            other_container = large.get(high)
+            if other_container is not None:
+                result = self._and(container, other_container)
+                if result:
+                    chunks[high] = result
+        return DocBitmap(chunks)
+
+    def __or__(self, other: "DocBitmap") -> "DocBitmap":
+        chunks = dict(self._chunks)
+        for high, container in other._chunks.items():
+            own = chunks.get(high)
+            chunks[high] = container if own is None else self._or(own, container)
+        return DocBitmap(chunks)
+
+    def __sub__(self, other: "DocBitmap") -> "DocBitmap":
+        """ANDNOT: the ids of self that are not in other."""
+        chunks = {}
+        for high, container in self._chunks.items():
+            other_container = other._chunks.get(high)
+            result = container if other_container is None else self._andnot(container, other_container)
+            if result:
+                chunks[high] = result
+        return DocBitmap(chunks)
+
+    def and_not(self, other: "DocBitmap") -> "DocBitmap":
+        return self - other
+
+    @classmethod
+    def union_all(cls, bitmaps) -> "DocBitmap":
+        result = cls()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
+
+    def __len__(self) -> int:
+        if self._cardinality is None:
+            self._cardinality = sum(container.bit_count() if isinstance(container, int) else len(container)
+                                    for container in self._chunks.values())
+        return self._cardinality
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __contains__(self, doc_id: int) -> bool:
+        container = self._chunks.get(doc_id >> self.CHUNK_BITS)
+        if container is None:
+            return False
+        low = doc_id & self.LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        return low in container
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DocBitmap) and self.to_array() == other.to_array()
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def to_array(self) -> array:
+        """All doc ids in ascending order as an array('I')."""
+        doc_ids = array('I')
+        for high in sorted(self._chunks):
+            container = self._chunks[high]
+            base = high << self.CHUNK_BITS
+            if isinstance(container, int):
+                doc_ids.extend(array('I', self._bitset_ids(container, base)))
+            elif base:
+                doc_ids.extend(array('I', [base + low for low in container]))
+            else:
+                doc_ids.extend(array('I', container.tolist()))
+        return doc_ids
+
+    def memory_bytes(self) -> int:
+        """Approximate payload size of the containers."""
+        return sum(self.CHUNK_SIZE >> 3 if isinstance(container, int) else 2 * len(container)
+                   for container in self._chunks.values())
+
+    def __repr__(self):
+        return f"DocBitmap(cardinality={len(self)}, chunks={len(self._chunks)})"
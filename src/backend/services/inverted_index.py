@@ -0,0 +1,289 @@
+import re
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+
+from .doc_bitmap import DocBitmap
+
+
+def encode_positions(positions: list[int]) -> bytes:
+    """
+    Ascending token positions as varints (7 bits per byte, high bit set on all but the
+    last byte of a value): the first position, then the gap to each next one. Gaps
+    between repeats of a word are mostly under 128, so usually one byte each.
+    """
+    deltas = [positions[0]]
+    deltas.extend(b - a for a, b in zip(positions, positions[1:]))
+    if max(deltas) < 0x80:
+        return bytes(deltas)
+    encoded = bytearray()
+    for value in deltas:
+        while value >= 0x80:
+            encoded.append(value & 0x7F | 0x80)
+            value >>= 7
+        encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_positions(data: bytes) -> list[int]:
+    """Inverse of encode_positions."""
+    if data.isascii():
+        # Every value fits in one byte, so the bytes are the gaps themselves
+        return list(accumulate(data))
+    deltas = []
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            deltas.append(value)
+            value = 0
+            shift = 0
+    return list(accumulate(deltas))
+
+
+class InvertedIndex:
+    """
+    Positional token index over a corpus snapshot, extended as CVs are added.
+    Tokens are the lowercase \\w+ runs of a CV (the same words the fuzzy stage compares
+    against). Each term keeps its ascending doc ids (positions in the snapshot, see
+    CVCorpus.doc_id), in-document frequencies, and the token positions of every
+    occurrence, delta + varint encoded in one byte string per term with an offset per
+    document. Phrases and NEAR/k are answered by intersecting positions, so a boolean
+    query touches posting lists instead of CV texts.
+
+    extend() appends documents while other threads read: a document's positions and
+    frequency are written before its doc id, so a reader that finds a doc id can always
+    decode it, and readers holding an older snapshot ignore doc ids beyond it. Only one
+    thread may extend at a time.
+    """
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+    # A 'prefix*' term matching more than this many vocabulary entries is rejected
+    MAX_PREFIX_EXPANSION = 1024
+    MAX_TERM_FREQUENCY = 0xFFFF
+
+    def __init__(self, cv_items: list[tuple[str, str]] = ()):
+        self.doc_count = 0
+        # term -> (doc ids array('I'), term frequencies array('H'),
+        #          start of each doc's positions array('I'), encoded positions bytearray)
+        self._postings = {}
+        self._vocabulary = []
+        # Words per document, for BM25 length normalization
+        self.doc_lengths = array('I')
+        self.total_length = 0
+        self.average_length = 0.0
+        # term -> (posting list length, DocBitmap); stale once the term gains documents
+        self._doc_sets = {}
+        self.extend(cv_items)
+
+    def extend(self, cv_items: list[tuple[str, str]]):
+        """Appends cv_items as the next doc ids, tokenizing each text once."""
+        postings = self._postings
+        new_terms = []
+        for doc_id, (_, text) in enumerate(cv_items, self.doc_count):
+            doc_positions = {}
+            tokens = self.tokenize(text)
+            self.doc_lengths.append(len(tokens))
+            self.total_length += len(tokens)
+            for position, term in enumerate(tokens):
+                positions = doc_positions.get(term)
+                if positions is None:
+                    doc_positions[term] = [position]
+                else:
+                    positions.append(position)
+            for term, positions in doc_positions.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = (array('I'), array('H'), array('I'), bytearray())
+                    new_terms.append(term)
+                entry[2].append(len(entry[3]))
+                entry[3].extend(encode_positions(positions))
+                entry[1].append(min(len(positions), self.MAX_TERM_FREQUENCY))
+                entry[0].append(doc_id)
+        self.doc_count = len(self.doc_lengths)
+        if new_terms:
+            # Readers keep bisecting the previous list until this one is assigned
+            self._vocabulary = sorted(self._vocabulary + new_terms)
+        self.average_length = self.total_length / self.doc_count if self.doc_count else 0.0
+
+    @classmethod
+    def tokenize(cls, text: str) -> list[str]:
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    def __len__(self) -> int:
+        """Number of distinct terms."""
+        return len(self._postings)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._postings
+
+    def document_frequency(self, term: str) -> int:
+        entry = self._postings.get(term)
+        return len(entry[0]) if entry else 0
+
+    def doc_set(self, term: str) -> DocBitmap:
+        """
+        DocBitmap of the documents containing term, converted on first use and kept
+        until extend() adds documents to the term.
+        """
+        entry = self._postings.get(term)
+        if not entry:
+            return DocBitmap()
+        doc_ids = entry[0]
+        size = len(doc_ids)
+        cached = self._doc_sets.get(term)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        doc_set = DocBitmap.from_sorted(doc_ids[:size])
+        self._doc_sets[term] = (size, doc_set)
+        return doc_set
+
+    def _slot(self, entry, doc_id: int) -> int:
+        """Index of doc_id in the posting list entry, or -1."""
+        doc_ids = entry[0]
+        slot = bisect_left(doc_ids, doc_id)
+        return slot if slot < len(doc_ids) and doc_ids[slot] == doc_id else -1
+
+    def term_frequency(self, term: str, doc_id: int) -> int:
+        entry = self._postings.get(term)
+        if not entry:
+            return 0
+        slot = self._slot(entry, doc_id)
+        return entry[1][slot] if slot >= 0 else 0
+
+    def positions(self, term: str, doc_id: int) -> list[int]:
+        """Ascending token positions of term in doc_id."""
+        entry = self._postings.get(term)
+        if not entry:
+            return []
+        slot = self._slot(entry, doc_id)
+        if slot < 0:
+            return []
+        offsets, encoded = entry[2], entry[3]
+        end = offsets[slot + 1] if slot + 1 < len(offsets) else len(encoded)
+        return decode_positions(encoded[offsets[slot]:end])
+
+    def expand_prefix(self, prefix: str, limit: int | None = MAX_PREFIX_EXPANSION) -> list[str]:
+        """
+        Every indexed term starting with prefix, found by bisecting the sorted vocabulary.
+        Raises ValueError when there are more than limit of them.
+        """
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:] if limit is None else self._vocabulary[start:start + limit + 1]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        if limit is not None and len(terms) > limit:
+            raise ValueError(f"'{prefix}*' matches more than {limit} terms")
+        return terms
+
+    def _slots_doc_set(self, slots: list[list[str]], candidates: DocBitmap | None) -> DocBitmap:
+        """Documents holding some term of every slot, intersected rarest slot first."""
+        doc_set = candidates
+        for terms in sorted(slots, key=lambda terms: sum(map(self.document_frequency, terms))):
+            slot_docs = DocBitmap.union_all(self.doc_set(term) for term in terms)
+            doc_set = slot_docs if doc_set is None else doc_set & slot_docs
+            if not doc_set:
+                break
+        return doc_set
+
+    def sequence_starts(self, slots: list[list[str]], doc_id: int) -> list[int]:
+        """
+        Positions p in doc_id where a term of slots[0] is at p, one of slots[1] at p + 1,
+        and so on. Slots are intersected rarest first on their positions shifted back by
+        their offset, so no text is read.
+        """
+        starts = None
+        order = sorted(range(len(slots)), key=lambda offset: sum(
+            self.term_frequency(term, doc_id) for term in slots[offset]))
+        for offset in order:
+            shifted = {position - offset for term in slots[offset] for position in self.positions(term, doc_id)}
+            starts = shifted if starts is None else starts & shifted
+            if not starts:
+                return []
+        return sorted(starts)
+
+    def phrase_docs(self, tokens: tuple[str, ...], candidates: DocBitmap | None = None) -> DocBitmap:
+        """
+        Documents containing tokens consecutively: the posting lists are intersected
+        first (with candidates, if given), then positions confirm the order.
+        """
+        slots = [[token] for token in tokens]
+        doc_set = self._slots_doc_set(slots, candidates)
+        if len(tokens) == 1 or not doc_set:
+            return doc_set
+        return DocBitmap.from_sorted(doc_id for doc_id in doc_set if self.sequence_starts(slots, doc_id))
+
+    def phrase_frequency(self, tokens: tuple[str, ...], doc_id: int) -> int:
+        if len(tokens) == 1:
+            return self.term_frequency(tokens[0], doc_id)
+        return len(self.sequence_starts([[token] for token in tokens], doc_id))
+
+    def near_frequency(self, left: tuple[str, ...], right: tuple[str, ...], distance: int, doc_id: int) -> int:
+        """
+        Occurrences of the phrase left that have an occurrence of right within distance
+        tokens on either side: right starting 1..distance tokens after left ends, or
+        ending 1..distance tokens before left starts.
+        """
+        left_starts = self.sequence_starts([[token] for token in left], doc_id)
+        if not left_starts:
+            return 0
+        right_starts = self.sequence_starts([[token] for token in right], doc_id)
+        count = 0
+        for start in left_starts:
+            after = start + len(left)
+            before = start - len(right)
+            # right_starts in [after, after + distance - 1] or in [before - distance + 1, before]
+            slot = bisect_left(right_starts, after)
+            if slot < len(right_starts) and right_starts[slot] < after + distance:
+                count += 1
+                continue
+            slot = bisect_left(right_starts, before - distance + 1)
+            if slot < len(right_starts) and right_starts[slot] <= before:
+                count += 1
+        return count
+
+    def near_docs(self, left: tuple[str, ...], right: tuple[str, ...], distance: int,
+                  candidates: DocBitmap | None = None) -> DocBitmap:
+        doc_set = self._slots_doc_set([[token] for token in left + right], candidates)
+        return DocBitmap.from_sorted(
+            doc_id for doc_id in doc_set if self.near_frequency(left, right, distance, doc_id))
+
+    def substring_candidates(self, keyword: str) -> DocBitmap | None:
+        """
+        Superset of the documents whose lowercased text contains keyword (lowercase) as
+        a substring, the matching rule of the exact search stage, or None if the index
+        cannot narrow it down. The word runs of keyword must be consecutive tokens; the
+        first may be the end of a longer token and the last the start of one, and a
+        keyword that is a single word run may sit anywhere inside a token.
+        """
+        runs = list(self.TOKEN_PATTERN.finditer(keyword))
+        if not runs:
+            return None
+        slots = []
+        for number, run in enumerate(runs):
+            word = run.group()
+            extends_left = number == 0 and run.start() == 0
+            extends_right = number == len(runs) - 1 and run.end() == len(keyword)
+            if extends_left and extends_right:
+                terms = [term for term in self._vocabulary if word in term]
+            elif extends_left:
+                terms = [term for term in self._vocabulary if term.endswith(word)]
+            elif extends_right:
+                terms = self.expand_prefix(word, limit=None)
+            else:
+                terms = [word] if word in self._postings else []
+            if not terms:
+                return DocBitmap()
+            if sum(map(self.document_frequency, terms)) >= self.doc_count and len(runs) == 1:
+                # Matches (nearly) every document; the union would not skip anything
+                return None
+            slots.append(terms)
+        doc_set = self._slots_doc_set(slots, None)
+        if len(slots) == 1 or not doc_set:
+            return doc_set
+        return DocBitmap.from_sorted(doc_id for doc_id in doc_set if self.sequence_starts(slots, doc_id))
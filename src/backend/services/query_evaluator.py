@@ -0,0 +1,162 @@
+from .bm25 import BM25Scorer
+from .doc_bitmap import DocBitmap
+from .inverted_index import InvertedIndex
+from .query_parser import AndNode, FieldNode, NearNode, NotNode, OrNode, PhraseNode, QueryNode, TermNode
+
+
+class QueryEvaluator:
+    """
+    Evaluates a boolean query AST against an InvertedIndex, producing the DocBitmap
+    of matching doc ids without reading CV texts; phrases and NEAR are confirmed on
+    token positions.
+
+    AND evaluates its operands cheapest first by estimated document count, so the
+    running intersection shrinks as early as possible, then subtracts its NOT operands,
+    and stops as soon as the intersection is empty. OR stops once every document
+    matches. Field operands may cost a database query, so they are estimated as
+    matching everything and only resolved if the terms before them left candidates.
+    field_resolver maps a FieldNode's filters dict to a DocBitmap. doc_count is the size
+    of the caller's corpus snapshot when the index may already hold later documents;
+    NOT only complements within it, but other operands are not clipped to it.
+    """
+
+    def __init__(self, index: InvertedIndex, field_resolver=None, doc_count: int | None = None):
+        self.index = index
+        self.field_resolver = field_resolver
+        self.doc_count = index.doc_count if doc_count is None else doc_count
+        self._universe = None
+        self._field_sets = {}
+
+    @property
+    def universe(self) -> DocBitmap:
+        if self._universe is None:
+            self._universe = DocBitmap.full(self.doc_count)
+        return self._universe
+
+    def _prefix_terms(self, node: TermNode) -> list[str]:
+        return self.index.expand_prefix(node.term) if node.prefix else [node.term]
+
+    def estimate(self, node: QueryNode) -> int:
+        """Upper bound on the number of documents node matches, from document frequencies."""
+        doc_count = self.doc_count
+        if isinstance(node, TermNode):
+            return min(doc_count, sum(map(self.index.document_frequency, self._prefix_terms(node))))
+        if isinstance(node, PhraseNode):
+            return min(map(self.index.document_frequency, node.tokens))
+        if isinstance(node, NearNode):
+            return min(map(self.index.document_frequency, node.left + node.right))
+        if isinstance(node, FieldNode):
+            resolved = self._field_sets.get(str(node))
+            return doc_count if resolved is None else len(resolved)
+        if isinstance(node, AndNode):
+            return min((self.estimate(child) for child in node.children if not isinstance(child, NotNode)),
+                       default=doc_count)
+        if isinstance(node, OrNode):
+            return min(doc_count, sum(self.estimate(child) for child in node.children))
+        return doc_count - self.estimate(node.child)
+
+    def evaluate(self, node: QueryNode, within: DocBitmap | None = None) -> DocBitmap:
+        """
+        Documents matching node. within, when given, is a superset of the documents the
+        caller still cares about; operands that are checked per document (phrases, NEAR)
+        are only checked there, and the result may then be limited to it.
+        """
+        if isinstance(node, TermNode):
+            if not node.prefix:
+                return self.index.doc_set(node.term)
+            return DocBitmap.union_all(self.index.doc_set(term) for term in self._prefix_terms(node))
+        if isinstance(node, PhraseNode):
+            return self.index.phrase_docs(node.tokens, within)
+        if isinstance(node, NearNode):
+            return self.index.near_docs(node.left, node.right, node.distance, within)
+        if isinstance(node, FieldNode):
+            return self._evaluate_field(node)
+        if isinstance(node, AndNode):
+            return self._evaluate_and(node, within)
+        if isinstance(node, OrNode):
+            return self._evaluate_or(node, within)
+        scope = self.universe if within is None else within
+        return scope - self.evaluate(node.child, scope)
+
+    def _evaluate_field(self, node: FieldNode) -> DocBitmap:
+        key = str(node)
+        doc_set = self._field_sets.get(key)
+        if doc_set is None:
+            if self.field_resolver is None:
+                raise ValueError(f"Field filters are not available here: {key}")
+            doc_set = self._field_sets[key] = self.field_resolver(node.filters)
+        return doc_set
+
+    def _evaluate_and(self, node: AndNode, within: DocBitmap | None) -> DocBitmap:
+        positive = [child for child in node.children if not isinstance(child, NotNode)]
+        negative = [child.child for child in node.children if isinstance(child, NotNode)]
+        result = within
+        for child in sorted(positive, key=self.estimate):
+            doc_set = self.evaluate(child, result)
+            result = doc_set if result is None else result & doc_set
+            if not result:
+                return result
+        if result is None:
+            result = self.universe
+        # Larger exclusions first empty the result soonest
+        for child in sorted(negative, key=self.estimate, reverse=True):
+            result = result - self.evaluate(child, result)
+            if not result:
+                break
+        return result
+
+    def _evaluate_or(self, node: OrNode, within: DocBitmap | None) -> DocBitmap:
+        result = DocBitmap()
+        # Largest first, so a query like 'java OR ...' can stop once everything matches
+        for child in sorted(node.children, key=self.estimate, reverse=True):
+            result = result | self.evaluate(child, within)
+            scope = self.universe if within is None else within
+            if (within is not None or len(result) >= self.doc_count) and not scope - result:
+                break
+        return result
+
+    def _positive_leaves(self, node: QueryNode) -> list[QueryNode]:
+        leaves = []
+        seen = set()
+        for leaf in node.positive_leaves():
+            if str(leaf) not in seen:
+                seen.add(str(leaf))
+                leaves.append(leaf)
+        return leaves
+
+    def leaf_idfs(self, node: QueryNode, scorer: BM25Scorer) -> dict[str, float]:
+        """
+        BM25 idf of every positive term, phrase and NEAR pair of node, keyed like
+        match_counts, from the document frequencies of the posting lists. Phrases and
+        NEAR pairs sum the idf of their words, as their own document frequency is only
+        known for the documents they were checked on.
+        """
+        idfs = {}
+        for leaf in self._positive_leaves(node):
+            if isinstance(leaf, TermNode):
+                idfs[str(leaf)] = scorer.idf(self.estimate(leaf))
+            else:
+                tokens = leaf.tokens if isinstance(leaf, PhraseNode) else leaf.left + leaf.right
+                idfs[str(leaf)] = sum(scorer.idf(self.index.document_frequency(token)) for token in tokens)
+        return idfs
+
+    def match_counts(self, node: QueryNode, doc_ids) -> dict[int, dict[str, int]]:
+        """
+        Per matched document, the occurrences of every positive term, phrase and NEAR
+        pair of node it contains, keyed by their query form ('java', '"spring boot"', 'eng*').
+        """
+        leaves = self._positive_leaves(node)
+        counts = {}
+        for doc_id in doc_ids:
+            doc_counts = {}
+            for leaf in leaves:
+                if isinstance(leaf, PhraseNode):
+                    count = self.index.phrase_frequency(leaf.tokens, doc_id)
+                elif isinstance(leaf, NearNode):
+                    count = self.index.near_frequency(leaf.left, leaf.right, leaf.distance, doc_id)
+                else:
+                    count = sum(self.index.term_frequency(term, doc_id) for term in self._prefix_terms(leaf))
+                if count:
+                    doc_counts[str(leaf)] = count
+            counts[doc_id] = doc_counts
+        return counts
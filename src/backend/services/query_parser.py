@@ -0,0 +1,322 @@
+import re
+
+from .inverted_index import InvertedIndex
+
+
+class QuerySyntaxError(ValueError):
+    """Raised for a malformed boolean query; the message names the offending position."""
+
+
+class QueryNode:
+    """Base of the boolean query AST. str() gives a canonical form usable as a cache key."""
+
+    __slots__ = ()
+
+    def positive_leaves(self) -> list["QueryNode"]:
+        """The terms, phrases and NEAR pairs whose presence makes a document match (none under NOT)."""
+        return []
+
+
+class TermNode(QueryNode):
+    """One token, or every token starting with it when prefix is set ('eng*')."""
+
+    __slots__ = ("term", "prefix")
+
+    def __init__(self, term: str, prefix: bool = False):
+        self.term = term
+        self.prefix = prefix
+
+    def positive_leaves(self):
+        return [self]
+
+    def __str__(self):
+        return self.term + "*" if self.prefix else self.term
+
+
+class PhraseNode(QueryNode):
+    """Tokens that must appear consecutively ("spring boot")."""
+
+    __slots__ = ("tokens",)
+
+    def __init__(self, tokens: tuple[str, ...]):
+        self.tokens = tokens
+
+    def positive_leaves(self):
+        return [self]
+
+    def __str__(self):
+        return '"' + " ".join(self.tokens) + '"'
+
+
+class NearNode(QueryNode):
+    """Two words or phrases at most distance tokens apart, in either order (java NEAR/3 spring)."""
+
+    __slots__ = ("left", "right", "distance")
+
+    def __init__(self, left: tuple[str, ...], right: tuple[str, ...], distance: int):
+        self.left = left
+        self.right = right
+        self.distance = distance
+
+    def positive_leaves(self):
+        return [self]
+
+    def __str__(self):
+        def operand(tokens):
+            return tokens[0] if len(tokens) == 1 else '"' + " ".join(tokens) + '"'
+        return f"({operand(self.left)} NEAR/{self.distance} {operand(self.right)})"
+
+
+class FieldNode(QueryNode):
+    """
+    Metadata predicate such as role:engineer or years:3..8, resolved like the
+    search_cvs filter it maps to (see FIELD_FILTERS).
+    """
+
+    __slots__ = ("field", "value", "filters")
+
+    def __init__(self, field: str, value: str, filters: dict):
+        self.field = field
+        self.value = value
+        self.filters = filters
+
+    def __str__(self):
+        value = self.value.lower()
+        return f'{self.field}:"{value}"' if " " in value else f"{self.field}:{value}"
+
+
+class AndNode(QueryNode):
+    __slots__ = ("children",)
+
+    def __init__(self, children: list[QueryNode]):
+        self.children = children
+
+    def positive_leaves(self):
+        return [leaf for child in self.children for leaf in child.positive_leaves()]
+
+    def __str__(self):
+        return "(" + " AND ".join(map(str, self.children)) + ")"
+
+
+class OrNode(QueryNode):
+    __slots__ = ("children",)
+
+    def __init__(self, children: list[QueryNode]):
+        self.children = children
+
+    def positive_leaves(self):
+        return [leaf for child in self.children for leaf in child.positive_leaves()]
+
+    def __str__(self):
+        return "(" + " OR ".join(map(str, self.children)) + ")"
+
+
+class NotNode(QueryNode):
+    __slots__ = ("child",)
+
+    def __init__(self, child: QueryNode):
+        self.child = child
+
+    def __str__(self):
+        return f"NOT {self.child}"
+
+
+# Query field -> search_cvs filter key; years takes a range instead of a value
+FIELD_FILTERS = {
+    "role": "roles",
+    "skill": "skills",
+    "company": "companies",
+    "title": "titles",
+    "degree": "degree_levels",
+    "years": None,
+}
+
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<lparen>\()
+      | (?P<rparen>\))
+      | "(?P<phrase>[^"]*)(?P<closed>"?)
+      | (?P<field>(?:""" + "|".join(FIELD_FILTERS) + r"""):)(?=[^\s)])
+      | (?P<and>&&?)
+      | (?P<or>\|\|?|,)
+      | (?P<not>[-!])
+      | (?P<word>[^\s()"|&,]+)
+    )""", re.VERBOSE | re.IGNORECASE)
+
+YEARS_PATTERN = re.compile(r"^(?:(>=|<=)?(\d+(?:\.\d+)?)|(\d+(?:\.\d+)?)\.\.(\d+(?:\.\d+)?))$")
+OPERATOR_WORDS = {"AND": "and", "OR": "or", "NOT": "not"}
+NEAR_PATTERN = re.compile(r"NEAR(?:/(\d+))?")
+DEFAULT_NEAR_DISTANCE = 5
+
+
+def tokenize_query(query: str) -> list[tuple[str, str, int]]:
+    """Splits query into (kind, text, offset) tokens, ending with an 'end' token."""
+    tokens = []
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = TOKEN_PATTERN.match(query, position)
+        if match is None or match.end() == position:
+            raise QuerySyntaxError(f"Unexpected character at {position}: {query[position:position + 10]!r}")
+        kind = match.lastgroup if match.lastgroup != "closed" else "phrase"
+        if kind == "phrase":
+            offset = match.start("phrase") - 1
+            if not match.group("closed"):
+                raise QuerySyntaxError(f"Unterminated phrase at {offset}")
+            text = match.group("phrase")
+        else:
+            offset = match.start(kind)
+            text = match.group(kind)
+        if kind == "word" and text in OPERATOR_WORDS:
+            # Operators are upper case only, so 'and' or 'not' can still be searched for
+            kind = OPERATOR_WORDS[text]
+        elif kind == "word" and NEAR_PATTERN.fullmatch(text):
+            kind = "near"
+        if kind == "field":
+            text = text[:-1].lower()
+        tokens.append((kind, text, offset))
+        position = match.end()
+    tokens.append(("end", "", len(query)))
+    return tokens
+
+
+class QueryParser:
+    """
+    Recursive-descent parser for the boolean query language:
+
+        query    := or_expr
+        or_expr  := and_expr ((OR | '|' | ',') and_expr)*
+        and_expr := unary ((AND | '&')? unary)*      adjacent operands are ANDed
+        unary    := (NOT | '-' | '!') unary | near
+        near     := primary ((NEAR | NEAR/k) primary)?
+        primary  := '(' or_expr ')' | "phrase" | field:value | word | word*
+
+    A word made of several tokens ('spring-boot') is a phrase; a trailing '*'
+    makes it a prefix. Both sides of NEAR (k tokens apart at most, 5 by default)
+    must be words or phrases. Fields are role, skill, company, title, degree
+    (value or "quoted value") and years (N, >=N, <=N or N..M).
+    """
+
+    def __init__(self, query: str):
+        self.query = query
+        self.tokens = tokenize_query(query)
+        self.index = 0
+
+    def _peek(self) -> str:
+        return self.tokens[self.index][0]
+
+    def _take(self) -> tuple[str, str, int]:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def _error(self, message: str):
+        _, text, offset = self.tokens[self.index]
+        found = repr(text) if text else "end of query"
+        raise QuerySyntaxError(f"{message} at {offset}, found {found}")
+
+    def parse(self) -> QueryNode:
+        if self._peek() == "end":
+            raise QuerySyntaxError("Empty query")
+        node = self._or_expr()
+        if self._peek() != "end":
+            self._error("Expected an operator")
+        return node
+
+    def _or_expr(self) -> QueryNode:
+        children = [self._and_expr()]
+        while self._peek() == "or":
+            self._take()
+            children.append(self._and_expr())
+        return children[0] if len(children) == 1 else OrNode(children)
+
+    def _and_expr(self) -> QueryNode:
+        children = [self._unary()]
+        while self._peek() in ("and", "not", "lparen", "phrase", "field", "word"):
+            if self._peek() == "and":
+                self._take()
+            children.append(self._unary())
+        return children[0] if len(children) == 1 else AndNode(children)
+
+    def _unary(self) -> QueryNode:
+        if self._peek() == "not":
+            self._take()
+            return NotNode(self._unary())
+        return self._near()
+
+    def _near(self) -> QueryNode:
+        left = self._primary()
+        if self._peek() != "near":
+            return left
+        distance = NEAR_PATTERN.fullmatch(self._take()[1]).group(1)
+        distance = int(distance) if distance else DEFAULT_NEAR_DISTANCE
+        if distance < 1:
+            raise QuerySyntaxError("NEAR distance must be at least 1")
+        right = self._primary()
+        operands = []
+        for node in (left, right):
+            if isinstance(node, PhraseNode):
+                operands.append(node.tokens)
+            elif isinstance(node, TermNode) and not node.prefix:
+                operands.append((node.term,))
+            else:
+                raise QuerySyntaxError(f"NEAR takes a word or phrase on each side, not {node}")
+        return NearNode(operands[0], operands[1], distance)
+
+    def _primary(self) -> QueryNode:
+        kind, text, offset = self.tokens[self.index]
+        if kind == "lparen":
+            self._take()
+            node = self._or_expr()
+            if self._peek() != "rparen":
+                self._error("Expected ')'")
+            self._take()
+            return node
+        if kind == "phrase":
+            self._take()
+            return self._text_node(text, offset, allow_prefix=False)
+        if kind == "word":
+            self._take()
+            return self._text_node(text, offset, allow_prefix=True)
+        if kind == "field":
+            self._take()
+            if self._peek() not in ("word", "phrase"):
+                self._error(f"Expected a value for '{text}:'")
+            return self._field_node(text, self._take()[1])
+        self._error("Expected a term")
+
+    @staticmethod
+    def _text_node(text: str, offset: int, allow_prefix: bool) -> QueryNode:
+        prefix = allow_prefix and text.endswith("*")
+        tokens = tuple(InvertedIndex.tokenize(text))
+        if not tokens:
+            raise QuerySyntaxError(f"Nothing searchable in {text!r} at {offset}")
+        if len(tokens) == 1:
+            return TermNode(tokens[0], prefix)
+        if prefix:
+            raise QuerySyntaxError(f"A prefix must be a single word: {text!r} at {offset}")
+        return PhraseNode(tokens)
+
+    @staticmethod
+    def _field_node(field: str, value: str) -> FieldNode:
+        value = value.strip()
+        if not value:
+            raise QuerySyntaxError(f"Empty value for '{field}:'")
+        if FIELD_FILTERS[field] is not None:
+            return FieldNode(field, value, {FIELD_FILTERS[field]: [value]})
+        match = YEARS_PATTERN.match(value)
+        if match is None:
+            raise QuerySyntaxError(f"years: takes N, >=N, <=N or N..M, not {value!r}")
+        operator, years, low, high = match.groups()
+        if low is not None:
+            filters = {"min_years": float(low), "max_years": float(high)}
+        elif operator == "<=":
+            filters = {"max_years": float(years)}
+        else:
+            filters = {"min_years": float(years)}
+        return FieldNode(field, value, filters)
+
+
+def parse_query(query: str) -> QueryNode:
+    """Parses a boolean query string into its AST. Raises QuerySyntaxError."""
+    return QueryParser(query).parse()
@@ -1,3 +1,5 @@
+import threading
+
 from backend.algorithms import KMP, BoyerMoore, AhoCorasick, Levenshtein
 
 class SearchService:
@@ -13,8 +15,19 @@ class SearchService:
         """
         self.kmp_algorithm = KMP()
         self.boyer_moore_algorithm = BoyerMoore()
-        self.aho_corasick_algorithm = AhoCorasick()
         self.levenshtein_algorithm = Levenshtein()
+        # AhoCorasick menyimpan automaton pola terakhir, jadi tiap thread butuh instance sendiri
+        self._thread_local = threading.local()
+
+    @property
+    def aho_corasick_algorithm(self) -> AhoCorasick:
+        """
+        Instance AhoCorasick milik thread pemanggil, dibuat saat pertama kali dipakai.
+        """
+        automaton = getattr(self._thread_local, 'aho_corasick', None)
+        if automaton is None:
+            automaton = self._thread_local.aho_corasick = AhoCorasick()
+        return automaton
 
     def search_kmp(self, text: str, pattern: str) -> list[int]:
         """
@@ -0,0 +1,37 @@
+import threading
+from concurrent.futures import Future
+
+
+class SearchStream:
+    """
+    Handle for an incremental search running on a worker thread.
+    The worker publishes top-N snapshots; the UI thread polls 'latest'
+    and 'version' to re-render only when something new arrived.
+    """
+
+    def __init__(self):
+        self.future: Future | None = None
+        self.cancel_event = threading.Event()
+        self.latest: dict | None = None
+        self.version = 0
+
+    def publish(self, snapshot: dict):
+        """Stores a new snapshot. Called from the worker thread."""
+        self.latest = snapshot
+        self.version += 1
+
+    @property
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def cancel(self):
+        """Requests the worker to stop at the next CV boundary."""
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def error(self) -> BaseException | None:
+        """Returns the exception raised by the worker, if it finished with one."""
+        if not self.done or self.future.cancelled():
+            return None
+        return self.future.exception()
@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+
+
+class CorpusVersionedCache:
+    """
+    LRU cache whose entries are only valid for the corpus version they were
+    computed against; any change to the corpus drops the whole cache on the
+    next access. Used for finished searches and per-keyword count vectors.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._corpus_version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _sync_version(self, corpus_version: int):
+        if corpus_version != self._corpus_version:
+            self._entries.clear()
+            self._corpus_version = corpus_version
+
+    def get(self, key: tuple, corpus_version: int):
+        with self._lock:
+            self._sync_version(corpus_version)
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, corpus_version: int, value):
+        with self._lock:
+            self._sync_version(corpus_version)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,18 @@
+from .exporters import export_to_file, to_json, to_prometheus
+from .histogram import LatencyHistogram
+from .profiling import SearchProfiler
+from .slow_query_log import read_slow_query_log, SlowQueryLog
+from .telemetry import Span, Telemetry, telemetry
+
+__all__ = [
+    "export_to_file",
+    "LatencyHistogram",
+    "read_slow_query_log",
+    "SearchProfiler",
+    "SlowQueryLog",
+    "Span",
+    "Telemetry",
+    "telemetry",
+    "to_json",
+    "to_prometheus",
+]
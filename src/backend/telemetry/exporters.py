@@ -0,0 +1,57 @@
+import json
+import os
+import re
+
+_METRIC_PREFIX = "vitaelangx"
+_QUANTILES = [("0.5", "p50_ms"), ("0.9", "p90_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")]
+
+
+def _metric_name(name: str) -> str:
+    return f"{_METRIC_PREFIX}_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def to_json(snapshot: dict) -> str:
+    return json.dumps(snapshot, indent=2, sort_keys=True)
+
+
+def to_prometheus(snapshot: dict) -> str:
+    """
+    Prometheus text exposition format. Counters become `<name>_total`; histograms
+    are exported as summaries of the span duration, labelled by span name.
+    """
+    lines = []
+    for name, value in sorted(snapshot["counters"].items()):
+        metric = _metric_name(name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+
+    metric = f"{_METRIC_PREFIX}_span_duration_milliseconds"
+    if snapshot["histograms"]:
+        lines.append(f"# TYPE {metric} summary")
+    for name, histogram in snapshot["histograms"].items():
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        for quantile, key in _QUANTILES:
+            lines.append(f'{metric}{{span="{label}",quantile="{quantile}"}} {histogram[key]}')
+        lines.append(f'{metric}_sum{{span="{label}"}} {histogram["sum_ms"]}')
+        lines.append(f'{metric}_count{{span="{label}"}} {histogram["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def export_to_file(telemetry, path: str, fmt: str | None = None) -> str:
+    """
+    Writes the telemetry snapshot to path. fmt is 'json' or 'prometheus'; by
+    default it is picked from the extension (.prom/.txt -> prometheus).
+    """
+    if fmt is None:
+        fmt = "prometheus" if os.path.splitext(path)[1] in (".prom", ".txt") else "json"
+    snapshot = telemetry.snapshot()
+    content = to_prometheus(snapshot) if fmt == "prometheus" else to_json(snapshot)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write then rename so a scraper never reads a half-written file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,79 @@
+import threading
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram.
+
+    Values are recorded in whole microseconds. Below 32 µs every value has its own
+    bucket; above that each power of two is split into 16 linear sub-buckets, so
+    any reported percentile is within ~3% of the true value while memory stays
+    bounded (a few hundred buckets cover up to hours). Buckets are kept sparse.
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    LINEAR_LIMIT = SUB_BUCKET_COUNT * 2
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = {}
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+
+    @classmethod
+    def _bucket_index(cls, value_us: int) -> int:
+        if value_us < cls.LINEAR_LIMIT:
+            return value_us
+        shift = value_us.bit_length() - (cls.SUB_BUCKET_BITS + 1)
+        return shift * cls.SUB_BUCKET_COUNT + (value_us >> shift)
+
+    @classmethod
+    def _bucket_bounds(cls, index: int) -> tuple[int, int]:
+        """[lower, upper) bounds of a bucket, in microseconds."""
+        if index < cls.LINEAR_LIMIT:
+            return index, index + 1
+        shift = index // cls.SUB_BUCKET_COUNT - 1
+        mantissa = index % cls.SUB_BUCKET_COUNT + cls.SUB_BUCKET_COUNT
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def record(self, value_ms: float):
+        value_us = max(0, int(value_ms * 1000))
+        index = self._bucket_index(value_us)
+        with self._lock:
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+            self.count += 1
+            self.sum_ms += value_ms
+            if self.min_ms is None or value_ms < self.min_ms:
+                self.min_ms = value_ms
+            if self.max_ms is None or value_ms > self.max_ms:
+                self.max_ms = value_ms
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile in milliseconds (bucket midpoint, clamped to min/max)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(1, -(-pct * self.count // 100))
+            seen = 0
+            for index in sorted(self.buckets):
+                seen += self.buckets[index]
+                if seen >= target:
+                    lower, upper = self._bucket_bounds(index)
+                    midpoint_ms = (lower + upper) / 2 / 1000
+                    return min(max(midpoint_ms, self.min_ms), self.max_ms)
+            return self.max_ms
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            "min_ms": self.min_ms or 0.0,
+            "max_ms": self.max_ms or 0.0,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
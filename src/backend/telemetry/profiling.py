@@ -0,0 +1,90 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+from .telemetry import telemetry
+
+PSTATS_FILE = "profile.pstats"
+TRACEMALLOC_FILE = "allocations.tracemalloc"
+SPANS_FILE = "spans.json"
+META_FILE = "meta.json"
+
+
+class SearchProfiler:
+    """
+    Captures everything needed to analyse one slow call:
+    cProfile stats, a tracemalloc snapshot and the telemetry span tree.
+
+        with SearchProfiler("profiles", {"keywords": [...]}) as profiler:
+            ...
+        print(profiler.output_dir)
+
+    Results go to a fresh timestamped directory under base_dir; read them back
+    with `python -m backend.telemetry.view_profile <dir>`. Telemetry is switched
+    on for the duration of the block if it was off. cProfile only sees the
+    calling thread, so the profiled work must run on it.
+    """
+
+    def __init__(self, base_dir: str, metadata: dict | None = None, trace_frames: int = 10):
+        self.base_dir = base_dir
+        self.metadata = metadata or {}
+        self.trace_frames = trace_frames
+        self.output_dir = None
+        self._profile = None
+        self._telemetry_was_enabled = False
+        self._tracemalloc_was_tracing = False
+        self._previous_traces = []
+        self._start = 0.0
+
+    def __enter__(self):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.output_dir = os.path.join(self.base_dir, f"search-{stamp}")
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        self._telemetry_was_enabled = telemetry.enabled
+        telemetry.enable()
+        self._previous_traces = list(telemetry.recent_traces)
+
+        self._tracemalloc_was_tracing = tracemalloc.is_tracing()
+        if not self._tracemalloc_was_tracing:
+            tracemalloc.start(self.trace_frames)
+        self._profile = cProfile.Profile()
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profile.disable()
+        wall_ms = (time.perf_counter() - self._start) * 1000
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        if not self._tracemalloc_was_tracing:
+            tracemalloc.stop()
+        if not self._telemetry_was_enabled:
+            telemetry.disable()
+
+        self._profile.dump_stats(os.path.join(self.output_dir, PSTATS_FILE))
+        snapshot.dump(os.path.join(self.output_dir, TRACEMALLOC_FILE))
+
+        # Only the traces finished inside this block (the bounded deque may have rotated)
+        previous_ids = {id(span) for span in self._previous_traces}
+        traces = [span for span in telemetry.recent_traces if id(span) not in previous_ids]
+        self._previous_traces = []
+        with open(os.path.join(self.output_dir, SPANS_FILE), "w", encoding="utf-8") as f:
+            json.dump([span.as_dict() for span in traces], f, indent=2, default=str)
+
+        meta = dict(self.metadata)
+        meta.update({
+            "wall_time_ms": wall_ms,
+            "peak_traced_bytes": peak_bytes,
+            "failed": exc_type is not None,
+            "error": repr(exc) if exc is not None else None,
+            "created": datetime.now().isoformat(),
+        })
+        with open(os.path.join(self.output_dir, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, default=str)
+        print(f"Search profile written to {self.output_dir}")
+        return False
@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+
+class SlowQueryLog:
+    """
+    Appends searches slower than threshold_ms to a rotating JSONL file, one
+    record per line. Rotation follows logging's RotatingFileHandler: when the
+    file would exceed max_bytes it is renamed to <path>.1 (older ones shift up
+    to <path>.<backup_count>) and a new file is started. The file is only
+    opened on the first slow query.
+    """
+
+    def __init__(self, path: str | None, threshold_ms: float, max_bytes: int = 5 * 1024 * 1024,
+                 backup_count: int = 5):
+        self.path = path
+        self.threshold_ms = threshold_ms
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._logger = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.threshold_ms is not None
+
+    def _get_logger(self) -> logging.Logger:
+        with self._lock:
+            if self._logger is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes,
+                                              backupCount=self.backup_count, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger = logging.getLogger(f"vitaelangx.slow_queries.{id(self)}")
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                self._logger = logger
+            return self._logger
+
+    def record_if_slow(self, total_ms: float, record: dict) -> bool:
+        """Writes record (plus timestamp and total_ms) if total_ms is over budget."""
+        if not self.enabled or total_ms < self.threshold_ms:
+            return False
+        entry = {"timestamp": datetime.now(timezone.utc).isoformat(), "total_ms": total_ms}
+        entry.update(record)
+        try:
+            self._get_logger().info(json.dumps(entry, default=str))
+        except OSError as e:
+            print(f"Could not write slow query log {self.path}: {e}")
+            return False
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._logger is not None:
+                for handler in list(self._logger.handlers):
+                    handler.close()
+                    self._logger.removeHandler(handler)
+                self._logger = None
+
+
+def read_slow_query_log(path: str, include_rotated: bool = True) -> list[dict]:
+    """Reads a slow-query log oldest first, including rotated <path>.N files."""
+    paths = []
+    if include_rotated:
+        index = 1
+        while os.path.exists(f"{path}.{index}"):
+            paths.append(f"{path}.{index}")
+            index += 1
+        paths.reverse()
+    if os.path.exists(path):
+        paths.append(path)
+
+    records = []
+    for log_path in paths:
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"Skipping malformed slow query record {log_path}:{line_number}")
+    return records
@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from collections import deque
+
+from .histogram import LatencyHistogram
+
+
+class Span:
+    """
+    Timed region opened with `with telemetry.span(name) as span:`.
+
+    The elapsed time is always measured (two perf_counter calls) so callers can
+    read span.elapsed_ms for their own bookkeeping; it is only recorded into the
+    registry, and linked to its parent span, while telemetry is enabled.
+    """
+
+    __slots__ = ("telemetry", "name", "attributes", "start", "elapsed_ms", "children", "_recording")
+
+    def __init__(self, telemetry, name: str, attributes: dict | None):
+        self.telemetry = telemetry
+        self.name = name
+        self.attributes = attributes
+        self.start = 0.0
+        self.elapsed_ms = 0.0
+        self.children = None
+        self._recording = telemetry.enabled
+
+    def __enter__(self):
+        if self._recording:
+            self.children = []
+            self.telemetry._push(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed_ms = (time.perf_counter() - self.start) * 1000
+        if self._recording:
+            self.telemetry._pop(self, failed=exc_type is not None)
+        return False
+
+    def as_dict(self) -> dict:
+        span = {"name": self.name, "duration_ms": self.elapsed_ms}
+        if self.attributes:
+            span["attributes"] = self.attributes
+        if self.children:
+            span["children"] = [child.as_dict() for child in self.children]
+        return span
+
+
+class Telemetry:
+    """
+    Process-wide registry of spans, counters and latency histograms.
+
+    Disabled by default: counters return immediately and spans only time
+    themselves. Enable with Settings.TELEMETRY_ENABLED, the VITAELANGX_TELEMETRY
+    environment variable or enable(). Instrumentation belongs at stage
+    granularity (a shard scan, a DB query), never inside per-word loops.
+    """
+
+    def __init__(self, enabled: bool = False, max_traces: int = 50):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.counters = {}
+        self.histograms = {}
+        self.recent_traces = deque(maxlen=max_traces)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+            self.recent_traces.clear()
+
+    def span(self, name: str, **attributes) -> Span:
+        return Span(self, name, attributes or None)
+
+    def increment(self, name: str, value: float = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float):
+        """Records a latency sample into the histogram called name."""
+        if not self.enabled:
+            return
+        self.histogram(name).record(value_ms)
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span: Span):
+        self._stack().append(span)
+
+    def _pop(self, span: Span, failed: bool):
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        self.histogram(span.name).record(span.elapsed_ms)
+        if failed:
+            self.increment(f"{span.name}.errors")
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            self.recent_traces.append(span)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = dict(self.histograms)
+            traces = list(self.recent_traces)
+        return {
+            "timestamp": time.time(),
+            "counters": counters,
+            "histograms": {name: histogram.snapshot() for name, histogram in sorted(histograms.items())},
+            "recent_traces": [span.as_dict() for span in traces],
+        }
+
+
+def _enabled_from_environment() -> bool:
+    from backend.common import Settings
+    value = os.environ.get("VITAELANGX_TELEMETRY")
+    if value is not None:
+        return value.strip().lower() not in ("", "0", "false", "no")
+    return Settings.TELEMETRY_ENABLED
+
+
+telemetry = Telemetry(enabled=_enabled_from_environment())
@@ -0,0 +1,69 @@
+"""
+Prints a profile captured by SearchProfiler.
+
+    python -m backend.telemetry.view_profile profiles/search-20240101-120000-000000 [--top 20]
+"""
+import argparse
+import io
+import json
+import os
+import pstats
+import tracemalloc
+
+from .profiling import META_FILE, PSTATS_FILE, SPANS_FILE, TRACEMALLOC_FILE
+
+
+def _print_span(span: dict, depth: int = 0):
+    attributes = span.get("attributes")
+    suffix = f"  {attributes}" if attributes else ""
+    print(f"{'  ' * depth}{span['name']:<{40 - 2 * depth}} {span['duration_ms']:>10.2f} ms{suffix}")
+    for child in span.get("children", []):
+        _print_span(child, depth + 1)
+
+
+def print_profile(profile_dir: str, top: int = 20):
+    with open(os.path.join(profile_dir, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    print("== Query ==")
+    for key, value in meta.items():
+        print(f"{key}: {value}")
+
+    spans_path = os.path.join(profile_dir, SPANS_FILE)
+    if os.path.exists(spans_path):
+        with open(spans_path, "r", encoding="utf-8") as f:
+            spans = json.load(f)
+        print("\n== Stage spans ==")
+        for span in spans:
+            _print_span(span)
+
+    for sort_key in ("cumulative", "tottime"):
+        print(f"\n== Top {top} functions by {sort_key} time ==")
+        stream = io.StringIO()
+        pstats.Stats(os.path.join(profile_dir, PSTATS_FILE), stream=stream) \
+            .strip_dirs().sort_stats(sort_key).print_stats(top)
+        # Skip pstats' own header lines up to the column titles
+        lines = stream.getvalue().splitlines()
+        start = next((i for i, line in enumerate(lines) if "ncalls" in line), 0)
+        print("\n".join(lines[start:]).rstrip())
+
+    print(f"\n== Top {top} allocation sites ==")
+    snapshot = tracemalloc.Snapshot.load(os.path.join(profile_dir, TRACEMALLOC_FILE))
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        print(f"{stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show a search profile captured with profile_dir")
+    parser.add_argument("profile_dir")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+    print_profile(args.profile_dir, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import json
+
+
+def parse_query_line(line: str) -> dict | None:
+    """
+    Parses one query line: either a JSON object such as
+    {"keywords": [...], "algorithm": "kmp", "top_n": 10, "fuzzy_threshold": 80, "filters": {"roles": [...]}}
+    or a plain comma-separated keyword list. Blank lines and '#' comments give None.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        query = json.loads(line)
+        if not isinstance(query, dict):
+            raise ValueError("a JSON query must be an object")
+        if isinstance(query.get("keywords"), str):
+            query["keywords"] = [kw.strip() for kw in query["keywords"].split(",") if kw.strip()]
+        if not isinstance(query.get("keywords"), list) or not query["keywords"]:
+            raise ValueError("'keywords' must be a non-empty list or comma-separated string")
+        return query
+    return {"keywords": [kw.strip() for kw in line.split(",") if kw.strip()]}
+
+
+def load_query_file(path: str) -> list[dict]:
+    """
+    Reads a file of queries, one per line (see parse_query_line).
+    Raises ValueError naming the line of a malformed query.
+    """
+    queries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            try:
+                query = parse_query_line(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{number}: {e}") from None
+            if query is not None:
+                queries.append(query)
+    return queries
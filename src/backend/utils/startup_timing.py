@@ -0,0 +1,103 @@
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+
+class _TimedLoader:
+    """Loader proxy that records how long exec_module takes for one module."""
+
+    def __init__(self, loader, fullname: str, timer: "StartupTimer"):
+        self._loader = loader
+        self._fullname = fullname
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer._enter_import(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._exit_import(self._fullname)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimingFinder(MetaPathFinder):
+    """Meta path hook that wraps every loader found by the other finders."""
+
+    def __init__(self, timer: "StartupTimer"):
+        self._timer = timer
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname, self._timer)
+                return spec
+        return None
+
+
+class StartupTimer:
+    """
+    Collects a startup timing report: named wall-clock phases plus a
+    per-module import breakdown in the spirit of `python -X importtime`
+    (self time and cumulative time, in microseconds).
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self.imports = {}
+        self._stack = []
+        self._finder = None
+
+    def install_import_hook(self):
+        """Starts timing every module imported from now on."""
+        if self._finder is None:
+            self._finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def remove_import_hook(self):
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def mark(self, phase: str):
+        """Records that phase finished now, relative to timer creation."""
+        self.phases.append((phase, (time.perf_counter() - self.start) * 1000))
+
+    def _enter_import(self, fullname: str):
+        self._stack.append([fullname, time.perf_counter(), 0.0])
+
+    def _exit_import(self, fullname: str):
+        name, started, child_time = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.imports[name] = {
+            "self_us": int((cumulative - child_time) * 1_000_000),
+            "cumulative_us": int(cumulative * 1_000_000),
+            "depth": len(self._stack),
+        }
+
+    def format_report(self, top_n: int = 25) -> str:
+        lines = ["Startup timing report", "  phase                               elapsed (ms)"]
+        for phase, elapsed_ms in self.phases:
+            lines.append(f"  {phase:<35} {elapsed_ms:>10.1f}")
+
+        if self.imports:
+            lines.append("")
+            lines.append(f"  import time (top {top_n} by cumulative)")
+            lines.append("  self [us] | cumulative | imported package")
+            slowest = sorted(self.imports.items(),
+                             key=lambda item: item[1]["cumulative_us"], reverse=True)[:top_n]
+            for name, timing in slowest:
+                lines.append(
+                    f"  {timing['self_us']:>9} | {timing['cumulative_us']:>10} | {'  ' * timing['depth']}{name}")
+        return "\n".join(lines)
@@ -0,0 +1,7 @@
+"""
+Standalone benchmark suite for the string matching and fuzzy engines.
+
+Run from the src directory:
+    python -m benchmarks run --output bench.json
+    python -m benchmarks compare baseline.json bench.json --threshold 0.10
+"""
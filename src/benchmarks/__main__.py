@@ -0,0 +1,127 @@
+import argparse
+import sys
+
+from .bitmap import DEFAULT_DENSITIES, DEFAULT_DOCS, run_bitmap
+from .compare import compare_results, load_results, print_comparison
+from .corpus import SyntheticCVGenerator
+from .e2e import run_e2e
+from .extraction import ADVERSARIAL_CASES, DEFAULT_MAX_MS_PER_KCHAR, DEFAULT_SIZES, run_extraction
+from .replay import run_replay
+from .runner import DEFAULT_SEED, run_benchmarks, write_results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the string matching and fuzzy engines")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("--output", "-o", default="benchmark_results.json")
+    run_parser.add_argument("--quick", action="store_true", help="smaller sweep for a fast sanity check")
+    run_parser.add_argument("--engine", action="append", dest="engines",
+                            help="only run this engine (repeatable): kmp, boyer-moore, aho-corasick, levenshtein, str.find, re")
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--repeat", type=int, default=None)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed slowdown before failing (0.10 = 10%%)")
+
+    corpus_parser = subparsers.add_parser("generate-corpus", help="write a synthetic CV corpus and its seed SQL")
+    corpus_parser.add_argument("--count", "-n", type=int, default=1000)
+    corpus_parser.add_argument("--output", "-o", default="synthetic_corpus")
+    corpus_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    corpus_parser.add_argument("--pdf", action="store_true", help="write PDFs instead of plain .txt files")
+    corpus_parser.add_argument("--applications-per-applicant", type=float, default=1.5)
+
+    e2e_parser = subparsers.add_parser("e2e", help="replay a query log through BackendManager.search_cvs")
+    e2e_parser.add_argument("--corpus", default="synthetic_corpus",
+                            help="generated corpus directory (created with --count CVs if missing)")
+    e2e_parser.add_argument("--count", "-n", type=int, default=1000)
+    e2e_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    e2e_parser.add_argument("--queries", help="query log file; defaults to a generated log")
+    e2e_parser.add_argument("--query-count", type=int, default=100)
+    e2e_parser.add_argument("--warm", action="store_true", help="keep result and profile caches between queries")
+    e2e_parser.add_argument("--seed-db", action="store_true", help="reseed the database from the corpus SQL")
+    e2e_parser.add_argument("--db-host", default="localhost")
+    e2e_parser.add_argument("--db-user", default="root")
+    e2e_parser.add_argument("--db-password", default="")
+    e2e_parser.add_argument("--db-name", default="ats_bench",
+                            help="benchmark database; kept separate from ats_db since seeding drops the tables")
+    e2e_parser.add_argument("--output", "-o")
+
+    replay_parser = subparsers.add_parser("replay", help="re-run the queries of a slow-query log")
+    replay_parser.add_argument("log", nargs="?", default="../logs/slow_queries.jsonl")
+    replay_parser.add_argument("--no-rotated", action="store_true", help="ignore rotated <log>.N files")
+    replay_parser.add_argument("--limit", type=int, help="only replay the most recent N queries")
+    replay_parser.add_argument("--warm", action="store_true", help="keep result and profile caches between queries")
+    replay_parser.add_argument("--db-host", default="localhost")
+    replay_parser.add_argument("--db-user", default="root")
+    replay_parser.add_argument("--db-password", default="")
+    replay_parser.add_argument("--db-name", default="ats_db")
+    replay_parser.add_argument("--output", "-o")
+
+    extraction_parser = subparsers.add_parser(
+        "extraction", help="time CV summary extraction on adversarial lines and a synthetic corpus")
+    extraction_parser.add_argument("--size", type=int, action="append", dest="sizes",
+                                   help=f"malformed line length in characters (repeatable, default {DEFAULT_SIZES})")
+    extraction_parser.add_argument("--case", action="append", dest="cases", choices=sorted(ADVERSARIAL_CASES))
+    extraction_parser.add_argument("--max-ms-per-kchar", type=float, default=DEFAULT_MAX_MS_PER_KCHAR,
+                                   help="fail when a case costs more than this per 1000 characters")
+    extraction_parser.add_argument("--corpus-count", type=int, default=1000,
+                                   help="synthetic CVs for the throughput run (0 to skip)")
+    extraction_parser.add_argument("--output", "-o")
+
+    bitmap_parser = subparsers.add_parser("bitmap", help="time DocBitmap set operations against Python sets")
+    bitmap_parser.add_argument("--docs", type=int, default=DEFAULT_DOCS)
+    bitmap_parser.add_argument("--density", type=float, action="append", dest="densities",
+                               help=f"fraction of docs in an operand (repeatable, default {DEFAULT_DENSITIES})")
+    bitmap_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    bitmap_parser.add_argument("--output", "-o")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "bitmap":
+        run_bitmap(args.docs, args.densities or DEFAULT_DENSITIES, args.seed, args.output)
+        return 0
+
+    if args.command == "extraction":
+        report = run_extraction(sizes=args.sizes or DEFAULT_SIZES, cases=args.cases,
+                                max_ms_per_kchar=args.max_ms_per_kchar,
+                                corpus_count=args.corpus_count, output_path=args.output)
+        return 1 if any(row["over_budget"] for row in report["adversarial"]) else 0
+
+    if args.command == "replay":
+        db_config = {"db_host": args.db_host, "db_user": args.db_user,
+                     "db_password": args.db_password, "db_name": args.db_name}
+        run_replay(args.log, db_config, include_rotated=not args.no_rotated, warm=args.warm,
+                   limit=args.limit, output_path=args.output)
+        return 0
+
+    if args.command == "e2e":
+        db_config = {"db_host": args.db_host, "db_user": args.db_user,
+                     "db_password": args.db_password, "db_name": args.db_name}
+        run_e2e(args.corpus, count=args.count, seed=args.seed, queries_path=args.queries,
+                query_count=args.query_count, warm=args.warm, db_config=db_config,
+                seed_db=args.seed_db, output_path=args.output)
+        return 0
+
+    if args.command == "generate-corpus":
+        generator = SyntheticCVGenerator(seed=args.seed, applications_per_applicant=args.applications_per_applicant)
+        generator.write_corpus(args.output, args.count, as_pdf=args.pdf)
+        return 0
+
+    if args.command == "run":
+        report = run_benchmarks(quick=args.quick, engines=args.engines, seed=args.seed, repeat=args.repeat)
+        write_results(report, args.output)
+        return 0
+
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print_comparison(rows, args.threshold)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import json
+import random
+import time
+
+from .runner import DEFAULT_SEED
+
+DEFAULT_DOCS = 100_000
+# Fraction of the corpus in each operand: a rare term, a common one, a role of a few percent
+DEFAULT_DENSITIES = [0.001, 0.02, 0.3]
+
+
+def _time_us(func, min_time_s: float = 0.05) -> float:
+    loops = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s:
+            return elapsed * 1e6 / loops
+
+
+def run_bitmap(docs: int = DEFAULT_DOCS, densities: list[float] = DEFAULT_DENSITIES, seed: int = DEFAULT_SEED,
+               output_path: str | None = None) -> list[dict]:
+    """
+    Times DocBitmap AND, OR, ANDNOT and cardinality against Python sets for every
+    pair of operand densities over a corpus of `docs` dense doc ids.
+    """
+    from backend.services import DocBitmap
+
+    rnd = random.Random(seed)
+    def sample(density: float) -> tuple:
+        doc_ids = sorted(rnd.sample(range(docs), max(1, int(docs * density))))
+        return DocBitmap.from_sorted(doc_ids), set(doc_ids)
+
+    left_operands = {density: sample(density) for density in densities}
+    right_operands = {density: sample(density) for density in densities}
+
+    rows = []
+    print(f"{'left':>7} {'right':>7} {'op':>7} {'bitmap us':>10} {'set us':>10} {'result':>8}")
+    for left in densities:
+        for right in densities:
+            left_bitmap, left_set = left_operands[left]
+            right_bitmap, right_set = right_operands[right]
+            for name, bitmap_op, set_op in (
+                    ("and", lambda: len(left_bitmap & right_bitmap), lambda: len(left_set & right_set)),
+                    ("or", lambda: len(left_bitmap | right_bitmap), lambda: len(left_set | right_set)),
+                    ("andnot", lambda: len(left_bitmap - right_bitmap), lambda: len(left_set - right_set))):
+                result = bitmap_op()
+                assert result == set_op(), f"DocBitmap {name} disagrees with set {name}"
+                row = {"left": left, "right": right, "op": name, "bitmap_us": _time_us(bitmap_op),
+                       "set_us": _time_us(set_op), "cardinality": result}
+                rows.append(row)
+                print(f"{left:>7} {right:>7} {name:>7} {row['bitmap_us']:>10.1f} {row['set_us']:>10.1f} {result:>8}")
+
+    for density, (bitmap, doc_set) in left_operands.items():
+        print(f"density {density}: {bitmap.memory_bytes()} bytes as DocBitmap, "
+              f"{len(doc_set)} ids ({bitmap!r})")
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({"docs": docs, "rows": rows}, f, indent=2)
+        print(f"Bitmap results written to {output_path}")
+    return rows
@@ -0,0 +1,39 @@
+import json
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    Compares the median timings of two runs. A row is a regression when the
+    current median is slower than the baseline by more than `threshold`
+    (0.10 = 10%). Rows only present in one run are skipped.
+    """
+    rows = []
+    for key in sorted(baseline.keys() & current.keys()):
+        base_ms = baseline[key]["median_ms"]
+        new_ms = current[key]["median_ms"]
+        change = (new_ms - base_ms) / base_ms if base_ms else 0.0
+        rows.append({
+            "key": key,
+            "baseline_ms": base_ms,
+            "current_ms": new_ms,
+            "change": change,
+            "regression": change > threshold,
+            "matches_differ": baseline[key].get("matches") != current[key].get("matches"),
+        })
+    return rows
+
+
+def print_comparison(rows: list[dict], threshold: float):
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        if row["matches_differ"]:
+            flag = (flag + " MATCH-COUNT-CHANGED").strip()
+        print(f"{row['key']:<70} {row['baseline_ms']:>10.3f} -> {row['current_ms']:>10.3f} ms "
+              f"({row['change']:+.1%}) {flag}")
+    regressions = [row for row in rows if row["regression"]]
+    print(f"\n{len(rows)} benchmarks compared, {len(regressions)} slower than {threshold:.0%}")
@@ -0,0 +1,336 @@
+import datetime
+import os
+import random
+from dataclasses import dataclass
+
+# Role categories mirror the data/<CATEGORY>/ folders referenced by seeds/tubes3_seeding.sql
+ROLE_CATEGORIES = {
+    "ACCOUNTANT": (["Staff Accountant", "Cost Accountant", "Tax Accountant", "Audit Associate"],
+                   ["General Ledger", "Accounts Payable", "Accounts Receivable", "QuickBooks", "SAP",
+                    "Financial Reporting", "Reconciliation", "Payroll", "GAAP", "Microsoft Excel"]),
+    "BANKING": (["Bank Manager", "Loan Officer", "Credit Analyst", "Teller"],
+                ["Credit Analysis", "Loan Processing", "Customer Service", "Risk Management",
+                 "Cash Handling", "Compliance", "KYC", "Financial Analysis", "Sales", "CRM"]),
+    "CHEF": (["Commis Chef", "Chef de Partie", "Banquet Chef", "Sous Chef"],
+             ["Menu Planning", "Food Safety", "Inventory Control", "Pastry", "Catering",
+              "Kitchen Management", "Food Preparation", "Sanitation", "Cost Control", "Team Leadership"]),
+    "CONSTRUCTION": (["Site Engineer", "Construction Worker", "Building Inspector", "Project Manager"],
+                     ["AutoCAD", "Blueprint Reading", "Safety Compliance", "Scheduling", "Estimating",
+                      "Concrete", "OSHA", "Project Management", "Quality Control", "Surveying"]),
+    "ENGINEERING": (["Civil Engineer", "Chemical Engineer", "Mechanical Engineer", "Process Engineer"],
+                    ["AutoCAD", "MATLAB", "SolidWorks", "Six Sigma", "Lean Manufacturing",
+                     "Root Cause Analysis", "Project Management", "Python", "Quality Assurance", "PLC"]),
+    "FINANCE": (["Financial Planner", "Financial Analyst", "Investment Analyst", "Actuary"],
+                ["Financial Modeling", "Forecasting", "Budgeting", "Valuation", "Bloomberg",
+                 "Microsoft Excel", "SQL", "Risk Analysis", "Portfolio Management", "Python"]),
+    "HEALTHCARE": (["Registered Nurse", "Medical Assistant", "Anesthesiologist", "Pharmacist"],
+                   ["Patient Care", "Electronic Medical Records", "CPR", "Phlebotomy", "HIPAA",
+                    "Vital Signs", "Medication Administration", "Triage", "Scheduling", "Customer Service"]),
+    "HR": (["HR Generalist", "Recruiter", "Compensation Analyst", "Training Coordinator"],
+           ["Recruiting", "Onboarding", "Employee Relations", "Payroll", "HRIS", "Workday",
+            "Benefits Administration", "Performance Management", "Interviewing", "Compliance"]),
+    "INFORMATION-TECHNOLOGY": (["Software Developer", "Backend Developer", "Cloud Architect", "Data Engineer"],
+                               ["Java", "Python", "Spring Boot", "SQL", "Docker", "Kubernetes", "React",
+                                "AWS", "Kafka", "Git", "Linux", "REST API", "Microservices", "JavaScript"]),
+    "SALES": (["Sales Consultant", "Inside Sales Representative", "Account Executive",
+               "Business Development Representative"],
+              ["Lead Generation", "Salesforce", "Negotiation", "Cold Calling", "Account Management",
+               "CRM", "Customer Service", "Forecasting", "Presentation", "Closing"]),
+    "TEACHER": (["Math Teacher", "Art Teacher", "Teaching Assistant", "Curriculum Developer"],
+                ["Lesson Planning", "Classroom Management", "Curriculum Development", "Differentiated Instruction",
+                 "Student Assessment", "Google Classroom", "Tutoring", "Communication", "Mentoring", "Special Education"]),
+}
+
+FIRST_NAMES = ["Andi", "Budi", "Citra", "Dewi", "Eko", "Fajar", "Gita", "Hadi", "Indah", "Joko",
+               "Kartika", "Lestari", "Made", "Nadia", "Putri", "Rizky", "Sari", "Taufik", "Wahyu", "Yusuf"]
+LAST_NAMES = ["Pratama", "Saputra", "Wijaya", "Santoso", "Hidayat", "Nugroho", "Kusuma", "Lubis",
+              "Siregar", "Halim", "Setiawan", "Gunawan", "Permana", "Utami", "Wibowo", "Rahman"]
+STREETS = ["Kenanga", "Melati", "Cemara", "Sakura", "Mawar", "Anggrek", "Duku", "Merdeka", "Sudirman", "Diponegoro"]
+CITIES = ["Jakarta", "Bandung", "Surabaya", "Semarang", "Yogyakarta", "Medan", "Makassar", "Denpasar"]
+
+US_LOCATIONS = [("Austin", "TX"), ("Boston", "MA"), ("Chicago", "IL"), ("Denver", "CO"),
+                ("Seattle", "WA"), ("Atlanta", "GA"), ("Phoenix", "AZ"), ("Portland", "OR")]
+COMPANY_PREFIXES = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay", "Soylent", "Tyrell"]
+COMPANY_SUFFIXES = ["Corporation", "Industries", "Group", "Solutions", "Holdings", "Partners"]
+UNIVERSITIES = ["Institut Teknologi Bandung", "Universitas Indonesia", "Gadjah Mada University",
+                "State University", "Community College", "Husson College", "Northern Maine Community College"]
+DEGREES = ["Bachelors", "Masters", "Associate", "Diploma", "PhD"]
+FIELDS = ["Computer Science", "Accounting", "Business Administration", "Civil Engineering",
+          "Culinary Arts", "Nursing", "Education", "Finance", "Human Resources", "Marketing"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+FILLER_VERBS = ["Managed", "Developed", "Led", "Coordinated", "Improved", "Implemented", "Supported",
+                "Designed", "Analyzed", "Trained", "Reduced", "Increased", "Maintained", "Delivered"]
+FILLER_OBJECTS = ["daily operations", "a team of five", "quarterly reports", "customer requests",
+                  "process improvements", "vendor relationships", "internal tooling", "budget planning",
+                  "cross functional projects", "documentation", "training sessions", "weekly audits"]
+
+
+@dataclass
+class SyntheticCV:
+    applicant_id: int
+    detail_id: int
+    first_name: str
+    last_name: str
+    date_of_birth: datetime.date
+    address: str
+    phone_number: str
+    category: str
+    application_role: str
+    text: str
+    cv_path: str = ""
+
+
+class SyntheticCVGenerator:
+    """
+    Deterministic generator of realistic CV text plus the matching
+    ApplicantProfile / ApplicationDetail rows.
+
+    Texts use the section headers known to RegexExtractor and lay out job and
+    education lines in the shapes its patterns recognise, so summaries work on
+    generated CVs as they do on the real dataset.
+    """
+
+    def __init__(self, seed: int = 1337, applications_per_applicant: float = 1.5):
+        self.seed = seed
+        self.applications_per_applicant = max(1.0, applications_per_applicant)
+
+    def iter_cvs(self, count: int):
+        """Yields `count` SyntheticCV objects; the same seed always yields the same corpus."""
+        rng = random.Random(self.seed)
+        categories = sorted(ROLE_CATEGORIES)
+        applicant_count = max(1, int(count / self.applications_per_applicant))
+
+        for detail_id in range(1, count + 1):
+            # The first applicant_count details each get a fresh applicant, the rest reuse one
+            if detail_id <= applicant_count:
+                applicant_id = detail_id
+            else:
+                applicant_id = rng.randint(1, applicant_count)
+            person_rng = random.Random(f"{self.seed}:applicant:{applicant_id}")
+
+            category = rng.choice(categories)
+            roles, _ = ROLE_CATEGORIES[category]
+            role = rng.choice(roles)
+
+            yield SyntheticCV(
+                applicant_id=applicant_id,
+                detail_id=detail_id,
+                first_name=person_rng.choice(FIRST_NAMES),
+                last_name=person_rng.choice(LAST_NAMES),
+                date_of_birth=datetime.date(person_rng.randint(1965, 2003),
+                                            person_rng.randint(1, 12), person_rng.randint(1, 28)),
+                address=f"Jl. {person_rng.choice(STREETS)} No. {person_rng.randint(1, 99)}, {person_rng.choice(CITIES)}",
+                phone_number=f"08{person_rng.randint(1000000000, 9999999999)}",
+                category=category,
+                application_role=role,
+                text=self.generate_text(rng, category, role),
+            )
+
+    def generate_text(self, rng: random.Random, category: str, role: str) -> str:
+        roles, skills = ROLE_CATEGORIES[category]
+        # Mostly in-category skills with a few from other fields, like real CVs
+        other_skills = ROLE_CATEGORIES[rng.choice(sorted(ROLE_CATEGORIES))][1]
+        chosen_skills = rng.sample(skills, k=min(len(skills), rng.randint(4, 8)))
+        chosen_skills += rng.sample(other_skills, k=rng.randint(0, 2))
+
+        lines = [role.upper(), ""]
+        lines += ["Summary", self._sentence(rng, role, chosen_skills), ""]
+
+        lines += ["Skills", ", ".join(dict.fromkeys(chosen_skills)), ""]
+
+        lines.append("Experience")
+        year = rng.randint(2020, 2024)
+        for job_index in range(rng.randint(1, 4)):
+            start_year = year - rng.randint(1, 5)
+            end = "Present" if job_index == 0 else f"{rng.choice(MONTHS)} {year}"
+            city, state = rng.choice(US_LOCATIONS)
+            company = f"{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)}"
+            title = role if job_index == 0 else rng.choice(roles)
+            lines.append(title)
+            lines.append(f"{city} , {state} {company} / {rng.choice(MONTHS)} {start_year} to {end}")
+            lines.append("")
+            lines += [self._sentence(rng, title, chosen_skills) for _ in range(rng.randint(1, 3))]
+            lines.append("")
+            year = start_year
+
+        lines.append("Education")
+        for _ in range(rng.randint(1, 2)):
+            gpa = f" GPA: {rng.uniform(2.5, 4.0):.2f}" if rng.random() < 0.5 else ""
+            lines.append(f"{rng.choice(UNIVERSITIES)} {year - rng.randint(0, 4)} "
+                         f"{rng.choice(DEGREES)}: {rng.choice(FIELDS)}{gpa}")
+        lines.append("")
+
+        if rng.random() < 0.4:
+            lines += ["Certifications", f"Certified {rng.choice(chosen_skills)} Professional", ""]
+        if rng.random() < 0.3:
+            lines += ["Interests", ", ".join(rng.sample(["Reading", "Hiking", "Chess", "Photography",
+                                                         "Volunteering", "Cooking"], k=3)), ""]
+        return "\n".join(lines).strip()
+
+    def _sentence(self, rng: random.Random, role: str, skills: list[str]) -> str:
+        first_skill, second_skill = rng.sample(skills, k=2)
+        return (f"{rng.choice(FILLER_VERBS)} {rng.choice(FILLER_OBJECTS)} as {role} using "
+                f"{first_skill} and {second_skill}; {rng.choice(FILLER_VERBS).lower()} "
+                f"{rng.choice(FILLER_OBJECTS)}.")
+
+    def generate_corpus(self, count: int) -> dict[str, SyntheticCV]:
+        """In-memory corpus keyed by a synthetic cv_path, for benchmarks that skip the filesystem."""
+        corpus = {}
+        for cv in self.iter_cvs(count):
+            cv.cv_path = f"synthetic/{cv.category}/{cv.detail_id}.txt"
+            corpus[cv.cv_path] = cv
+        return corpus
+
+    def write_corpus(self, output_dir: str, count: int, as_pdf: bool = False,
+                     sql_batch_size: int = 1000) -> str:
+        """
+        Writes output_dir/data/<CATEGORY>/<detail_id>.txt (or .pdf) plus
+        output_dir/synthetic_seeding.sql in the format of seeds/tubes3_seeding.sql,
+        so it can be loaded with Seeder.seed_and_encrypt. Rows are streamed to
+        disk, so memory use does not grow with `count`. Returns the SQL path.
+        """
+        # Absolute paths so the rows resolve no matter where the backend is started from
+        data_dir = os.path.join(os.path.abspath(output_dir), "data")
+        sql_path = os.path.join(output_dir, "synthetic_seeding.sql")
+        os.makedirs(data_dir, exist_ok=True)
+
+        profile_rows = []
+        detail_rows = []
+        seen_applicants = set()
+
+        with open(sql_path, "w", encoding="utf-8") as sql_file:
+            sql_file.write(_SCHEMA_SQL)
+            # Profiles must exist before the details referencing them, so details are written last
+            details_tmp_path = sql_path + ".details"
+            with open(details_tmp_path, "w", encoding="utf-8") as details_file:
+                for index, cv in enumerate(self.iter_cvs(count), 1):
+                    category_dir = os.path.join(data_dir, cv.category)
+                    os.makedirs(category_dir, exist_ok=True)
+                    extension = "pdf" if as_pdf else "txt"
+                    cv.cv_path = os.path.join(category_dir, f"{cv.detail_id}.{extension}")
+                    if as_pdf:
+                        write_simple_pdf(cv.cv_path, cv.text.split("\n"))
+                    else:
+                        with open(cv.cv_path, "w", encoding="utf-8") as f:
+                            f.write(cv.text)
+
+                    if cv.applicant_id not in seen_applicants:
+                        seen_applicants.add(cv.applicant_id)
+                        profile_rows.append(
+                            f"({cv.applicant_id}, {_sql_str(cv.first_name)}, {_sql_str(cv.last_name)}, "
+                            f"'{cv.date_of_birth.isoformat()}', {_sql_str(cv.address)}, {_sql_str(cv.phone_number)})")
+                    detail_rows.append(
+                        f"({cv.detail_id}, {cv.applicant_id}, {_sql_str(cv.application_role)}, {_sql_str(cv.cv_path)})")
+
+                    if len(profile_rows) >= sql_batch_size:
+                        _write_insert(sql_file, _PROFILE_INSERT, profile_rows)
+                    if len(detail_rows) >= sql_batch_size:
+                        _write_insert(details_file, _DETAIL_INSERT, detail_rows)
+                    if index % 10000 == 0:
+                        print(f"Generated {index}/{count} CVs")
+
+                _write_insert(sql_file, _PROFILE_INSERT, profile_rows)
+                _write_insert(details_file, _DETAIL_INSERT, detail_rows)
+
+            with open(details_tmp_path, "r", encoding="utf-8") as details_file:
+                for line in details_file:
+                    sql_file.write(line)
+            os.remove(details_tmp_path)
+
+        print(f"Generated {count} CVs for {len(seen_applicants)} applicants in {data_dir}")
+        print(f"Seed SQL written to {sql_path}")
+        return sql_path
+
+
+_SCHEMA_SQL = """SET NAMES 'utf8mb4' COLLATE 'utf8mb4_unicode_ci';
+
+SET FOREIGN_KEY_CHECKS = 0;
+
+DROP TABLE IF EXISTS ApplicationDetail;
+DROP TABLE IF EXISTS ApplicantProfile;
+
+SET FOREIGN_KEY_CHECKS = 1;
+
+CREATE TABLE ApplicantProfile (
+    applicant_id INT AUTO_INCREMENT PRIMARY KEY,
+    first_name VARCHAR(50),
+    last_name VARCHAR(50),
+    date_of_birth DATE,
+    address VARCHAR(255),
+    phone_number VARCHAR(20)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE ApplicationDetail (
+    detail_id INT AUTO_INCREMENT PRIMARY KEY,
+    applicant_id INT NOT NULL,
+    application_role VARCHAR(100),
+    cv_path TEXT,
+    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+"""
+
+_PROFILE_INSERT = "INSERT INTO ApplicantProfile (applicant_id, first_name, last_name, date_of_birth, address, phone_number) VALUES"
+_DETAIL_INSERT = "INSERT INTO ApplicationDetail (detail_id, applicant_id, application_role, cv_path) VALUES"
+
+
+def _sql_str(value: str) -> str:
+    # Seeder splits statements on ';' so it must never appear inside a value
+    return "'" + value.replace("\\", "\\\\").replace("'", "''").replace(";", ",") + "'"
+
+
+def _write_insert(file, header: str, rows: list[str]):
+    if not rows:
+        return
+    file.write(header + "\n" + ",\n".join(rows) + ";\n\n")
+    rows.clear()
+
+
+def write_simple_pdf(path: str, lines: list[str], lines_per_page: int = 55, max_line_length: int = 95):
+    """
+    Writes a minimal text-only PDF (Helvetica, one text object per page) that
+    pdfminer can extract. Avoids adding a PDF library as a dependency just to
+    produce benchmark fixtures.
+    """
+    wrapped = []
+    for line in lines:
+        while len(line) > max_line_length:
+            cut = line.rfind(" ", 0, max_line_length)
+            cut = cut if cut > 0 else max_line_length
+            wrapped.append(line[:cut])
+            line = line[cut:].lstrip()
+        wrapped.append(line)
+    pages = [wrapped[i:i + lines_per_page] for i in range(0, len(wrapped), lines_per_page)] or [[]]
+
+    objects = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append("<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    for page_index, page_lines in enumerate(pages):
+        content = ["BT", "/F1 10 Tf", "12 TL", "50 790 Td"]
+        for line in page_lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            content.append(f"({escaped}) Tj T*")
+        content.append("ET")
+        stream = "\n".join(content).encode("latin-1", "replace")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_ids[page_index] + 1} 0 R >>")
+        objects.append((f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream"))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        body = body if isinstance(body, bytes) else body.encode("latin-1")
+        output += f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n"
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("latin-1")
+    output += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+               f"startxref\n{xref_offset}\n%%EOF\n").encode("latin-1")
+
+    with open(path, "wb") as f:
+        f.write(output)
@@ -0,0 +1,187 @@
+import json
+import math
+import os
+import random
+import time
+
+from backend.utils.query_file import load_query_file
+
+from .corpus import ROLE_CATEGORIES, SyntheticCVGenerator
+
+STAGES = ["exact", "unmatched", "fuzzy", "rank", "profile_db", "decrypt", "assemble", "total"]
+ALGORITHMS = ["kmp", "boyer-moore", "aho-corasick"]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _misspell(rng: random.Random, word: str) -> str:
+    if len(word) < 4:
+        return word
+    index = rng.randrange(1, len(word) - 1)
+    return word[:index] + word[index + 1] + word[index] + word[index + 2:]
+
+
+def generate_query_log(count: int, seed: int = 1337) -> list[dict]:
+    """
+    Deterministic query log drawn from the synthetic corpus vocabulary. About one
+    query in four carries a misspelled keyword so the fuzzy stage is exercised too.
+    """
+    rng = random.Random(f"{seed}:queries")
+    skills = sorted({skill for _, category_skills in ROLE_CATEGORIES.values() for skill in category_skills})
+    queries = []
+    for _ in range(count):
+        keywords = rng.sample(skills, k=rng.randint(1, 4))
+        if rng.random() < 0.25:
+            keywords[0] = _misspell(rng, keywords[0])
+        queries.append({"keywords": keywords, "algorithm": rng.choice(ALGORITHMS)})
+    return queries
+
+
+def boot_backend(corpus_dir: str, count: int, seed: int, db_config: dict, seed_db: bool):
+    """
+    Generates the corpus if needed, optionally (re)seeds the database from its SQL
+    file, then loads every CV into memory exactly like the application does.
+    """
+    from backend import Seeder
+    from backend.encryption import VigenereCipher
+
+    corpus_dir = os.path.abspath(corpus_dir)
+    sql_path = os.path.join(corpus_dir, "synthetic_seeding.sql")
+    if not os.path.exists(sql_path):
+        SyntheticCVGenerator(seed=seed).write_corpus(corpus_dir, count)
+        seed_db = True
+
+    def seed(manager):
+        if seed_db:
+            print(f"Seeding benchmark database from {sql_path}...")
+            Seeder(manager.db_manager, VigenereCipher("i-see-the-key")).seed_and_encrypt(sql_path)
+
+    return boot_existing_backend(db_config, before_load=seed)
+
+
+def boot_existing_backend(db_config: dict, before_load=None):
+    """Connects to an already seeded database and loads its CVs into memory."""
+    from backend import BackendManager
+    from backend.telemetry import telemetry
+
+    # Profile DB round trips and decryption are read back from the telemetry histograms
+    telemetry.enable()
+
+    manager = BackendManager(**db_config)
+    # Replays must not feed the slow-query log they were drawn from
+    manager.slow_query_log.path = None
+    manager.db_manager.connect()
+    if not manager.db_manager.connection:
+        raise RuntimeError("Could not connect to the benchmark database")
+    if before_load:
+        before_load(manager)
+
+    load_start = time.perf_counter()
+    manager.load_cv_data_to_memory()
+    print(f"Loaded {len(manager.cv_corpus)} CVs in {time.perf_counter() - load_start:.2f} s")
+    return manager
+
+
+def reset_caches(manager):
+    manager.query_cache.clear()
+    manager.keyword_count_cache.clear()
+    manager.applicant_profiles_cache = {}
+
+
+def replay_queries(manager, queries: list[dict], warm: bool = False, top_n: int = 10,
+                   fuzzy_threshold: float = 80) -> list[dict]:
+    """
+    Runs every query through search_cvs and returns one record of per-stage
+    milliseconds per query. Unless warm is set, result and profile caches are
+    cleared first so each query pays the full scan and database cost.
+    Telemetry must be enabled for the profile_db and decrypt columns.
+    """
+    from backend.telemetry import telemetry
+
+    query_histogram = telemetry.histogram("db.query")
+    decrypt_histogram = telemetry.histogram("db.decrypt")
+    records = []
+    for query in queries:
+        if not warm:
+            reset_caches(manager)
+        query_ms_before, decrypt_ms_before = query_histogram.sum_ms, decrypt_histogram.sum_ms
+
+        start = time.perf_counter()
+        response = manager.search_cvs(
+            query["keywords"], query.get("algorithm", "kmp"),
+            top_n_matches=query.get("top_n", top_n),
+            fuzzy_threshold=query.get("fuzzy_threshold", fuzzy_threshold),
+            filters=query.get("filters"))
+        total_ms = (time.perf_counter() - start) * 1000
+
+        stage_times = response["stage_times_ms"]
+        profile_db_ms = query_histogram.sum_ms - query_ms_before
+        decrypt_ms = decrypt_histogram.sum_ms - decrypt_ms_before
+        records.append({
+            "keywords": query["keywords"],
+            "algorithm": query.get("algorithm", "kmp"),
+            "cached": response["cached"],
+            "results": len(response["results"]),
+            "exact": stage_times["exact"],
+            "unmatched": stage_times["unmatched"],
+            "fuzzy": stage_times["fuzzy"],
+            "rank": stage_times["rank"],
+            "profile_db": profile_db_ms,
+            "decrypt": decrypt_ms,
+            # What is left of result assembly once the database and decryption are taken out
+            "assemble": max(0.0, stage_times["assemble"] - profile_db_ms - decrypt_ms),
+            "total": total_ms,
+        })
+    return records
+
+
+def summarize(records: list[dict]) -> dict:
+    summary = {}
+    for stage in STAGES:
+        values = sorted(record[stage] for record in records)
+        summary[stage] = {
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "p99_ms": percentile(values, 99),
+            "mean_ms": sum(values) / len(values) if values else 0.0,
+        }
+    return summary
+
+
+def print_summary(summary: dict, query_count: int):
+    print(f"\nEnd-to-end latency over {query_count} queries")
+    print(f"{'stage':<12}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}{'mean ms':>12}")
+    for stage in STAGES:
+        row = summary[stage]
+        print(f"{stage:<12}{row['p50_ms']:>12.2f}{row['p95_ms']:>12.2f}{row['p99_ms']:>12.2f}{row['mean_ms']:>12.2f}")
+
+
+def run_e2e(corpus_dir: str, count: int = 1000, seed: int = 1337, queries_path: str | None = None,
+            query_count: int = 100, warm: bool = False, db_config: dict | None = None,
+            seed_db: bool = False, output_path: str | None = None) -> dict:
+    manager = boot_backend(corpus_dir, count, seed, db_config or {}, seed_db)
+    try:
+        queries = load_query_file(queries_path) if queries_path else generate_query_log(query_count, seed)
+        records = replay_queries(manager, queries, warm=warm)
+    finally:
+        manager.shutdown_backend()
+
+    summary = summarize(records)
+    print_summary(summary, len(records))
+    report = {
+        "meta": {"corpus": os.path.abspath(corpus_dir), "cvs": len(manager.cv_corpus),
+                 "queries": len(records), "warm": warm, "seed": seed},
+        "summary": summary,
+        "queries": records,
+    }
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"End-to-end results written to {output_path}")
+    return report
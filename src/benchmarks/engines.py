@@ -0,0 +1,110 @@
+import re
+from abc import ABC, abstractmethod
+
+from backend.algorithms import KMP, BoyerMoore, AhoCorasick, Levenshtein
+
+
+class Engine(ABC):
+    """
+    Adapter giving every matcher the same call shape:
+    run(text, patterns) -> total number of occurrences found.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def run(self, text: str, patterns: list[str]) -> int:
+        pass
+
+
+class KMPEngine(Engine):
+    name = "kmp"
+
+    def __init__(self):
+        self.algorithm = KMP()
+
+    def run(self, text, patterns):
+        return sum(len(self.algorithm.search(text, pattern)) for pattern in patterns)
+
+
+class BoyerMooreEngine(Engine):
+    name = "boyer-moore"
+
+    def __init__(self):
+        self.algorithm = BoyerMoore()
+
+    def run(self, text, patterns):
+        return sum(len(self.algorithm.search(text, pattern)) for pattern in patterns)
+
+
+class AhoCorasickEngine(Engine):
+    name = "aho-corasick"
+
+    def __init__(self):
+        self.algorithm = AhoCorasick()
+
+    def run(self, text, patterns):
+        # The automaton is cached per pattern set, as in search_cvs where one
+        # instance is reused for every CV of a query
+        return sum(len(occurrences) for occurrences in self.algorithm.search(text, patterns).values())
+
+
+class LevenshteinEngine(Engine):
+    """Mirrors the fuzzy stage: every pattern against every word of the text."""
+
+    name = "levenshtein"
+
+    def __init__(self, threshold: float = 80):
+        self.algorithm = Levenshtein()
+        self.threshold = threshold
+
+    def run(self, text, patterns):
+        words = re.findall(r'\b\w+\b', text)
+        hits = 0
+        for pattern in patterns:
+            for word in words:
+                if self.algorithm.calculate_similarity_percentage(pattern, word) >= self.threshold:
+                    hits += 1
+        return hits
+
+
+class StrFindEngine(Engine):
+    """Baseline: str.find loop, counting overlapping occurrences like KMP does."""
+
+    name = "str.find"
+
+    def run(self, text, patterns):
+        total = 0
+        for pattern in patterns:
+            if not pattern:
+                continue
+            index = text.find(pattern)
+            while index != -1:
+                total += 1
+                index = text.find(pattern, index + 1)
+        return total
+
+
+class RegexEngine(Engine):
+    """Baseline: one alternation regex with a lookahead so overlaps are counted."""
+
+    name = "re"
+
+    def run(self, text, patterns):
+        total = 0
+        # Separate lookaheads per pattern keep counts identical to the other engines
+        for pattern in patterns:
+            if pattern:
+                total += sum(1 for _ in re.finditer(f"(?={re.escape(pattern)})", text))
+        return total
+
+
+EXACT_ENGINES = [KMPEngine, BoyerMooreEngine, AhoCorasickEngine, StrFindEngine, RegexEngine]
+FUZZY_ENGINES = [LevenshteinEngine]
+
+
+def get_engines(names: list[str] | None = None) -> list[Engine]:
+    engines = [engine_class() for engine_class in EXACT_ENGINES + FUZZY_ENGINES]
+    if names:
+        engines = [engine for engine in engines if engine.name in names]
+    return engines
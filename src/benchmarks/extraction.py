@@ -0,0 +1,100 @@
+import json
+import time
+
+from .corpus import SyntheticCVGenerator
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+# A linear extractor handles a malformed line in well under a millisecond per 1000 characters;
+# the old backtracking patterns needed seconds for a few thousand
+DEFAULT_MAX_MS_PER_KCHAR = 1.0
+
+
+def _repeat_to(unit: str, size: int) -> str:
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+# Each case builds one CV whose malformed line (or whitespace run) is `size` characters long,
+# aimed at a pattern that used to backtrack polynomially on it
+ADVERSARIAL_CASES = {
+    "header_trailing_spaces": lambda size: "Skills" + " " * size + "x\nJava",
+    "header_blank_lines": lambda size: "Skills\n" + "\n" * size + "Java",
+    "summary_spaces": lambda size: "Summary\nA" + " " * size + "b",
+    "job_title_city_repeat": lambda size: "Experience\nSales Manager\n" + _repeat_to("Chicago , IL ", size) + "x",
+    "job_capitals_commas": lambda size: "Experience\nA\n" + _repeat_to("B ,C ", size) + "!",
+    "job_no_dates": lambda size: "Experience\nManager\nChicago , IL " + _repeat_to("Hooli Industries ", size) + "/ soon",
+    "education_words": lambda size: "Education\n" + _repeat_to("A a ", size),
+    "education_spaces_before_year": lambda size: "Education\nA" + " " * size + "x",
+    "education_year_spaces": lambda size: "Education\n2012 Associate: A" + " " * size + "1",
+    "education_attended_repeat": lambda size: "Education\n" + _repeat_to("Attended ", size),
+    "education_gpa_repeat": lambda size: "Education\nHusson College 2010 Associates: Nursing " + _repeat_to("GPA: ", size),
+}
+
+
+def time_extraction(extractor, text: str, min_time_s: float = 0.02) -> float:
+    """Milliseconds for one full summary extraction of text, parsing sections afresh each time."""
+    from backend.preprocessor import ParsedCV
+
+    loops = 0
+    start = time.perf_counter()
+    while True:
+        extractor.extract_cv_summary(ParsedCV(text))
+        loops += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s:
+            return elapsed * 1000 / loops
+
+
+def run_adversarial(sizes: list[int] = DEFAULT_SIZES, cases: list[str] | None = None,
+                    max_ms_per_kchar: float = DEFAULT_MAX_MS_PER_KCHAR, verbose: bool = True) -> list[dict]:
+    """
+    Times every adversarial case at every size. A row fails when extraction costs more
+    than max_ms_per_kchar per 1000 characters of the malformed line.
+    """
+    from backend.preprocessor import RegexExtractor
+
+    extractor = RegexExtractor()
+    rows = []
+    for name in cases or ADVERSARIAL_CASES:
+        for size in sizes:
+            elapsed_ms = time_extraction(extractor, ADVERSARIAL_CASES[name](size))
+            ms_per_kchar = elapsed_ms / (size / 1000)
+            row = {"case": name, "size": size, "ms": elapsed_ms, "ms_per_kchar": ms_per_kchar,
+                   "over_budget": ms_per_kchar > max_ms_per_kchar}
+            rows.append(row)
+            if verbose:
+                flag = "  OVER BUDGET" if row["over_budget"] else ""
+                print(f"{name:<30}{size:>10}{elapsed_ms:>12.3f} ms{ms_per_kchar:>10.4f} ms/kchar{flag}")
+    return rows
+
+
+def run_corpus_throughput(count: int = 1000, seed: int = 1337) -> dict:
+    """Summary extraction throughput over a synthetic corpus of well-formed CVs."""
+    from backend.preprocessor import RegexExtractor
+
+    extractor = RegexExtractor()
+    texts = [cv.text for cv in SyntheticCVGenerator(seed=seed).generate_corpus(count).values()]
+    start = time.perf_counter()
+    for text in texts:
+        extractor.extract_cv_summary(text)
+    elapsed = time.perf_counter() - start
+    result = {"cvs": count, "total_ms": elapsed * 1000, "cvs_per_second": count / elapsed if elapsed > 0 else 0.0}
+    print(f"\nSummary extraction over {count} synthetic CVs: {result['total_ms']:.1f} ms "
+          f"({result['cvs_per_second']:.0f} CVs/s)")
+    return result
+
+
+def run_extraction(sizes: list[int] = DEFAULT_SIZES, cases: list[str] | None = None,
+                   max_ms_per_kchar: float = DEFAULT_MAX_MS_PER_KCHAR, corpus_count: int = 1000,
+                   output_path: str | None = None) -> dict:
+    print(f"{'case':<30}{'chars':>10}{'time':>15}{'cost':>19}")
+    rows = run_adversarial(sizes, cases, max_ms_per_kchar)
+    report = {
+        "meta": {"sizes": sizes, "max_ms_per_kchar": max_ms_per_kchar},
+        "adversarial": rows,
+        "corpus": run_corpus_throughput(corpus_count) if corpus_count else None,
+    }
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Extraction results written to {output_path}")
+    return report
@@ -0,0 +1,44 @@
+import json
+
+from backend.telemetry import read_slow_query_log
+
+from .e2e import boot_existing_backend, print_summary, replay_queries, summarize
+
+
+def run_replay(log_path: str, db_config: dict, include_rotated: bool = True, warm: bool = False,
+               limit: int | None = None, output_path: str | None = None) -> dict:
+    """
+    Re-runs the queries of a slow-query log through BackendManager.search_cvs on the
+    database's current corpus and compares each latency with the logged one.
+    """
+    logged = read_slow_query_log(log_path, include_rotated=include_rotated)
+    if limit:
+        logged = logged[-limit:]
+    if not logged:
+        print(f"No slow queries found in {log_path}")
+        return {"queries": []}
+    print(f"Replaying {len(logged)} slow queries from {log_path}")
+
+    manager = boot_existing_backend(db_config)
+    try:
+        records = replay_queries(manager, logged, warm=warm)
+    finally:
+        manager.shutdown_backend()
+
+    print(f"\n{'logged ms':>10} {'replay ms':>10} {'change':>8}  {'corpus':>14}  keywords")
+    for original, replayed in zip(logged, records):
+        change = (replayed["total"] - original["total_ms"]) / original["total_ms"] if original["total_ms"] else 0.0
+        replayed["logged_total_ms"] = original["total_ms"]
+        replayed["logged_corpus_size"] = original.get("corpus_size")
+        corpus = f"{original.get('corpus_size', '?')}->{len(manager.cv_corpus)}"
+        print(f"{original['total_ms']:>10.1f} {replayed['total']:>10.1f} {change:>+8.0%}  {corpus:>14}  "
+              f"{', '.join(original['keywords'])} ({replayed['algorithm']})")
+
+    summary = summarize(records)
+    print_summary(summary, len(records))
+    report = {"log": log_path, "summary": summary, "queries": records}
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Replay results written to {output_path}")
+    return report
@@ -0,0 +1,82 @@
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from .engines import get_engines
+from .workloads import build_workloads, generate_patterns, generate_text
+
+DEFAULT_SEED = 1337
+# Levenshtein is O(words * |pattern| * |word|); the 100k texts would dominate the run
+FUZZY_MAX_TEXT_SIZE = 10_000
+
+
+def time_call(func, repeat: int, min_time_s: float = 0.05) -> list[float]:
+    """
+    Times func() `repeat` times. Each sample loops until min_time_s has passed
+    so that very fast calls are not lost in timer resolution; the sample is the
+    per-call average in milliseconds.
+    """
+    func()  # warm up caches (e.g. the Aho-Corasick automaton)
+    samples = []
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time_s:
+                break
+        samples.append(elapsed * 1000 / loops)
+    return samples
+
+
+def run_benchmarks(quick: bool = False, engines: list[str] | None = None,
+                   seed: int = DEFAULT_SEED, repeat: int | None = None, verbose: bool = True) -> dict:
+    repeat = repeat or (3 if quick else 5)
+    min_time_s = 0.01 if quick else 0.05
+    results = {}
+
+    for workload in build_workloads(quick):
+        rng = random.Random(f"{seed}:{workload.key}")
+        text = generate_text(workload, rng)
+        patterns = generate_patterns(workload, text, rng)
+
+        for engine in get_engines(engines):
+            if engine.name == "levenshtein" and workload.text_size > FUZZY_MAX_TEXT_SIZE:
+                continue
+            matches = engine.run(text, patterns)
+            samples = time_call(lambda: engine.run(text, patterns), repeat, min_time_s)
+            key = f"{engine.name}|{workload.key}"
+            results[key] = {
+                "engine": engine.name,
+                **workload.as_dict(),
+                "matches": matches,
+                "median_ms": statistics.median(samples),
+                "min_ms": min(samples),
+                "samples": len(samples),
+            }
+            if verbose:
+                print(f"{key:<70} {results[key]['median_ms']:>10.3f} ms  ({matches} matches)")
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "seed": seed,
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def write_results(report: dict, output_path: str):
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Benchmark results written to {output_path}")
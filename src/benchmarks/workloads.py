@@ -0,0 +1,94 @@
+import random
+import string
+from dataclasses import dataclass
+
+ALPHABETS = {
+    "dna": "acgt",
+    "english": string.ascii_lowercase + "     ",
+}
+
+CV_VOCABULARY = [
+    "java", "python", "spring", "boot", "kafka", "docker", "kubernetes", "react", "sql",
+    "database", "manager", "sales", "customer", "service", "team", "lead", "project",
+    "experience", "education", "bachelor", "university", "skills", "developed", "managed",
+    "engineer", "analyst", "accounting", "marketing", "communication", "microsoft", "office",
+]
+
+
+@dataclass(frozen=True)
+class Workload:
+    text_size: int
+    pattern_length: int
+    alphabet: str
+    keyword_count: int
+
+    @property
+    def key(self) -> str:
+        return (f"text={self.text_size}|pattern={self.pattern_length}"
+                f"|alphabet={self.alphabet}|keywords={self.keyword_count}")
+
+    def as_dict(self) -> dict:
+        return {
+            "text_size": self.text_size,
+            "pattern_length": self.pattern_length,
+            "alphabet": self.alphabet,
+            "keyword_count": self.keyword_count,
+        }
+
+
+def generate_text(workload: Workload, rng: random.Random) -> str:
+    if workload.alphabet == "cv":
+        words = []
+        length = 0
+        while length < workload.text_size:
+            word = rng.choice(CV_VOCABULARY)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)[:workload.text_size]
+    alphabet = ALPHABETS[workload.alphabet]
+    return "".join(rng.choice(alphabet) for _ in range(workload.text_size))
+
+
+def generate_patterns(workload: Workload, text: str, rng: random.Random) -> list[str]:
+    """
+    Half the patterns are cut from the text (guaranteed hits), half are random.
+    Patterns are unique so engines that key results by pattern count the same.
+    """
+    patterns = []
+    alphabet = ALPHABETS.get(workload.alphabet, string.ascii_lowercase).strip()
+    attempts = 0
+    while len(patterns) < workload.keyword_count and attempts < workload.keyword_count * 50:
+        attempts += 1
+        if len(patterns) % 2 == 0 and len(text) > workload.pattern_length:
+            start = rng.randrange(0, len(text) - workload.pattern_length)
+            pattern = text[start:start + workload.pattern_length]
+        else:
+            pattern = "".join(rng.choice(alphabet) for _ in range(workload.pattern_length))
+        if pattern not in patterns:
+            patterns.append(pattern)
+    return patterns
+
+
+def build_workloads(quick: bool = False) -> list[Workload]:
+    """
+    One-factor-at-a-time sweep around a baseline workload, so each axis
+    (text size, pattern length, alphabet, keyword count) can be read on its own
+    without paying for the full cross product.
+    """
+    base = Workload(text_size=10_000, pattern_length=8, alphabet="cv", keyword_count=5)
+    text_sizes = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    pattern_lengths = [4, 16] if quick else [3, 8, 16, 32]
+    alphabets = ["dna", "english", "cv"]
+    keyword_counts = [1, 10] if quick else [1, 5, 20]
+
+    workloads = [base]
+    workloads += [Workload(size, base.pattern_length, base.alphabet, base.keyword_count) for size in text_sizes]
+    workloads += [Workload(base.text_size, length, base.alphabet, base.keyword_count) for length in pattern_lengths]
+    workloads += [Workload(base.text_size, base.pattern_length, alphabet, base.keyword_count) for alphabet in alphabets]
+    workloads += [Workload(base.text_size, base.pattern_length, base.alphabet, count) for count in keyword_counts]
+
+    unique = []
+    for workload in workloads:
+        if workload not in unique:
+            unique.append(workload)
+    return unique
@@ -1,6 +1,17 @@
-from .window import VitaeLangXWindow
-from .components import *
-from .page import *
+import importlib
+
+_LAZY_ATTRS = {
+    'VitaeLangXWindow': '.window',
+    'Sidebar': '.components',
+    'HomePage': '.page',
+    'AboutPage': '.page',
+    'CreatorPage': '.page',
+    'OpeningPage': '.page',
+    'SearchPage': '.page',
+    'ResultPage': '.page',
+    'CVPage': '.page',
+    'SummaryPage': '.page',
+}
 
 # __all__ = ['VitaeLangXWindow']
 __all__ = [
@@ -14,4 +25,17 @@ __all__ = [
     'ResultPage',
     'CVPage',
     'SummaryPage'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
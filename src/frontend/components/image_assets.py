@@ -0,0 +1,49 @@
+import os
+
+import customtkinter as ctk
+
+_ASSET_DIRS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets"),
+    os.path.join(".", "assets"),
+    os.path.join("..", "assets"),
+    os.path.join("frontend", "assets"),
+]
+
+# (filename, size) -> CTkImage, shared by every page for the lifetime of the app
+_image_cache = {}
+
+
+def _find_asset(filename):
+    for asset_dir in _ASSET_DIRS:
+        path = os.path.join(asset_dir, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def get_image(filename, size):
+    """
+    Return a cached CTkImage for assets/<filename> displayed at size, or None if missing.
+    The PNG is decoded once and downscaled to at most twice the display size (enough
+    for HiDPI scaling), so rebuilding a page never touches the disk again.
+    """
+    key = (filename, tuple(size))
+    if key in _image_cache:
+        return _image_cache[key]
+
+    image_path = _find_asset(filename)
+    if image_path is None:
+        print(f"Image asset not found: {filename}")
+        _image_cache[key] = None
+        return None
+
+    # PIL is only needed the first time an image is requested
+    from PIL import Image
+
+    with Image.open(image_path) as source:
+        image = source.copy()
+    image.thumbnail((size[0] * 2, size[1] * 2))
+
+    ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=size)
+    _image_cache[key] = ctk_image
+    return ctk_image
@@ -1,6 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from .image_assets import get_image
 
 class Sidebar(ctk.CTkFrame):
     
@@ -51,44 +50,16 @@ class Sidebar(ctk.CTkFrame):
     
     def create_logo_widget(self, parent):
         """Create logo widget from assets/logo.png"""
-        # Try multiple paths for logo
-        logo_paths = [
-            "assets/logo.png",
-            os.path.join(".", "assets", "logo.png"),
-            os.path.join("..", "assets", "logo.png"),
-            os.path.join("frontend", "assets", "logo.png"),
-        ]
-        
-        # Add absolute paths
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            logo_paths.extend([
-                os.path.join(current_dir, "assets", "logo.png"),
-                os.path.join(current_dir, "..", "assets", "logo.png"),
-                os.path.join(current_dir, "..", "..", "assets", "logo.png"),
-            ])
-        except:
-            pass
-        
-        # Try each path
-        for logo_path in logo_paths:
-            if os.path.exists(logo_path):
-                logo_image = Image.open(logo_path)
-                
-                logo_ctk_image = ctk.CTkImage(
-                    light_image=logo_image,
-                    dark_image=logo_image,
-                    size=(32, 32)
-                )
-                
-                logo_label = ctk.CTkLabel(
-                    parent,
-                    image=logo_ctk_image,
-                    text=""
-                )
-                
-                return logo_label
-    
+        logo_ctk_image = get_image("logo.png", (32, 32))
+        if logo_ctk_image:
+            logo_label = ctk.CTkLabel(
+                parent,
+                image=logo_ctk_image,
+                text=""
+            )
+            
+            return logo_label
+
     def create_navigation(self):
         """Create navigation buttons"""
         nav_frame = ctk.CTkFrame(self, fg_color="transparent")
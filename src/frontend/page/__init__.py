@@ -1,11 +1,17 @@
-from .summary import *
-from .search import *
-from .result import *
-from .cv import *
-from .opening import *
-from .about import *
-from .creator import *
-from .home import *
+import importlib
+
+# Page modules are imported when a page is first shown (PEP 562)
+_LAZY_PAGES = {
+    "SummaryPage": ".summary",
+    "SearchPage": ".search",
+    "ResultPage": ".result",
+    "CVPage": ".cv",
+    "OpeningPage": ".opening",
+    "AboutPage": ".about",
+    "CreatorPage": ".creator",
+    "HomePage": ".home",
+}
+
 __all__ = (
     "SummaryPage",
     "SearchPage",
@@ -16,3 +22,16 @@ __all__ = (
     "CreatorPage",
     "HomePage",
 )
+
+
+def __getattr__(name):
+    module_name = _LAZY_PAGES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PAGES))
@@ -1,6 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from ..components.image_assets import get_image
 
 class AboutPage(ctk.CTkFrame):
     
@@ -443,45 +442,19 @@ no great candidate goes unnoticed in your talent search."""
         })
     
     def create_bearlock_image(self, parent):
-        """Create Bearlock image with enhanced fallback paths"""
-        image_paths = [
-            "assets/bearlock.png",
-            os.path.join(".", "assets", "bearlock.png"),
-            os.path.join("..", "assets", "bearlock.png"),
-            os.path.join("frontend", "assets", "bearlock.png"),
-        ]
-        
+        """Create Bearlock image from the shared asset cache"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_paths.extend([
-                os.path.join(current_dir, "assets", "bearlock.png"),
-                os.path.join(current_dir, "..", "assets", "bearlock.png"),
-                os.path.join(current_dir, "..", "..", "assets", "bearlock.png"),
-            ])
-        except:
-            pass
-        
-        for image_path in image_paths:
-            if os.path.exists(image_path):
-                try:
-                    bearlock_image = Image.open(image_path)
-                    
-                    bearlock_ctk_image = ctk.CTkImage(
-                        light_image=bearlock_image,
-                        dark_image=bearlock_image,
-                        size=(200, 200)
-                    )
-                    
-                    image_label = ctk.CTkLabel(
-                        parent,
-                        image=bearlock_ctk_image,
-                        text=""
-                    )
-                    image_label.pack()
-                    
-                    return image_label
-                except Exception as e:
-                    print(f"Error loading image from {image_path}: {e}")
-                    continue
-        
-        return None
\ No newline at end of file
+            bearlock_ctk_image = get_image("bearlock.png", (200, 200))
+            if bearlock_ctk_image:
+                image_label = ctk.CTkLabel(
+                    parent,
+                    image=bearlock_ctk_image,
+                    text=""
+                )
+                image_label.pack()
+                
+                return image_label
+        except Exception as e:
+            print(f"Error loading bearlock.png: {e}")
+        
+        return None
@@ -1,6 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from ..components.image_assets import get_image
 
 class CreatorPage(ctk.CTkFrame):
     def __init__(self, parent, navigate_callback):
@@ -123,42 +122,17 @@ class CreatorPage(ctk.CTkFrame):
         dinda_nim.pack()
     
     def create_team_photo(self, parent):
-        photo_paths = [
-            "assets/trio.png",
-            os.path.join(".", "assets", "trio.png"),
-            os.path.join("..", "assets", "trio.png"),
-            os.path.join("frontend", "assets", "trio.png"),
-        ]
-        
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            photo_paths.extend([
-                os.path.join(current_dir, "assets", "trio.png"),
-                os.path.join(current_dir, "..", "assets", "trio.png"),
-                os.path.join(current_dir, "..", "..", "assets", "trio.png"),
-            ])
-        except:
-            pass
-
-        for photo_path in photo_paths:
-            if os.path.exists(photo_path):
-                try:
-                    photo_image = Image.open(photo_path)
-                    
-                    photo_ctk_image = ctk.CTkImage(
-                        light_image=photo_image,
-                        dark_image=photo_image,
-                        size=(400, 300)  
-                    )
-                    
-                    photo_label = ctk.CTkLabel(
-                        parent,
-                        image=photo_ctk_image,
-                        text=""
-                    )
-                    
-                    return photo_label
-                except Exception as e:
-                    continue
-        
-        return None
\ No newline at end of file
+            photo_ctk_image = get_image("trio.png", (400, 300))
+            if photo_ctk_image:
+                photo_label = ctk.CTkLabel(
+                    parent,
+                    image=photo_ctk_image,
+                    text=""
+                )
+                
+                return photo_label
+        except Exception as e:
+            print(f"Error loading trio.png: {e}")
+        
+        return None
@@ -1,7 +1,7 @@
 # src/frontend/page/cv/cv.py
 import customtkinter as ctk
-from PIL import Image
 import os
+from ...components.image_assets import get_image
 
 class CVPage(ctk.CTkFrame):
     
@@ -198,30 +198,24 @@ every detail, just as they wrote it."""
    
     def create_bearlock_happy_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "bearlock-happy.png")
-            if not os.path.exists(image_path): image_path = "./assets/bearlock-happy.png"
-            if os.path.exists(image_path):
-                bearlock_image = Image.open(image_path)
-                bearlock_ctk_image = ctk.CTkImage(light_image=bearlock_image, dark_image=bearlock_image, size=(120, 120))
+            bearlock_ctk_image = get_image("bearlock-happy.png", (120, 120))
+            if bearlock_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=bearlock_ctk_image, text="")
                 image_label.pack()
-            else: raise FileNotFoundError("Bearlock happy image not found")
+            else:
+                raise FileNotFoundError("Bearlock happy image not found")
         except Exception as e:
             print(f"Error loading bearlock-happy.png: {e}")
             ctk.CTkLabel(parent, text="🐻😊", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
-    
+
     def create_asset1_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "asset1.png")
-            if not os.path.exists(image_path): image_path = "./assets/asset1.png"
-            if os.path.exists(image_path):
-                asset_image = Image.open(image_path)
-                asset_ctk_image = ctk.CTkImage(light_image=asset_image, dark_image=asset_image, size=(80, 80))
+            asset_ctk_image = get_image("asset1.png", (80, 80))
+            if asset_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=asset_ctk_image, text="")
                 image_label.pack()
-            else: raise FileNotFoundError("Asset1 image not found")
+            else:
+                raise FileNotFoundError("Asset1 image not found")
         except Exception as e:
             print(f"Error loading asset1.png: {e}")
-            ctk.CTkLabel(parent, text="📄", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
\ No newline at end of file
+            ctk.CTkLabel(parent, text="📄", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
@@ -1,6 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from ..components.image_assets import get_image
 
 class HomePage(ctk.CTkFrame):
     
@@ -61,42 +60,16 @@ class HomePage(ctk.CTkFrame):
     def create_logo_widget(self, parent, size=(200, 200)):
         
         try:
-            logo_paths_to_try = [
-                "assets/logo.png",  
-                os.path.join(".", "assets", "logo.png"),
-                os.path.join("..", "assets", "logo.png"),
-                os.path.join("frontend", "assets", "logo.png"),
-            ]
+            logo_ctk_image = get_image("logo.png", size)
             
-            try:
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                logo_paths_to_try.extend([
-                    os.path.join(current_dir, "assets", "logo.png"),
-                    os.path.join(current_dir, "..", "assets", "logo.png"),
-                    os.path.join(current_dir, "..", "..", "assets", "logo.png"),
-                ])
-            except:
-                pass
-            
-            for logo_path in logo_paths_to_try:
+            if logo_ctk_image:
+                logo_label = ctk.CTkLabel(
+                    parent,
+                    image=logo_ctk_image,
+                    text=""  
+                )
                 
-                if os.path.exists(logo_path):
-                    
-                    logo_image = Image.open(logo_path)
-                    
-                    logo_ctk_image = ctk.CTkImage(
-                        light_image=logo_image,
-                        dark_image=logo_image,
-                        size=size 
-                    )
-                    
-                    logo_label = ctk.CTkLabel(
-                        parent,
-                        image=logo_ctk_image,
-                        text=""  
-                    )
-                    
-                    return logo_label
+                return logo_label
             
             raise FileNotFoundError(f"Logo not found at any expected locations")
                 
@@ -107,7 +80,7 @@ class HomePage(ctk.CTkFrame):
                 font=ctk.CTkFont(size=48) 
             )
             return logo_label
-    
+
     def create_search_button(self, parent):
         search_button = ctk.CTkButton(
             parent,
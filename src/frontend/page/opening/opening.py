@@ -1,10 +1,9 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from ...components.image_assets import get_image
 
 class OpeningPage(ctk.CTkFrame):
     
-    def __init__(self, parent, navigate_callback):
+    def __init__(self, parent, navigate_callback, backend_manager=None):
         super().__init__(
             parent,
             fg_color="#1B2B4C",
@@ -12,9 +11,21 @@ class OpeningPage(ctk.CTkFrame):
         )
         
         self.navigate_callback = navigate_callback
+        self.backend_manager = backend_manager
+        self._loading_poll_id = None
         self.pack(fill="both", expand=True)
+        self.bind("<Destroy>", self._on_destroy)
         
         self.setup_opening_page()
+        self.update_loading_status()
+    
+    def _on_destroy(self, event):
+        if event.widget == self and self._loading_poll_id is not None:
+            try:
+                self.after_cancel(self._loading_poll_id)
+            except Exception:
+                pass
+            self._loading_poll_id = None
     
     def setup_opening_page(self):
         main_container = ctk.CTkFrame(self, fg_color="transparent")
@@ -91,8 +102,58 @@ class OpeningPage(ctk.CTkFrame):
         )
         description_label.pack(expand=True)
         
+        self.create_loading_indicator(text_container)
         self.create_action_button(parent)
     
+    def create_loading_indicator(self, parent):
+        loading_container = ctk.CTkFrame(parent, fg_color="transparent")
+        loading_container.pack(pady=(20, 0))
+        
+        self.loading_label = ctk.CTkLabel(
+            loading_container,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#334D7A"
+        )
+        self.loading_label.pack()
+        
+        self.loading_progress = ctk.CTkProgressBar(
+            loading_container,
+            width=300,
+            progress_color="#334D7A"
+        )
+        self.loading_progress.set(0)
+        self.loading_progress.pack(pady=(5, 0))
+    
+    def update_loading_status(self):
+        """Poll the background corpus loader and reflect its progress"""
+        self._loading_poll_id = None
+        if self.backend_manager is None or not self.winfo_exists():
+            return
+        
+        status = self.backend_manager.get_loading_status()
+        phase = status["phase"]
+        loaded, total = status["loaded"], status["total"]
+        
+        if phase == "ready":
+            self.loading_label.configure(text=f"{loaded} CVs ready to search")
+            self.loading_progress.set(1)
+            return
+        if phase == "failed":
+            self.loading_label.configure(text="Could not load CVs, check the database connection", text_color="tomato")
+            self.loading_progress.set(0)
+            return
+        
+        if phase == "loading" and total:
+            self.loading_label.configure(text=f"Loading CVs... {loaded}/{total} (you can already search the loaded ones)")
+            self.loading_progress.set(loaded / total)
+        elif phase == "seeding":
+            self.loading_label.configure(text="Preparing the database...")
+        else:
+            self.loading_label.configure(text="Connecting to the database...")
+        
+        self._loading_poll_id = self.after(200, self.update_loading_status)
+    
     def create_bearlock_image(self, parent):
         image_container = ctk.CTkFrame(parent, fg_color="transparent")
         image_container.pack(expand=True)
@@ -144,17 +205,9 @@ class OpeningPage(ctk.CTkFrame):
     
     def load_bearlock_image(self, parent):
         try:
-            image_path = "./assets/bearlock.png"
+            bearlock_ctk_image = get_image("bearlock.png", (200, 200))
             
-            if os.path.exists(image_path):
-                bearlock_image = Image.open(image_path)
-                
-                bearlock_ctk_image = ctk.CTkImage(
-                    light_image=bearlock_image,
-                    dark_image=bearlock_image,
-                    size=(200, 200)
-                )
-                
+            if bearlock_ctk_image:
                 image_label = ctk.CTkLabel(
                     parent,
                     image=bearlock_ctk_image,
@@ -167,7 +220,7 @@ class OpeningPage(ctk.CTkFrame):
             print(f"Error loading bearlock image: {e}")
             
         return None
-    
+
     def proceed_to_search(self):
         print("Proceeding to main search interface...")
         self.navigate_callback("search")
\ No newline at end of file
@@ -1,11 +1,10 @@
 # src/frontend/page/result/result.py
 import customtkinter as ctk
-from PIL import Image
-import os
+from ...components.image_assets import get_image
 
 class ResultPage(ctk.CTkFrame):
     
-    def __init__(self, parent, navigate_callback, backend_manager, search_results=None, **kwargs):
+    def __init__(self, parent, navigate_callback, backend_manager, search_results=None, search_stream=None, **kwargs):
         super().__init__(
             parent,
             fg_color="#1B2B4C", 
@@ -15,14 +14,58 @@ class ResultPage(ctk.CTkFrame):
         
         self.navigate_callback = navigate_callback
         self.backend_manager = backend_manager 
+        self.search_stream = search_stream
+        if search_stream is not None and search_stream.latest is not None:
+            search_results = search_stream.latest
         self.search_results_data = search_results if search_results else {"results": []} 
         self.pack(fill="both", expand=True)
         
         # Bind to configure event for responsive design
         self.bind("<Configure>", self._on_window_configure)
+        self.bind("<Destroy>", self._on_destroy)
         self._text_widgets_to_wrap = []
+        self._stream_poll_id = None
+        self._rendered_stream_version = search_stream.version if search_stream else 0
         
         self.setup_result_page()
+        
+        if search_stream is not None and not search_stream.done:
+            self._stream_poll_id = self.after(100, self._poll_search_stream)
+    
+    def _on_destroy(self, event):
+        if event.widget == self and self._stream_poll_id is not None:
+            try:
+                self.after_cancel(self._stream_poll_id)
+            except Exception:
+                pass
+            self._stream_poll_id = None
+    
+    def _poll_search_stream(self):
+        """Re-render the header and cards whenever the search stream publishes a new snapshot"""
+        self._stream_poll_id = None
+        if not self.winfo_exists():
+            return
+        
+        stream = self.search_stream
+        if stream.version != self._rendered_stream_version and stream.latest is not None:
+            self._rendered_stream_version = stream.version
+            self.search_results_data = stream.latest
+            self.refresh_results()
+        
+        if not stream.done:
+            self._stream_poll_id = self.after(100, self._poll_search_stream)
+        elif stream.error() is not None:
+            print(f"Search error: {stream.error()}")
+    
+    def refresh_results(self):
+        """Update the description and rebuild the result cards in place"""
+        self.description_label.configure(text=self._get_description_text())
+        for widget in self.scrollable_results_area.winfo_children():
+            widget.destroy()
+        self._text_widgets_to_wrap = [
+            info for info in self._text_widgets_to_wrap if info['widget'] is self.description_label
+        ]
+        self.create_results_grid(self.scrollable_results_area)
     
     def _on_window_configure(self, event):
         """Handle window resize events to update text wrapping"""
@@ -85,10 +128,16 @@ class ResultPage(ctk.CTkFrame):
             fg_color="#334D7A",
             hover_color="#1B2B4C", 
             text_color="#DFCFC2",
-            command=lambda: self.navigate_callback("search")
+            command=self.go_back_to_search
         )
         back_button.pack(anchor="nw", pady=(0, 0)) 
     
+    def go_back_to_search(self):
+        # A new search is about to be made, so stop the one still streaming
+        if self.search_stream is not None and not self.search_stream.done:
+            self.search_stream.cancel()
+        self.navigate_callback("search")
+    
     def create_header_section(self, parent): 
         header_content = ctk.CTkFrame(parent, fg_color="transparent") 
         header_content.pack(pady=10)
@@ -104,24 +153,16 @@ class ResultPage(ctk.CTkFrame):
         )
         title_label.pack(pady=(0, 8)) 
         
-        # Get dynamic timing information from search results
-        total_cvs_scanned = self._get_total_cvs_scanned()
-        search_time = self._get_search_time()
-        
-        # Create dynamic description with actual search data
-        description_text = f"""The search is complete! Bearlock Holmes has scanned {total_cvs_scanned} CVs in just {search_time} ms and uncovered
-candidates that match your clues. Whether it's an exact keyword hit or a fuzzy match, the most
-promising profiles are now on your desk."""
-
         description_label = ctk.CTkLabel(
             center_content,
-            text=description_text,
+            text=self._get_description_text(),
             font=ctk.CTkFont(size=14), 
             text_color="#FFFFFF",      
             justify="center",
             wraplength=700 
         )
         description_label.pack(pady=(5, 0))
+        self.description_label = description_label
         
         # Track description for responsive wrapping
         self._text_widgets_to_wrap.append({
@@ -129,6 +170,23 @@ promising profiles are now on your desk."""
             'padding': 120
         })
 
+    def _get_description_text(self):
+        """Build the header description; partial snapshots from a running search say so"""
+        if self.search_results_data.get("done", True) is False:
+            stage_text = "exact matching" if self.search_results_data.get("stage") == "exact" else "fuzzy matching"
+            return f"""Bearlock Holmes is still on the case ({stage_text}: {self.search_results_data.get('processed', 0)} of
+{self.search_results_data.get('total', 0)} CVs). These are the most promising candidates found so far, the list
+will keep updating as more CVs are scanned."""
+        
+        # Get dynamic timing information from search results
+        total_cvs_scanned = self._get_total_cvs_scanned()
+        search_time = self._get_search_time()
+        
+        # Create dynamic description with actual search data
+        return f"""The search is complete! Bearlock Holmes has scanned {total_cvs_scanned} CVs in just {search_time} ms and uncovered
+candidates that match your clues. Whether it's an exact keyword hit or a fuzzy match, the most
+promising profiles are now on your desk."""
+
     def _get_total_cvs_scanned(self):
         """Get the total number of CVs scanned from backend or estimate"""
         try:
@@ -379,34 +437,24 @@ promising profiles are now on your desk."""
 
     def create_hat_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "asset2.png")
-            if not os.path.exists(image_path): 
-                image_path = "./assets/asset2.png" 
-            if os.path.exists(image_path):
-                hat_image = Image.open(image_path)
-                hat_ctk_image = ctk.CTkImage(light_image=hat_image, dark_image=hat_image, size=(100, 95))
+            hat_ctk_image = get_image("asset2.png", (100, 95))
+            if hat_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=hat_ctk_image, text="")
                 image_label.pack()
-            else: 
+            else:
                 raise FileNotFoundError("Hat image not found")
         except Exception as e:
             print(f"Error loading asset2.png (hat): {e}")
             ctk.CTkLabel(parent, text="🎩", font=ctk.CTkFont(size=40), text_color="#DFCFC2").pack()
-    
+
     def create_book_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "asset4.png")
-            if not os.path.exists(image_path): 
-                image_path = "./assets/asset4.png"
-            if os.path.exists(image_path):
-                book_image = Image.open(image_path)
-                book_ctk_image = ctk.CTkImage(light_image=book_image, dark_image=book_image, size=(90, 100))
+            book_ctk_image = get_image("asset4.png", (90, 100))
+            if book_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=book_ctk_image, text="")
                 image_label.pack()
-            else: 
+            else:
                 raise FileNotFoundError("Book image not found")
         except Exception as e:
             print(f"Error loading asset4.png (book): {e}")
-            ctk.CTkLabel(parent, text="📖", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
\ No newline at end of file
+            ctk.CTkLabel(parent, text="📖", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
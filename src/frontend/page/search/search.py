@@ -1,6 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from ...components.image_assets import get_image
 import re
 from backend import Settings
 
@@ -26,8 +25,29 @@ class SearchPage(ctk.CTkFrame):
         self.bind("<Configure>", self._on_window_configure)
         self._text_widgets_to_wrap = []
         
+        # Background search state
+        self._search_stream = None
+        self._search_poll_id = None
+        self.bind("<Destroy>", self._on_destroy)
+        
         self.setup_search_page()
     
+    def _on_destroy(self, event):
+        """Cancel any running search when the user navigates away"""
+        if event.widget == self:
+            self._cancel_running_search()
+    
+    def _cancel_running_search(self):
+        if self._search_stream is not None:
+            self._search_stream.cancel()
+            self._search_stream = None
+        if self._search_poll_id is not None:
+            try:
+                self.after_cancel(self._search_poll_id)
+            except Exception:
+                pass
+            self._search_poll_id = None
+    
     def _on_window_configure(self, event):
         """Handle window resize events to update text wrapping"""
         if event.widget == self:
@@ -301,7 +321,7 @@ system reveal the most relevant candidates, exact or approximate."""
         button_container = ctk.CTkFrame(parent, fg_color="transparent")
         button_container.pack()
         
-        search_button = ctk.CTkButton(
+        self.search_button = ctk.CTkButton(
             button_container,
             text="🔍 Search Now",
             font=ctk.CTkFont(size=16, weight="normal"),
@@ -315,28 +335,26 @@ system reveal the most relevant candidates, exact or approximate."""
             text_color="#DFCFC2",
             command=self.perform_search
         )
-        search_button.pack()
+        self.search_button.pack()
+        
+        # Progress feedback while the search runs in the background
+        self.search_status_label = ctk.CTkLabel(
+            button_container,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#DFCFC2"
+        )
+        self.search_status_label.pack(pady=(8, 0))
     
     def create_bearlock_sad_image(self, parent):
         """Create Bearlock sad image with fallback"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "bearlock-sad.png")
-            if not os.path.exists(image_path):
-                image_path = "./assets/bearlock-sad.png"
-            
-            if os.path.exists(image_path):
-                bearlock_image = Image.open(image_path)
-                bearlock_ctk_image = ctk.CTkImage(
-                    light_image=bearlock_image,
-                    dark_image=bearlock_image,
-                    size=(130, 130)
-                )
+            bearlock_ctk_image = get_image("bearlock-sad.png", (130, 130))
+            if bearlock_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=bearlock_ctk_image, text="")
                 image_label.pack()
             else:
                 raise FileNotFoundError("Bearlock sad image not found")
-                
         except Exception as e:
             print(f"Error loading bearlock-sad.png: {e}")
             placeholder = ctk.CTkLabel(
@@ -346,27 +364,16 @@ system reveal the most relevant candidates, exact or approximate."""
                 text_color="#DFCFC2"
             )
             placeholder.pack()
-    
+
     def create_asset3_image(self, parent):
         """Create asset3 image with fallback"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "asset3.png")
-            if not os.path.exists(image_path):
-                image_path = "./assets/asset3.png"
-            
-            if os.path.exists(image_path):
-                asset_image = Image.open(image_path)
-                asset_ctk_image = ctk.CTkImage(
-                    light_image=asset_image,
-                    dark_image=asset_image,
-                    size=(80, 70)
-                )
+            asset_ctk_image = get_image("asset3.png", (80, 70))
+            if asset_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=asset_ctk_image, text="")
                 image_label.pack()
             else:
                 raise FileNotFoundError("Asset3 image not found")
-                
         except Exception as e:
             print(f"Error loading asset3.png: {e}")
             placeholder = ctk.CTkLabel(
@@ -376,7 +383,7 @@ system reveal the most relevant candidates, exact or approximate."""
                 text_color="#DFCFC2"
             )
             placeholder.pack()
-    
+
     def select_algorithm_segmented(self, value):
         """Handle algorithm selection"""
         self.selected_algorithm.set(value)
@@ -434,28 +441,55 @@ system reveal the most relevant candidates, exact or approximate."""
         print(f"Using algorithm: {algorithm}")
         print(f"Top matches: {top_matches}")
         
-        # Perform search using backend
+        # Stream the search on a worker thread so the window stays responsive
         if self.backend_manager:
-            try:
-                search_results_data = self.backend_manager.search_cvs(
-                    keywords=keywords_list,
-                    algorithm=algorithm,
-                    top_n_matches=top_matches,
-                    fuzzy_threshold=Settings.FUZZY_THRESHOLD
-                )
-                
-                print("------ SEARCH RESULTS DATA (from SearchPage) ------")
-                import json
-                print(json.dumps(search_results_data, indent=2))
-                print("----------------------------------------------------")
-                
-                # Navigate to results with data
-                self.navigate_callback("result", search_results=search_results_data)
-                
-            except Exception as e:
-                print(f"Search error: {e}")
-                # Could add error handling UI here
-                self.navigate_callback("result", search_results=None)
+            if self._search_stream is not None and not self._search_stream.done:
+                print("A search is already running.")
+                return
+            
+            self._search_stream = self.backend_manager.submit_search_stream(
+                keywords=keywords_list,
+                algorithm=algorithm,
+                top_n_matches=top_matches,
+                fuzzy_threshold=Settings.FUZZY_THRESHOLD
+            )
+            self.search_button.configure(state="disabled", text="Searching...")
+            self.search_status_label.configure(text="Starting search...")
+            self._search_poll_id = self.after(50, self._poll_search)
         else:
             print("Backend manager not available.")
-            self.navigate_callback("result", search_results=None)
\ No newline at end of file
+            self.navigate_callback("result", search_results=None)
+    
+    def _poll_search(self):
+        """Check the background search from the Tk event loop"""
+        self._search_poll_id = None
+        if not self.winfo_exists():
+            return
+        
+        stream = self._search_stream
+        if stream is None:
+            return
+        
+        snapshot = stream.latest
+        error = stream.error()
+        if error is not None:
+            self._search_stream = None
+            self.search_button.configure(state="normal", text="🔍 Search Now")
+            self.search_status_label.configure(text="")
+            print(f"Search error: {error}")
+            # Could add error handling UI here
+            self.navigate_callback("result", search_results=None)
+            return
+        
+        # Show results as soon as the first candidates are in; ResultPage keeps updating
+        if stream.done or (snapshot and snapshot["results"]):
+            self._search_stream = None
+            self.navigate_callback("result", search_results=snapshot, search_stream=stream)
+            return
+        
+        if snapshot:
+            percent = (snapshot["processed"] / snapshot["total"] * 100) if snapshot["total"] else 100
+            stage_text = "Exact matching" if snapshot["stage"] == "exact" else "Fuzzy matching"
+            self.search_status_label.configure(
+                text=f"{stage_text}: {snapshot['processed']}/{snapshot['total']} CVs ({percent:.0f}%)")
+        self._search_poll_id = self.after(50, self._poll_search)
@@ -1,7 +1,6 @@
 # src/frontend/page/summary/summary.py
 import customtkinter as ctk
-from PIL import Image
-import os
+from ...components.image_assets import get_image
  
 class SummaryPage(ctk.CTkFrame):
     
@@ -61,46 +60,12 @@ class SummaryPage(ctk.CTkFrame):
             self._display_error_message(error_msg)
             return
         
-        cv_text_to_extract = ""
-        path_used_for_extraction = ""
-
-        # Determine which CV path to use for text extraction
-        if self.cv_path_for_extraction and os.path.exists(self.cv_path_for_extraction):
-            print(f"SummaryPage: Using specific CV path for extraction: {self.cv_path_for_extraction}")
-            path_used_for_extraction = self.cv_path_for_extraction
-        elif self.applicant_id:
-            print(f"SummaryPage: No specific CV path, deriving from applicant_id: {self.applicant_id}")
-            derived_path = self.backend_manager.get_raw_cv_path(self.applicant_id)
-            if derived_path and os.path.exists(derived_path):
-                path_used_for_extraction = derived_path
-            else:
-                print(f"SummaryPage: Could not derive a valid CV path for applicant_id {self.applicant_id}")
-        
-        if not path_used_for_extraction:
-            self._display_error_message(f"No valid CV path found for applicant {self.applicant_id} for summary extraction.")
-            return
-
-        cv_text = self.backend_manager.cv_processor.extract_text_from_pdf(path_used_for_extraction)
-        
-        if not cv_text or not cv_text.strip():
-            self._display_error_message(f"CV content is empty or could not be extracted from {os.path.basename(path_used_for_extraction)}")
-            return
-        
-        cv_text_to_extract = cv_text
-
-        try:
-            extracted_info = {
-                "skills": self.backend_manager.regex_extractor.extract_skills(cv_text_to_extract),
-                "job_history": self.backend_manager.regex_extractor.extract_job_history(cv_text_to_extract),
-                "education": self.backend_manager.regex_extractor.extract_education(cv_text_to_extract)
-            }
-            
-            print(f"DEBUG: Extracted job history: {extracted_info['job_history']}")
-            print(f"DEBUG: Job history type: {type(extracted_info['job_history'])}")
-            
-        except Exception as e:
-            print(f"ERROR during regex extraction: {e}")
-            self._display_error_message(f"Failed to extract information from CV: {str(e)}")
+        # Skills, job history and education are precomputed when the corpus is loaded
+        extracted_info = self.backend_manager.get_cv_extracted_info(
+            self.applicant_id, self.cv_path_for_extraction)
+        if "error" in extracted_info:
+            print(f"ERROR (SummaryPage Extraction): {extracted_info['error']}")
+            self._display_error_message(extracted_info["error"])
             return
 
         self.summary_data = {
@@ -608,13 +573,8 @@ assess compatibility at a glance.""",
 
     def create_bearlock_confuse_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "bearlock-confuse.png") 
-            if not os.path.exists(image_path):
-                image_path = "./assets/bearlock-confuse.png"
-            if os.path.exists(image_path):
-                bearlock_image = Image.open(image_path)
-                bearlock_ctk_image = ctk.CTkImage(light_image=bearlock_image, dark_image=bearlock_image, size=(120, 120))
+            bearlock_ctk_image = get_image("bearlock-confuse.png", (120, 120))
+            if bearlock_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=bearlock_ctk_image, text="")
                 image_label.pack()
             else:
@@ -622,20 +582,15 @@ assess compatibility at a glance.""",
         except Exception as e:
             print(f"Error loading bearlock-confuse.png: {e}")
             ctk.CTkLabel(parent, text="🐻🤔", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
-    
+
     def create_asset4_image(self, parent):
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            image_path = os.path.join(current_dir, "..", "..", "assets", "asset4.png")
-            if not os.path.exists(image_path):
-                image_path = "./assets/asset4.png"
-            if os.path.exists(image_path):
-                asset_image = Image.open(image_path)
-                asset_ctk_image = ctk.CTkImage(light_image=asset_image, dark_image=asset_image, size=(80, 80))
+            asset_ctk_image = get_image("asset4.png", (80, 80))
+            if asset_ctk_image:
                 image_label = ctk.CTkLabel(parent, image=asset_ctk_image, text="")
                 image_label.pack()
             else:
                 raise FileNotFoundError("Asset4 image not found")
         except Exception as e:
             print(f"Error loading asset4.png: {e}")
-            ctk.CTkLabel(parent, text="📚", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
\ No newline at end of file
+            ctk.CTkLabel(parent, text="📚", font=ctk.CTkFont(size=50), text_color="#DFCFC2").pack()
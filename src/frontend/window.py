@@ -3,7 +3,7 @@ import customtkinter as ctk
 from backend import BackendManager, Settings
 
 from .components import *
-from .page import *
+from . import page as pages
 
 
 class VitaeLangXWindow:
@@ -18,6 +18,8 @@ class VitaeLangXWindow:
         self.root.configure(fg_color="#1B2B4C")
 
         self.current_page = None
+        self.last_search_results_cache = None
+        self.last_search_stream_cache = None
 
         self.backend_manager = None
         self.initialize_app_backend()
@@ -30,8 +32,9 @@ class VitaeLangXWindow:
         self.backend_manager = BackendManager()
 
         if self.backend_manager:
-            self.backend_manager.initialize_backend()
-            print("Backend for GUI initialized.")
+            # DB connection and CV extraction run in the background; OpeningPage shows progress
+            self.backend_manager.start_background_initialization()
+            print("Backend for GUI is loading in the background.")
         else:
             print(
                 "CRITICAL ERROR: BackendManager could not be instantiated in initialize_app_backend.")
@@ -68,6 +71,15 @@ class VitaeLangXWindow:
             error_label.pack(expand=True, padx=20, pady=20)
             return
 
+        if page_name not in ("result", "cv", "summary") and self.last_search_stream_cache is not None:
+            # Leaving the result flow: nothing will show the rest of the search, so stop it
+            stream = self.last_search_stream_cache
+            if not stream.done:
+                stream.cancel()
+            if stream.latest is not None:
+                self.last_search_results_cache = stream.latest
+            self.last_search_stream_cache = None
+
         for widget in self.content_frame.winfo_children():
             widget.destroy()
 
@@ -96,30 +108,37 @@ class VitaeLangXWindow:
                 self.last_search_results_cache = current_page_args["search_results"]
             elif self.last_search_results_cache is not None:
                 current_page_args["search_results"] = self.last_search_results_cache
+
+            if current_page_args.get("search_stream") is not None:
+                if self.last_search_stream_cache not in (None, current_page_args["search_stream"]):
+                    self.last_search_stream_cache.cancel()
+                self.last_search_stream_cache = current_page_args["search_stream"]
+            elif self.last_search_stream_cache is not None:
+                current_page_args["search_stream"] = self.last_search_stream_cache
         if page_name == "home":
-            self.current_page = HomePage(
+            self.current_page = pages.HomePage(
                 self.content_frame, self.navigate_to_page)
         elif page_name == "about":
-            self.current_page = AboutPage(
+            self.current_page = pages.AboutPage(
                 self.content_frame, self.navigate_to_page)
         elif page_name == "creator":
-            self.current_page = CreatorPage(
+            self.current_page = pages.CreatorPage(
                 self.content_frame, self.navigate_to_page)
         elif page_name == "opening":
-            self.current_page = OpeningPage(
-                self.content_frame, self.navigate_to_page)
+            self.current_page = pages.OpeningPage(
+                self.content_frame, self.navigate_to_page, self.backend_manager)
         elif page_name == "search":
-            self.current_page = SearchPage(**current_page_args)
+            self.current_page = pages.SearchPage(**current_page_args)
         elif page_name == "result":
-            self.current_page = ResultPage(**current_page_args)
+            self.current_page = pages.ResultPage(**current_page_args)
         elif page_name == "cv":
-            self.current_page = CVPage(**current_page_args)
+            self.current_page = pages.CVPage(**current_page_args)
         elif page_name == "summary":
-            self.current_page = SummaryPage(**current_page_args)
+            self.current_page = pages.SummaryPage(**current_page_args)
         else:
             print(
                 f"Warning: Unknown page name '{page_name}' in navigate_to_page.")
-            self.current_page = HomePage(
+            self.current_page = pages.HomePage(
                 self.content_frame, self.navigate_to_page)
             if self.sidebar.winfo_ismapped():
                 self.sidebar.set_active_page("home")
@@ -1,4 +1,13 @@
 import os
+import sys
+
+# Pass --startup-report (or set VITAELANGX_STARTUP_REPORT=1) to print where cold start time goes
+startup_timer = None
+if "--startup-report" in sys.argv or os.environ.get("VITAELANGX_STARTUP_REPORT"):
+    from backend.utils.startup_timing import StartupTimer
+    startup_timer = StartupTimer()
+    startup_timer.install_import_hook()
+
 from backend import BackendManager, Settings
 from frontend import VitaeLangXWindow
 
@@ -113,4 +122,15 @@ def main():
 
 if __name__ == "__main__":
     # main()
-    VitaeLangXWindow().run()
+    if startup_timer:
+        startup_timer.mark("imports")
+    app = VitaeLangXWindow()
+    if startup_timer:
+        startup_timer.mark("window constructed")
+
+        def report_first_frame():
+            startup_timer.mark("first frame drawn")
+            startup_timer.remove_import_hook()
+            print(startup_timer.format_report())
+        app.root.after_idle(report_first_frame)
+    app.run()
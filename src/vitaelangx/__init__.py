@@ -0,0 +1,7 @@
+"""
+Headless command line interface to the VitaeLangX backend.
+
+    python -m vitaelangx search java "spring boot" --algorithm aho-corasick
+
+Only the backend is imported, so it runs without customtkinter or a display.
+"""
@@ -0,0 +1,314 @@
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+
+from backend import Settings
+from backend.utils.query_file import load_query_file
+
+ALGORITHMS = ["kmp", "boyer-moore", "aho-corasick"]
+
+
+def _add_db_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("database")
+    group.add_argument("--db-host", default="localhost")
+    group.add_argument("--db-user", default="root")
+    group.add_argument("--db-password", default="")
+    group.add_argument("--db-name", default="ats_db")
+
+
+def _add_search_arguments(parser: argparse.ArgumentParser, algorithm: bool = True):
+    if algorithm:
+        parser.add_argument("--algorithm", "-a", default="kmp", choices=ALGORITHMS)
+    parser.add_argument("--top-n", "-n", type=int, default=Settings.TOP_N_MATCHES)
+    parser.add_argument("--threshold", "-t", type=float, default=Settings.FUZZY_THRESHOLD,
+                        help="fuzzy similarity threshold (percent)")
+    group = parser.add_argument_group("filters (resolved before any CV text is scanned)")
+    group.add_argument("--role", action="append", dest="roles", help="application role (repeatable, any matches)")
+    group.add_argument("--degree", action="append", dest="degree_levels",
+                       choices=["doctorate", "master", "bachelor", "associate", "diploma"])
+    group.add_argument("--company", action="append", dest="companies", help="worked at (repeatable, any matches)")
+    group.add_argument("--min-years", type=float, help="minimum total years of experience")
+    group.add_argument("--max-years", type=float, help="maximum total years of experience")
+
+
+def _create_manager(args):
+    # Imported here so --help works without the database driver installed
+    from backend import BackendManager
+    return BackendManager(db_host=args.db_host, db_user=args.db_user,
+                          db_password=args.db_password, db_name=args.db_name)
+
+
+def _boot(args):
+    """Connects to the database and loads every CV into memory."""
+    manager = _create_manager(args)
+    manager.db_manager.connect()
+    if not manager.db_manager.connection:
+        raise SystemExit("Could not connect to the database")
+    manager.load_cv_data_to_memory()
+    return manager
+
+
+def _load_queries(path: str) -> list[dict] | None:
+    """Reads a query file, or reports why it cannot be read and returns None."""
+    try:
+        return load_query_file(path)
+    except (OSError, ValueError) as e:
+        print(f"Invalid query file: {e}", file=sys.stderr)
+        return None
+
+
+def _filters(args) -> dict:
+    keys = ("roles", "degree_levels", "companies", "min_years", "max_years")
+    return {key: getattr(args, key) for key in keys if getattr(args, key) is not None}
+
+
+def _query_args(query: dict, args) -> dict:
+    return {
+        "keywords": query["keywords"],
+        "algorithm": query.get("algorithm", args.algorithm),
+        "top_n_matches": query.get("top_n", args.top_n),
+        "fuzzy_threshold": query.get("fuzzy_threshold", args.threshold),
+        "filters": query.get("filters", _filters(args)),
+    }
+
+
+def _print_results(response: dict, out):
+    results = response["results"]
+    if "candidates" in response:
+        print(f"{response['candidates']} CVs matched the filters", file=out)
+    print(f"{len(results)} matches  (exact {response['exact_match_time_ms']:.1f} ms, "
+          f"fuzzy {response['fuzzy_match_time_ms']:.1f} ms{', cached' if response['cached'] else ''})", file=out)
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:>3}. {result['name']}  [{os.path.basename(result['cv_path'])}]  score {result['score']:.3f}",
+              file=out)
+        if result['matched_keywords']:
+            keywords = ", ".join(f"{kw} x{count}" for kw, count in result['matched_keywords'].items())
+            print(f"     exact: {keywords}  ({result['total_occurrences']} occurrences)", file=out)
+        if result['fuzzy_keywords']:
+            keywords = ", ".join(f"{kw} {similarity:.0f}%" for kw, (similarity, _) in result['fuzzy_keywords'].items())
+            print(f"     fuzzy: {keywords}", file=out)
+
+
+def cmd_ingest(args, out) -> int:
+    manager = _create_manager(args)
+    manager.db_manager.connect()
+    if not manager.db_manager.connection:
+        print("Could not connect to the database", file=sys.stderr)
+        return 2
+    manager.db_manager.create_tables()
+    if args.seed_sql:
+        from backend import Seeder
+        from backend.encryption import VigenereCipher
+        Seeder(manager.db_manager, VigenereCipher("i-see-the-key")).seed_and_encrypt(args.seed_sql)
+
+    start = time.perf_counter()
+    manager.load_cv_data_to_memory()
+    elapsed = time.perf_counter() - start
+    stats = manager.cv_processor.stats
+    manager.shutdown_backend()
+    print(json.dumps({
+        "cvs_loaded": len(manager.cv_corpus),
+        "cvs_expected": manager.cv_corpus.expected_total,
+        "failed": stats["failed_extractions"],
+        "profiles": len(manager.cv_summaries),
+        "seconds": round(elapsed, 3),
+    }), file=out)
+    return 0 if len(manager.cv_corpus) else 1
+
+
+def cmd_search(args, out) -> int:
+    manager = _boot(args)
+    try:
+        response = manager.search_cvs(args.keywords, args.algorithm, args.top_n, args.threshold,
+                                      profile_dir=args.profile, filters=_filters(args))
+    finally:
+        manager.shutdown_backend()
+    if args.json:
+        print(json.dumps(response, default=str), file=out)
+    else:
+        _print_results(response, out)
+        if response.get("profile_dir"):
+            print(f"profile: {response['profile_dir']}", file=out)
+    return 0
+
+
+def cmd_query(args, out) -> int:
+    manager = _boot(args)
+    try:
+        response = manager.search_cvs_query(args.query, args.top_n)
+    except ValueError as e:
+        print(f"Invalid query: {e}", file=sys.stderr)
+        return 2
+    finally:
+        manager.shutdown_backend()
+    if args.json:
+        print(json.dumps(response, default=str), file=out)
+    else:
+        print(f"{response['query']}: {response['matches']} CVs matched", file=out)
+        _print_results(response, out)
+    return 0
+
+
+def cmd_batch_search(args, out) -> int:
+    queries = _load_queries(args.queries)
+    if queries is None:
+        return 2
+    if any("algorithm" in query for query in queries):
+        print("batch-search always uses Aho-Corasick; per-query 'algorithm' is ignored", file=sys.stderr)
+    manager = _boot(args)
+    output = open(args.output, "w", encoding="utf-8") if args.output else out
+    try:
+        # One shared Aho-Corasick pass for the exact stage of every query
+        try:
+            responses = manager.search_cvs_batch(
+                [dict(query, filters=query.get("filters", _filters(args))) for query in queries],
+                args.top_n, args.threshold)
+        except ValueError as e:
+            print(f"Invalid query file: {e}", file=sys.stderr)
+            return 2
+        for index, (query, response) in enumerate(zip(queries, responses)):
+            record = {"query_index": index, "query": query}
+            record.update(response)
+            output.write(json.dumps(record, default=str) + "\n")
+    finally:
+        if output is not out:
+            output.close()
+        manager.shutdown_backend()
+    return 0
+
+
+def cmd_bench(args, out) -> int:
+    if args.queries:
+        queries = _load_queries(args.queries)
+        if queries is None:
+            return 2
+    elif args.keywords:
+        queries = [{"keywords": args.keywords}]
+    else:
+        print("bench needs --queries FILE or keywords", file=sys.stderr)
+        return 2
+
+    manager = _boot(args)
+    latencies = []
+    cache_hits = 0
+    try:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for query in queries:
+                if args.cold:
+                    manager.query_cache.clear()
+                    manager.keyword_count_cache.clear()
+                query_start = time.perf_counter()
+                try:
+                    response = manager.search_cvs(**_query_args(query, args))
+                except ValueError as e:
+                    print(f"Invalid query {query}: {e}", file=sys.stderr)
+                    return 2
+                latencies.append((time.perf_counter() - query_start) * 1000)
+                cache_hits += response["cached"]
+        elapsed = time.perf_counter() - start
+    finally:
+        manager.shutdown_backend()
+
+    latencies.sort()
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    print(json.dumps({
+        "cvs": len(manager.cv_corpus),
+        "searches": len(latencies),
+        "cache_hits": cache_hits,
+        "seconds": round(elapsed, 3),
+        "searches_per_second": round(len(latencies) / elapsed, 3) if elapsed else None,
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "max_ms": round(latencies[-1], 3),
+    }), file=out)
+    return 0
+
+
+def cmd_serve(args, out) -> int:
+    from .server import SearchServer
+
+    manager = _create_manager(args)
+    # Listen right away; /health reports 503 until the corpus has finished loading
+    manager.start_background_initialization()
+    server = SearchServer(manager, host=args.host, port=args.port, workers=args.workers,
+                          max_pending=args.max_pending, request_timeout=args.timeout)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down search server...")
+    finally:
+        server.shutdown()
+        manager.shutdown_backend()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m vitaelangx",
+                                     description="Headless CV search over the VitaeLangX database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser("ingest", help="create tables, optionally seed, and extract every CV")
+    ingest.add_argument("--seed-sql", help="SQL seed file to load first (e.g. ../seeds/tubes3_seeding.sql)")
+    _add_db_arguments(ingest)
+    ingest.set_defaults(handler=cmd_ingest)
+
+    search = subparsers.add_parser("search", help="run one search")
+    search.add_argument("keywords", nargs="+")
+    _add_search_arguments(search)
+    search.add_argument("--json", action="store_true", help="print the raw response as JSON")
+    search.add_argument("--profile", metavar="DIR",
+                        help="capture cProfile/tracemalloc/spans for this search under DIR")
+    _add_db_arguments(search)
+    search.set_defaults(handler=cmd_search)
+
+    query = subparsers.add_parser("query", help="run one boolean query against the inverted index")
+    query.add_argument("query", help='e.g. \'"spring boot" AND (java OR kotlin) NOT role:sales\'')
+    query.add_argument("--top-n", "-n", type=int, default=Settings.TOP_N_MATCHES)
+    query.add_argument("--json", action="store_true", help="print the raw response as JSON")
+    _add_db_arguments(query)
+    query.set_defaults(handler=cmd_query)
+
+    batch = subparsers.add_parser(
+        "batch-search", help="run every query of a file in one corpus pass, JSON lines out",
+        description="Runs every query of a file with one shared Aho-Corasick pass over the corpus. "
+                    "The exact stage always uses Aho-Corasick, so there is no --algorithm and "
+                    "per-query 'algorithm' keys are ignored.")
+    batch.add_argument("queries", help="one query per line: JSON object or comma-separated keywords")
+    batch.add_argument("--output", "-o", help="write JSON lines here instead of stdout")
+    _add_search_arguments(batch, algorithm=False)
+    _add_db_arguments(batch)
+    batch.set_defaults(handler=cmd_batch_search)
+
+    bench = subparsers.add_parser("bench", help="measure search throughput and latency")
+    bench.add_argument("keywords", nargs="*")
+    bench.add_argument("--queries", help="query file (same format as batch-search)")
+    bench.add_argument("--repeat", "-r", type=int, default=1)
+    bench.add_argument("--cold", action="store_true", help="clear the result caches before every search")
+    _add_search_arguments(bench)
+    _add_db_arguments(bench)
+    bench.set_defaults(handler=cmd_bench)
+
+    serve = subparsers.add_parser("serve", help="serve searches over local HTTP/JSON")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", "-p", type=int, default=8765)
+    serve.add_argument("--workers", "-w", type=int, default=4, help="search worker threads")
+    serve.add_argument("--max-pending", type=int, default=64,
+                       help="queued plus running searches before requests get 503")
+    serve.add_argument("--timeout", type=float, default=30.0, help="per-search timeout in seconds")
+    _add_db_arguments(serve)
+    serve.set_defaults(handler=cmd_serve)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    out = sys.stdout
+    # Backend progress output goes to stderr so stdout carries only results
+    with contextlib.redirect_stdout(sys.stderr):
+        return args.handler(args, out)
@@ -0,0 +1,244 @@
+import json
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from backend import Settings
+from backend.telemetry import telemetry, to_json, to_prometheus
+
+
+class SearchServer:
+    """
+    Local HTTP/JSON front end for one warm BackendManager.
+
+    Connections are accepted by a ThreadingHTTPServer; the searches themselves
+    run on a fixed pool of `workers` threads so the number of concurrent scans
+    stays bounded. At most `max_pending` searches may be queued or running;
+    beyond that requests are rejected with 503 instead of piling up.
+
+    Endpoints:
+        GET  /health                 loading phase and corpus size (503 until ready)
+        GET  /metrics[?format=json]  telemetry counters and span histograms
+        GET  /search?q=java,sql&algorithm=kmp&top_n=10&fuzzy_threshold=80&role=engineer&min_years=3
+        POST /search                 {"keywords": [...], "algorithm": ..., "top_n": ..., "fuzzy_threshold": ...,
+                                      "filters": {"roles": [...], "degree_levels": [...], "min_years": ...}}
+        POST /search/batch           {"queries": [{"keywords": [...], "filters": {...}}, ...], "top_n": ..., ...}
+        GET  /query?q="spring boot" AND java NOT role:sales&top_n=10
+        POST /query                  {"query": "...", "top_n": ...}
+    """
+
+    def __init__(self, manager, host: str = "127.0.0.1", port: int = 8765, workers: int = 4,
+                 max_pending: int = 64, request_timeout: float = 30.0):
+        self.manager = manager
+        self.workers = workers
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search-worker")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        # The metrics endpoint serves the telemetry registry, so it has to be recording
+        telemetry.enable()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.httpd.server_address[:2]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(SearchRequestHandler):
+            search_server = server
+        return Handler
+
+    def run_search(self, func, *args, **kwargs):
+        """
+        Runs func on the worker pool and waits for it. Returns (status, payload).
+        The search is cancelled if it does not finish within request_timeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            telemetry.increment("server.rejected")
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "server busy, retry later"}
+
+        cancel_event = threading.Event()
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(func, *args, cancel_event=cancel_event, **kwargs)
+            try:
+                return HTTPStatus.OK, future.result(timeout=self.request_timeout)
+            except FutureTimeoutError:
+                cancel_event.set()
+                telemetry.increment("server.timeouts")
+                return HTTPStatus.GATEWAY_TIMEOUT, {"error": f"search exceeded {self.request_timeout}s"}
+            except CancelledError:
+                return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "search cancelled"}
+            except ValueError as e:
+                # e.g. an unknown search filter or a malformed boolean query
+                return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+            except Exception as e:
+                print(f"Search failed: {e}")
+                telemetry.increment("server.errors")
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def health(self) -> tuple[int, dict]:
+        status = self.manager.get_loading_status()
+        status["in_flight"] = self._in_flight
+        status["workers"] = self.workers
+        ready = status["phase"] == "ready"
+        status["status"] = "ok" if ready else status["phase"]
+        return (HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE), status
+
+    def metrics_snapshot(self) -> dict:
+        snapshot = telemetry.snapshot()
+        # Gauges are reported alongside the counters so one scrape has the full picture
+        snapshot["counters"]["server.in_flight"] = self._in_flight
+        snapshot["counters"]["corpus.cvs_loaded"] = len(self.manager.cv_corpus)
+        snapshot["counters"]["cache.query_entries"] = len(self.manager.query_cache)
+        snapshot["counters"]["cache.keyword_entries"] = len(self.manager.keyword_count_cache)
+        snapshot.pop("recent_traces", None)
+        return snapshot
+
+    def serve_forever(self):
+        host, port = self.address
+        print(f"VitaeLangX search server listening on http://{host}:{port} ({self.workers} workers)")
+        self.httpd.serve_forever()
+
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    search_server: SearchServer = None
+    server_version = "VitaeLangX"
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self._send_body(status, body, "application/json")
+
+    def _send_body(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict | None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _search(self, query: dict):
+        keywords = query.get("keywords")
+        if isinstance(keywords, str):
+            keywords = [kw.strip() for kw in keywords.split(",")]
+        if (not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords)
+                or not any(kw.strip() for kw in keywords)):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'keywords' must be a non-empty list of strings"})
+            return
+        try:
+            top_n = int(query.get("top_n", Settings.TOP_N_MATCHES))
+            fuzzy_threshold = float(query.get("fuzzy_threshold", Settings.FUZZY_THRESHOLD))
+        except (TypeError, ValueError):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'top_n' and 'fuzzy_threshold' must be numbers"})
+            return
+        filters = query.get("filters")
+        if filters is not None and not isinstance(filters, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'filters' must be an object"})
+            return
+        status, payload = self.search_server.run_search(
+            self.search_server.manager.search_cvs, keywords, query.get("algorithm", "kmp"),
+            top_n, fuzzy_threshold, filters=filters)
+        self._send_json(status, payload)
+
+    def _query(self, body: dict):
+        query = body.get("query")
+        if not isinstance(query, str) or not query.strip():
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'query' must be a non-empty string"})
+            return
+        try:
+            top_n = int(body.get("top_n", Settings.TOP_N_MATCHES))
+        except (TypeError, ValueError):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'top_n' must be a number"})
+            return
+        status, payload = self.search_server.run_search(
+            self.search_server.manager.search_cvs_query, query, top_n)
+        self._send_json(status, payload)
+
+    def _search_batch(self, body: dict):
+        queries = body.get("queries")
+        if not isinstance(queries, list) or not all(isinstance(q, dict) for q in queries):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'queries' must be a list of {\"keywords\": [...]}"})
+            return
+        # Comma-separated keywords are accepted per query, as on /search
+        queries = [dict(q, keywords=[kw.strip() for kw in q["keywords"].split(",")])
+                   if isinstance(q.get("keywords"), str) else q for q in queries]
+        if not all(q.get("keywords") and isinstance(q["keywords"], list) for q in queries):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "every query needs a non-empty 'keywords' list"})
+            return
+        try:
+            top_n = int(body.get("top_n", Settings.TOP_N_MATCHES))
+            fuzzy_threshold = float(body.get("fuzzy_threshold", Settings.FUZZY_THRESHOLD))
+        except (TypeError, ValueError):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "'top_n' and 'fuzzy_threshold' must be numbers"})
+            return
+        # Per-query values are checked by search_cvs_batch, whose ValueError becomes a 400
+        status, payload = self.search_server.run_search(
+            self.search_server.manager.search_cvs_batch, queries, top_n, fuzzy_threshold)
+        self._send_json(status, {"responses": payload} if status == HTTPStatus.OK else payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path == "/health":
+            self._send_json(*self.search_server.health())
+        elif url.path == "/metrics":
+            snapshot = self.search_server.metrics_snapshot()
+            if params.get("format") == "json":
+                self._send_body(HTTPStatus.OK, to_json(snapshot).encode("utf-8"), "application/json")
+            else:
+                self._send_body(HTTPStatus.OK, to_prometheus(snapshot).encode("utf-8"),
+                                "text/plain; version=0.0.4")
+        elif url.path == "/search":
+            filters = {key: params[param] for param, key in (
+                ("role", "roles"), ("degree", "degree_levels"), ("company", "companies"),
+                ("min_years", "min_years"), ("max_years", "max_years")) if param in params}
+            self._search({"keywords": params.get("q", ""), "algorithm": params.get("algorithm", "kmp"),
+                          "top_n": params.get("top_n", Settings.TOP_N_MATCHES),
+                          "fuzzy_threshold": params.get("fuzzy_threshold", Settings.FUZZY_THRESHOLD),
+                          "filters": filters})
+        elif url.path == "/query":
+            self._query({"query": params.get("q", ""), "top_n": params.get("top_n", Settings.TOP_N_MATCHES)})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"unknown path {url.path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._read_json()
+        if body is None:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "request body must be a JSON object"})
+        elif url.path == "/search":
+            self._search(body)
+        elif url.path == "/search/batch":
+            self._search_batch(body)
+        elif url.path == "/query":
+            self._query(body)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"unknown path {url.path}"})
+
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} - {format % args}")